@@ -0,0 +1,39 @@
+"""create positions table
+
+Revision ID: 2026_10_19_0004
+Revises: 0584a224ff76
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0004'
+down_revision = '0584a224ff76'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('positions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('account_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('symbol_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('qty', sa.Numeric(precision=28, scale=10), nullable=False, server_default=sa.text('0')),
+        sa.Column('avg_price', sa.Numeric(precision=28, scale=10), nullable=False, server_default=sa.text('0')),
+        sa.Column('realized_pnl', sa.Numeric(precision=28, scale=10), nullable=False, server_default=sa.text('0')),
+        sa.Column('mark_price', sa.Numeric(precision=28, scale=10), nullable=True),
+        sa.Column('unrealized_pnl', sa.Numeric(precision=28, scale=10), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('account_id', 'symbol_id', name='uq_positions_account_symbol'),
+    )
+    op.create_index('ix_positions_symbol', 'positions', ['symbol_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_positions_symbol', table_name='positions')
+    op.drop_table('positions')
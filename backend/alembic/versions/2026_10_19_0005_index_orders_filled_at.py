@@ -0,0 +1,23 @@
+"""index orders by filled_at
+
+Revision ID: 2026_10_19_0005
+Revises: 2026_10_19_0004
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0005'
+down_revision = '2026_10_19_0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Risk engine warm-up reads only today's fills
+    op.create_index('ix_orders_filled_at', 'orders', ['filled_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_filled_at', table_name='orders')
@@ -0,0 +1,34 @@
+"""treat null accounts as equal in the positions unique key
+
+Revision ID: 2026_10_19_0006
+Revises: 2026_10_19_0005
+Create Date: 2026-10-19 12:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0006'
+down_revision = '2026_10_19_0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows duplicated by concurrent first fills; positions are derived data,
+    # run `python -m app.scripts.rebuild_positions` after upgrading
+    op.execute(
+        "DELETE FROM positions p USING positions q "
+        "WHERE p.account_id IS NULL AND q.account_id IS NULL "
+        "AND p.symbol_id = q.symbol_id AND p.id > q.id"
+    )
+    op.drop_constraint('uq_positions_account_symbol', 'positions', type_='unique')
+    op.create_unique_constraint(
+        'uq_positions_account_symbol', 'positions', ['account_id', 'symbol_id'],
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_positions_account_symbol', 'positions', type_='unique')
+    op.create_unique_constraint('uq_positions_account_symbol', 'positions', ['account_id', 'symbol_id'])
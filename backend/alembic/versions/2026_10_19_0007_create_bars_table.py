@@ -0,0 +1,35 @@
+"""create bars table
+
+Revision ID: 2026_10_19_0007
+Revises: 2026_10_19_0006
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0007'
+down_revision = '2026_10_19_0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('bars',
+        sa.Column('symbol_id', sa.Integer(), nullable=False),
+        sa.Column('timeframe', sa.String(length=8), nullable=False),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('open', sa.Double(), nullable=False),
+        sa.Column('high', sa.Double(), nullable=False),
+        sa.Column('low', sa.Double(), nullable=False),
+        sa.Column('close', sa.Double(), nullable=False),
+        sa.Column('volume', sa.Double(), nullable=False),
+        sa.Column('provider', sa.String(length=32), nullable=False),
+        sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('symbol_id', 'timeframe', 'ts'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('bars')
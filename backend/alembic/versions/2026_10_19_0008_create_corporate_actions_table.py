@@ -0,0 +1,35 @@
+"""create corporate_actions table
+
+Revision ID: 2026_10_19_0008
+Revises: 2026_10_19_0007
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0008'
+down_revision = '2026_10_19_0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('corporate_actions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('symbol_id', sa.Integer(), nullable=False),
+        sa.Column('ts', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('type', sa.String(length=16), nullable=False),
+        sa.Column('ratio', sa.Double(), nullable=True),
+        sa.Column('cash', sa.Double(), nullable=True),
+        sa.Column('factor', sa.Double(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('symbol_id', 'ts', 'type', name='uq_corporate_actions_symbol_ts_type'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('corporate_actions')
@@ -0,0 +1,37 @@
+"""create data_quality_issues table
+
+Revision ID: 2026_10_19_0009
+Revises: 2026_10_19_0008
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0009'
+down_revision = '2026_10_19_0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('data_quality_issues',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('symbol_id', sa.Integer(), nullable=False),
+        sa.Column('timeframe', sa.String(length=8), nullable=False),
+        sa.Column('kind', sa.String(length=16), nullable=False),
+        sa.Column('start_ts', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('end_ts', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('detail', sa.String(length=255), nullable=False),
+        sa.Column('detected_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_data_quality_issues_symbol_tf_start', 'data_quality_issues', ['symbol_id', 'timeframe', 'start_ts'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_data_quality_issues_symbol_tf_start', table_name='data_quality_issues')
+    op.drop_table('data_quality_issues')
@@ -0,0 +1,47 @@
+"""create universe_snapshots and universe_members tables
+
+Revision ID: 2026_10_19_0010
+Revises: 2026_10_19_0009
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2026_10_19_0010'
+down_revision = '2026_10_19_0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('universe_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=32), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('top_n', sa.Integer(), nullable=False),
+        sa.Column('lookback_days', sa.Integer(), nullable=False),
+        sa.Column('min_price', sa.Double(), nullable=False),
+        sa.Column('min_adv', sa.Double(), nullable=False),
+        sa.Column('min_coverage', sa.Double(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name', 'version', name='uq_universe_snapshots_name_version'),
+    )
+    op.create_table('universe_members',
+        sa.Column('snapshot_id', sa.Integer(), nullable=False),
+        sa.Column('symbol_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('adv', sa.Double(), nullable=False),
+        sa.Column('price', sa.Double(), nullable=False),
+        sa.ForeignKeyConstraint(['snapshot_id'], ['universe_snapshots.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['symbol_id'], ['symbols.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('snapshot_id', 'symbol_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('universe_members')
+    op.drop_table('universe_snapshots')
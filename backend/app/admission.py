@@ -0,0 +1,75 @@
+from __future__ import annotations
+import asyncio
+import json
+import os
+
+from app.db import DB_MAX_OVERFLOW, DB_POOL_SIZE, POOLED
+
+# Paths that never touch the session pool and must answer under overload
+EXEMPT_PREFIXES = ("/health", "/metrics", "/debug", "/docs", "/redoc", "/openapi.json")
+
+
+class AdmissionMiddleware:
+    """
+    Cap concurrent requests at the database pool's capacity.
+
+    Sync routes hold a pooled connection from their first query until the
+    get_db teardown, and between the two FastAPI validates the response in
+    the threadpool. With more requests in flight than connections, every
+    threadpool worker can end up blocked on pool checkout while the
+    connections belong to requests waiting for a worker to finish: the
+    server stalls until pool_timeout. Queueing excess requests here, on the
+    event loop, keeps the pool from ever being oversubscribed; requests
+    that wait longer than `queue_timeout` get 503 with Retry-After.
+
+    The default limit is the pool's size plus overflow. In-memory SQLite has
+    no pool, so there the middleware passes everything through unless
+    MAX_CONCURRENT_REQUESTS is set; a limit of 0 disables it.
+    """
+
+    def __init__(self, app, limit: int | None = None, queue_timeout: float | None = None):
+        self.app = app
+        default = DB_POOL_SIZE + DB_MAX_OVERFLOW if POOLED else 0
+        self.limit = limit if limit is not None else int(os.getenv("MAX_CONCURRENT_REQUESTS", str(default)))
+        self.queue_timeout = queue_timeout if queue_timeout is not None else float(
+            os.getenv("ADMISSION_QUEUE_TIMEOUT", "10")
+        )
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # A semaphore binds to the first loop it waits on; tests run one loop per case
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._slots, self._loop = asyncio.Semaphore(self.limit), loop
+        return self._slots
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.limit <= 0 or scope["path"].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        slots = self._semaphore()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            await _busy(send, self.queue_timeout)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            slots.release()
+
+
+async def _busy(send, retry_after: float) -> None:
+    body = json.dumps({"detail": "Server busy, retry later"}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(int(retry_after), 1)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
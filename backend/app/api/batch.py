@@ -0,0 +1,39 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Sequence, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+from app.api.serialization import FastJSONResponse, rows_to_dicts
+from app.schemas.common import MAX_BATCH_IDS
+
+
+def parse_ids(values: Iterable[str], cast: Callable[[str], Any]) -> list[Any]:
+    """
+    Parse ids from repeated and/or comma-separated query values.
+
+    `?ids=a,b&ids=c` yields [a, b, c]. Unparseable ids are a 422.
+    """
+    raw = [part.strip() for value in values for part in value.split(",") if part.strip()]
+    if not raw:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="At least one id is required")
+    if len(raw) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {MAX_BATCH_IDS} ids per request",
+        )
+    ids = []
+    for part in raw:
+        try:
+            ids.append(cast(part))
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Invalid id: {part}")
+    return ids
+
+
+def batch_response(found: Sequence[Any], missing: Sequence[Any], schema: Type[BaseModel]) -> FastJSONResponse:
+    """Serialize a batch multi-get result with the orjson page serializer."""
+    return FastJSONResponse({
+        "items": rows_to_dicts(found, list(schema.model_fields)),
+        "missing": list(missing),
+    })
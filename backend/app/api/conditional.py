@@ -0,0 +1,69 @@
+from __future__ import annotations
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def _utc(ts: datetime) -> datetime:
+    # SQLite hands back naive timestamps; they are stored as UTC
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def entity_validators(entity: Any) -> tuple[str, datetime]:
+    """ETag and Last-Modified for a single entity, derived from updated_at."""
+    updated = _utc(entity.updated_at)
+    return f'W/"{entity.id}-{updated.timestamp():.6f}"', updated
+
+
+def list_validators(request: Request, total: int, max_updated: datetime | None) -> tuple[str, datetime | None]:
+    """
+    ETag and Last-Modified for a list page.
+
+    The fingerprint is the filtered row count plus max(updated_at) of the
+    filtered set, keyed by path and normalized query string. Any insert,
+    delete or update of a matching row changes it, except an update whose
+    timestamp does not exceed the current maximum.
+    """
+    updated = _utc(max_updated) if max_updated is not None else None
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    key = f"{request.url.path}?{params}|{total}|{updated.isoformat() if updated else ''}"
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"', updated
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """Evaluate If-None-Match (takes precedence) and If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/ prefixes are ignored
+        wanted = etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == wanted for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def set_validators(response: Response, etag: str, last_modified: datetime | None) -> None:
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    # Cache, but always revalidate
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def not_modified(etag: str, last_modified: datetime | None) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
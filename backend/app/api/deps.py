@@ -1,4 +1,6 @@
+import os
 from typing import Generator
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from app.db import SessionLocal
 
@@ -8,3 +10,15 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+def debug_endpoints_enabled() -> bool:
+    """Debug routes are on when DEBUG_ENDPOINTS is set, or ENV is a non-production one."""
+    flag = os.getenv("DEBUG_ENDPOINTS")
+    if flag is not None:
+        return flag.lower() in ("1", "true", "yes")
+    return os.getenv("ENV", "").lower() in ("dev", "development", "local", "test")
+
+def require_debug_endpoints() -> None:
+    """Hide /debug routes unless debug endpoints are enabled."""
+    if not debug_endpoints_enabled():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import Any, Type
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.api.conditional import list_validators, is_not_modified, not_modified, set_validators
+from app.api.serialization import page_response
+from app.coalesce import read_coalescer
+
+
+def list_response(request: Request, repo: Any, q: BaseModel, schema: Type[BaseModel]) -> Response:
+    """
+    Build a conditional list response with coalesced database reads.
+
+    Identical concurrent queries (same normalized query model) share one
+    fingerprint query and one page query + serialization. The page query is
+    skipped entirely when the client's validators still match.
+    """
+    namespace = repo.model.__tablename__
+    key = q.model_dump_json()
+
+    total, max_updated = read_coalescer.do(namespace, ("fingerprint", key), lambda: repo.fingerprint(q))
+    etag, last_modified = list_validators(request, total, max_updated)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    body = read_coalescer.do(
+        namespace,
+        ("page", key, total, max_updated),
+        lambda: page_response(
+            repo.list_page(q), schema, total, q.limit, q.offset, fields=getattr(q, "fields", None)
+        ).body,
+    )
+    response = Response(body, media_type="application/json")
+    set_validators(response, etag, last_modified)
+    return response
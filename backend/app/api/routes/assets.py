@@ -1,15 +1,22 @@
 from __future__ import annotations
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.batch import batch_response, parse_ids
+from app.api.conditional import entity_validators, is_not_modified, not_modified, set_validators
+from app.api.listing import list_response
+from app.api.serialization import FastJSONResponse, parse_fields
+from app.schemas.common import Page, BatchGet, BatchResult
 from app.schemas.asset import AssetCreate, AssetRead, AssetUpdate, AssetQuery
 from app.repositories.asset_repo import AssetRepository
+from app.observability.query_budget import query_budget
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
 @router.post("", response_model=AssetRead, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 def create_asset(payload: AssetCreate, db: Session = Depends(get_db)):
     """Create a new asset."""
     repo = AssetRepository(db)
@@ -18,8 +25,10 @@ def create_asset(payload: AssetCreate, db: Session = Depends(get_db)):
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
-@router.get("", response_model=dict)
+@router.get("", response_model=Page[AssetRead], response_class=FastJSONResponse)
+@query_budget(2)
 def list_assets(
+    request: Request,
     symbol: str | None = None,
     exchange: str | None = None,
     asset_type: str | None = None,
@@ -29,6 +38,7 @@ def list_assets(
     offset: int = Query(0, ge=0),
     order_by: str = Query("symbol", pattern="^(created_at|updated_at|symbol|exchange|asset_type|name)$"),
     order_dir: str = Query("asc", pattern="^(asc|desc)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
     db: Session = Depends(get_db),
 ):
     """
@@ -38,6 +48,7 @@ def list_assets(
     Search performs case-insensitive matching on symbol and name fields.
     """
     repo = AssetRepository(db)
+    selected = parse_fields(fields, AssetRead)
     q = AssetQuery(
         symbol=symbol,
         exchange=exchange,
@@ -48,17 +59,37 @@ def list_assets(
         offset=offset,
         order_by=order_by,
         order_dir=order_dir,
+        fields=selected,
     )
-    rows, total = repo.list_and_count(q)
-    return {
-        "items": [AssetRead.model_validate(row) for row in rows],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return list_response(request, repo, q, AssetRead)
+
+@router.get("/batch", response_model=BatchResult[AssetRead, UUID], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_assets(
+    ids: list[str] = Query(..., description="Asset IDs, repeated or comma-separated"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get several assets by ID in one query.
+    
+    Items are returned in request order; unknown ids are listed in
+    `missing` instead of failing the whole request.
+    """
+    repo = AssetRepository(db)
+    found, missing = repo.get_many(parse_ids(ids, UUID))
+    return batch_response(found, missing, AssetRead)
+
+@router.post("/batch", response_model=BatchResult[AssetRead, UUID], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_assets_post(payload: BatchGet[UUID], db: Session = Depends(get_db)):
+    """Get several assets by ID (POST form for long id lists)."""
+    repo = AssetRepository(db)
+    found, missing = repo.get_many(payload.ids)
+    return batch_response(found, missing, AssetRead)
 
 @router.get("/{asset_id}", response_model=AssetRead)
-def get_asset(asset_id: str, db: Session = Depends(get_db)):
+@query_budget(1)
+def get_asset(asset_id: str, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a single asset by ID."""
     repo = AssetRepository(db)
     try:
@@ -70,9 +101,14 @@ def get_asset(asset_id: str, db: Session = Depends(get_db)):
     entity = repo.get(uuid_obj)
     if not entity:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found")
+    etag, last_modified = entity_validators(entity)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return entity
 
 @router.patch("/{asset_id}", response_model=AssetRead)
+@query_budget(3)
 def update_asset(asset_id: str, patch: AssetUpdate, db: Session = Depends(get_db)):
     """Update an asset (partial update)."""
     repo = AssetRepository(db)
@@ -91,6 +127,7 @@ def update_asset(asset_id: str, patch: AssetUpdate, db: Session = Depends(get_db
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 @router.delete("/{asset_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(2)
 def delete_asset(asset_id: str, db: Session = Depends(get_db)):
     """Delete an asset."""
     repo = AssetRepository(db)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+import io
+from typing import Literal
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.marketdata.ingest import DEFAULT_CHUNK_SIZE, BarIngestor, iter_csv, iter_parquet
+from app.schemas.bar import BarIngestResult
+from app.observability.query_budget import query_budget
+
+router = APIRouter(prefix="/bars", tags=["bars"])
+
+
+@router.post("/ingest", response_model=BarIngestResult)
+@query_budget(None)
+def ingest_bars(
+    file: UploadFile = File(..., description="CSV or Parquet file of bars"),
+    timeframe: Literal["1m", "1d"] = Form("1m"),
+    provider: str = Form("upload", max_length=32),
+    format: Literal["csv", "parquet"] | None = Form(None, description="Defaults to the file extension"),
+    chunk_size: int = Form(DEFAULT_CHUNK_SIZE, ge=1, le=1_000_000),
+    scan: bool = Form(True, description="Run the data-quality scanner over the ingested ranges"),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk-load OHLCV bars, upserting on (symbol_id, timeframe, ts).
+
+    - **file**: columns `symbol` (ticker) or `symbol_id`, `ts`, open, high, low, close, volume
+    - **timeframe**: `1m` or `1d`
+    - **provider**: data source recorded on each bar
+    - **format**: `csv` or `parquet` (Parquet needs pyarrow on the server)
+    - **chunk_size**: rows per COPY and transaction
+    - **scan**: record gaps, bad prints and spikes in the uploaded ranges; counted in `issues`
+
+    Rows for unknown symbols are skipped and listed in `unknown_symbols`.
+    A malformed row is a 422; chunks before it stay committed.
+    """
+    fmt = format or ("parquet" if (file.filename or "").endswith(".parquet") else "csv")
+    if fmt == "csv":
+        chunks = iter_csv(io.TextIOWrapper(file.file, encoding="utf-8", newline=""), chunk_size)
+    else:
+        chunks = iter_parquet(file.file, chunk_size)
+    try:
+        result = BarIngestor(db, timeframe, provider, scan).ingest(chunks)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    return BarIngestResult.model_validate(result)
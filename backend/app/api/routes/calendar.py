@@ -0,0 +1,86 @@
+from __future__ import annotations
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.marketdata.calendar import TradingCalendar, get_calendar
+from app.schemas.calendar import CalendarRead, MarketClock, SessionRead
+from app.observability.query_budget import query_budget
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+MAX_RANGE_DAYS = 3660
+
+
+def _calendar(exchange: str) -> TradingCalendar:
+    try:
+        return get_calendar(exchange)
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e.args[0]))
+
+
+def _utc(seconds) -> datetime:
+    return datetime.fromtimestamp(int(seconds), timezone.utc)
+
+
+@router.get("", response_model=CalendarRead)
+@query_budget(0)
+def get_sessions(
+    exchange: str = Query("NYSE", description="Exchange name or MIC, e.g. NYSE, NASDAQ, XNYS, CRYPTO"),
+    start: date | None = Query(None, description="First session date (default: today)"),
+    end: date | None = Query(None, description="Last session date (default: start + 30 days)"),
+):
+    """
+    Trading sessions of an exchange between two dates, inclusive.
+
+    - **exchange**: `Asset.exchange` value; US equity venues share the NYSE calendar
+    - **start** / **end**: session dates in exchange local time, at most ten years apart
+
+    Holidays are absent; early closes are flagged.
+    """
+    calendar = _calendar(exchange)
+    start = start or datetime.now(calendar.tz).date()
+    end = end or start + timedelta(days=30)
+    if end < start or (end - start).days > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"end must be on or after start and within {MAX_RANGE_DAYS} days",
+        )
+    return CalendarRead(
+        exchange=calendar.name,
+        timezone=calendar.tz.key,
+        sessions=[SessionRead(**vars(s)) for s in calendar.sessions(start, end)],
+    )
+
+
+@router.get("/clock", response_model=MarketClock)
+@query_budget(0)
+def get_clock(
+    exchange: str = Query("NYSE", description="Exchange name or MIC"),
+    at: datetime | None = Query(None, description="Instant to evaluate (default: now)"),
+):
+    """
+    Whether an exchange is in session at an instant, and its next open and close.
+
+    - **exchange**: exchange name or MIC
+    - **at**: ISO 8601 timestamp; naive values are UTC
+    """
+    calendar = _calendar(exchange)
+    at = at or datetime.now(timezone.utc)
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    session = None
+    if calendar.is_open(at):
+        i = int(calendar.session_index(at))
+        session = SessionRead(
+            date=calendar.dates[i].astype(date), open=_utc(calendar.opens[i]), close=_utc(calendar.closes[i]),
+            early_close=bool(calendar.early[i]),
+        )
+    return MarketClock(
+        exchange=calendar.name,
+        at=at,
+        is_open=session is not None,
+        session=session,
+        next_open=_utc(calendar.next_open(at)),
+        next_close=_utc(calendar.next_close(at)),
+    )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.marketdata.calendar import get_calendar
+from app.marketdata.quality import stale_since
+from app.marketdata.resample import DEFAULT_EXCHANGE
+from app.repositories.data_quality_repo import DataQualityRepository
+from app.schemas.data_quality import DataQualityIssueRead, DataQualitySummary, IssueCounts, StaleFeed, SymbolQuality
+from app.observability.query_budget import query_budget
+
+router = APIRouter(prefix="/data-quality", tags=["data-quality"])
+
+Kind = Literal["gap", "non_positive", "ohlc", "spike"]
+
+# Feeds silent for longer than this are not reported as stale, only absent
+STALE_LOOKBACK = timedelta(days=1)
+
+
+def _aware(ts: datetime) -> datetime:
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+@router.get("/summary", response_model=DataQualitySummary)
+@query_budget(2)
+def get_summary(
+    since: datetime | None = Query(None, description="Only issues starting at or after this instant"),
+    symbol_id: int | None = Query(None, description="Restrict to one symbol"),
+    stale_after: int = Query(300, ge=60, le=86400, description="Seconds without a minute bar before a feed is stale"),
+    at: datetime | None = Query(None, description="Instant to evaluate staleness at (default: now)"),
+    db: Session = Depends(get_db),
+):
+    """
+    Data-quality findings per symbol and kind, and stale minute-bar feeds.
+
+    - **since**: lower bound on issue start times
+    - **symbol_id**: one symbol only
+    - **stale_after**: a feed is stale when its newest minute bar closed longer ago than this
+      while the exchange is in session; feeds silent for over a day are not listed
+    - **at**: ISO 8601 timestamp; naive values are UTC
+    """
+    at = _aware(at or datetime.now(timezone.utc))
+    if since is not None:
+        since = _aware(since)
+    repo = DataQualityRepository(db)
+    symbols: dict[int, dict[str, IssueCounts]] = {}
+    for sid, kind, issues, bars, last_start in repo.summary(since, symbol_id):
+        symbols.setdefault(sid, {})[kind] = IssueCounts(issues=issues, bars=bars, last_start=_aware(last_start))
+    stale = stale_since(
+        repo.last_bars("1m", at - STALE_LOOKBACK, symbol_id), at,
+        get_calendar(DEFAULT_EXCHANGE), timedelta(seconds=stale_after),
+    )
+    return DataQualitySummary(
+        since=since,
+        at=at,
+        symbols=[SymbolQuality(symbol_id=sid, kinds=kinds) for sid, kinds in symbols.items()],
+        stale=[StaleFeed(symbol_id=sid, last_bar_close=ts) for sid, ts in sorted(stale.items())],
+    )
+
+
+@router.get("/issues", response_model=list[DataQualityIssueRead])
+@query_budget(1)
+def list_issues(
+    symbol_id: int | None = Query(None),
+    kind: Kind | None = Query(None),
+    since: datetime | None = Query(None, description="Only issues starting at or after this instant"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """
+    Recorded data-quality issues, most recent first.
+
+    - **symbol_id**: one symbol only
+    - **kind**: `gap`, `non_positive`, `ohlc` or `spike`
+    - **since**: lower bound on issue start times
+    """
+    return DataQualityRepository(db).list_issues(symbol_id, kind, since and _aware(since), limit)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import require_debug_endpoints
+from app.observability.memory import DEFAULT_TRACKED_TYPES, memory_tracker
+from app.observability.profiling import profiles
+from app.observability.slow_queries import slow_query_log
+
+router = APIRouter(prefix="/debug", tags=["debug"], dependencies=[Depends(require_debug_endpoints)])
+
+
+@router.get("/slow-queries")
+def list_slow_queries(flush: bool = False):
+    """
+    Statements slower than SLOW_QUERY_THRESHOLD_MS, slowest first.
+    
+    - **flush**: run pending EXPLAINs before answering instead of waiting for the background worker
+    """
+    if flush:
+        slow_query_log.flush()
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": slow_query_log.entries(),
+    }
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries():
+    """Empty the slow-query buffer."""
+    slow_query_log.clear()
+
+
+@router.get("/profiles")
+def list_profiles():
+    """Recent request profiles, newest first."""
+    return [p.summary() for p in profiles.list()]
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: int, format: str = Query("json", pattern="^(json|collapsed)$")):
+    """
+    One request profile.
+    
+    - **format**: `json` for the component breakdown and hottest frames,
+      `collapsed` for flamegraph-ready collapsed stacks
+    """
+    profile = profiles.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(profile.collapsed())
+    return {**profile.summary(), "components": profile.components, "top": profile.top()}
+
+
+@router.delete("/profiles", status_code=status.HTTP_204_NO_CONTENT)
+def clear_profiles():
+    """Empty the profile buffer."""
+    profiles.clear()
+
+
+@router.get("/memory")
+def memory_status(types: str = Query(",".join(DEFAULT_TRACKED_TYPES), description="Comma-separated class names to count")):
+    """
+    Traced and RSS memory, per-route request peaks and live object counts.
+    
+    - **types**: class names whose live instances are counted (walks the heap)
+    """
+    names = [t.strip() for t in types.split(",") if t.strip()]
+    return memory_tracker.status(names)
+
+
+@router.post("/memory/start")
+def start_memory_tracing(frames: int = Query(10, ge=1, le=100)):
+    """
+    Start tracemalloc.
+    
+    - **frames**: traceback depth kept per allocation
+    """
+    memory_tracker.start(frames)
+    return {"tracing": memory_tracker.tracing}
+
+
+@router.post("/memory/stop")
+def stop_memory_tracing():
+    """Stop tracemalloc and drop snapshots and peaks."""
+    memory_tracker.stop()
+    return {"tracing": memory_tracker.tracing}
+
+
+@router.post("/memory/snapshots", status_code=status.HTTP_201_CREATED)
+def take_memory_snapshot():
+    """Take a tracemalloc snapshot to diff against later."""
+    try:
+        snapshot_id = memory_tracker.snapshot()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return {"id": snapshot_id}
+
+
+@router.get("/memory/diff")
+def memory_diff(
+    base: int = Query(..., description="Older snapshot ID"),
+    target: int | None = Query(None, description="Newer snapshot ID; a fresh snapshot when omitted"),
+    limit: int = Query(20, ge=1, le=200),
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+):
+    """
+    Top allocation sites by growth between two snapshots.
+    
+    - **base**: older snapshot
+    - **target**: newer snapshot (defaults to the heap now, without storing a snapshot)
+    - **group_by**: aggregate by line, file or full traceback
+    """
+    try:
+        sites = memory_tracker.diff(base, target, limit=limit, key_type=group_by)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Snapshot not found")
+    return {"base": base, "target": target if target is not None else "current", "sites": sites}
@@ -1,16 +1,23 @@
 from __future__ import annotations
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
-from app.schemas.order import OrderCreate, OrderRead, OrderUpdate, OrderQuery
+from app.api.batch import batch_response, parse_ids
+from app.api.conditional import entity_validators, is_not_modified, not_modified, set_validators
+from app.api.listing import list_response
+from app.api.serialization import FastJSONResponse, parse_fields
+from app.schemas.common import Page, BatchGet, BatchResult
+from app.schemas.order import OrderCreate, OrderRead, OrderUpdate, OrderQuery, OrderFill
 from app.repositories.order_repo import OrderRepository
+from app.observability.query_budget import query_budget
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
 
 @router.post("", response_model=OrderRead, status_code=status.HTTP_201_CREATED)
+@query_budget(3)
 def create_order(payload: OrderCreate, db: Session = Depends(get_db)):
     """
     Create a new order.
@@ -27,8 +34,30 @@ def create_order(payload: OrderCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
-@router.get("", response_model=dict)
+@router.post("/bulk", response_model=list[OrderRead], status_code=status.HTTP_201_CREATED)
+@query_budget(3)
+def create_orders_bulk(payload: list[OrderCreate], db: Session = Depends(get_db)):
+    """
+    Create several orders atomically.
+    
+    Pre-trade risk checks are applied cumulatively across the batch; if any
+    order is rejected, none are created.
+    """
+    if not payload:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="At least one order is required")
+    if len(payload) > 500:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="At most 500 orders per batch")
+    repo = OrderRepository(db)
+    try:
+        return repo.create_many(payload)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.get("", response_model=Page[OrderRead], response_class=FastJSONResponse)
+@query_budget(2)
 def list_orders(
+    request: Request,
     symbol_id: UUID | None = None,
     strategy_id: UUID | None = None,
     status: str | None = None,
@@ -43,6 +72,7 @@ def list_orders(
         pattern="^(created_at|updated_at|symbol_id|status|side|quantity)$"
     ),
     order_dir: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
     db: Session = Depends(get_db),
 ):
     """
@@ -59,6 +89,7 @@ def list_orders(
     - **offset**: Number of results to skip (default 0)
     - **order_by**: Field to sort by (default: created_at)
     - **order_dir**: Sort direction: asc or desc (default: desc)
+    - **fields**: Comma-separated sparse fieldset (id is always included)
     """
     repo = OrderRepository(db)
     
@@ -67,6 +98,7 @@ def list_orders(
     created_from_dt = datetime.fromisoformat(created_from) if created_from else None
     created_to_dt = datetime.fromisoformat(created_to) if created_to else None
     
+    selected = parse_fields(fields, OrderRead)
     q = OrderQuery(
         symbol_id=symbol_id,
         strategy_id=strategy_id,
@@ -79,18 +111,40 @@ def list_orders(
         offset=offset,
         order_by=order_by,
         order_dir=order_dir,
+        fields=selected,
     )
-    rows, total = repo.list_and_count(q)
-    return {
-        "items": [OrderRead.model_validate(row) for row in rows],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return list_response(request, repo, q, OrderRead)
+
+
+@router.get("/batch", response_model=BatchResult[OrderRead, UUID], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_orders(
+    ids: list[str] = Query(..., description="Order IDs, repeated or comma-separated"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get several orders by ID in one query.
+    
+    Items are returned in request order; unknown ids are listed in
+    `missing` instead of failing the whole request.
+    """
+    repo = OrderRepository(db)
+    found, missing = repo.get_many(parse_ids(ids, UUID))
+    return batch_response(found, missing, OrderRead)
+
+
+@router.post("/batch", response_model=BatchResult[OrderRead, UUID], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_orders_post(payload: BatchGet[UUID], db: Session = Depends(get_db)):
+    """Get several orders by ID (POST form for long id lists)."""
+    repo = OrderRepository(db)
+    found, missing = repo.get_many(payload.ids)
+    return batch_response(found, missing, OrderRead)
 
 
 @router.get("/{order_id}", response_model=OrderRead)
-def get_order(order_id: str, db: Session = Depends(get_db)):
+@query_budget(1)
+def get_order(order_id: str, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a single order by ID."""
     repo = OrderRepository(db)
     try:
@@ -107,10 +161,15 @@ def get_order(order_id: str, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="Order not found"
         )
+    etag, last_modified = entity_validators(entity)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return entity
 
 
 @router.patch("/{order_id}", response_model=OrderRead)
+@query_budget(3)
 def update_order(order_id: str, patch: OrderUpdate, db: Session = Depends(get_db)):
     """
     Update an order (partial update).
@@ -148,7 +207,40 @@ def update_order(order_id: str, patch: OrderUpdate, db: Session = Depends(get_db
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
+@router.post("/{order_id}/fills", response_model=OrderRead)
+# Postgres adds the ON CONFLICT insert that creates the position row
+@query_budget(7)
+def record_fill(order_id: str, fill: OrderFill, db: Session = Depends(get_db)):
+    """
+    Record an execution against an order.
+    
+    Updates filled quantity, average fill price and status, and feeds the
+    fill into the pre-trade risk state.
+    """
+    repo = OrderRepository(db)
+    try:
+        uuid_obj = UUID(order_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, 
+            detail="Invalid UUID format"
+        )
+    
+    entity = repo.get(uuid_obj)
+    if not entity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, 
+            detail="Order not found"
+        )
+    
+    try:
+        return repo.record_fill(entity, fill)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
 @router.delete("/{order_id}", response_model=OrderRead)
+@query_budget(3)
 def cancel_order(order_id: str, db: Session = Depends(get_db)):
     """
     Cancel an order (soft delete - sets status to canceled).
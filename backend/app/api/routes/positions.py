@@ -0,0 +1,84 @@
+from __future__ import annotations
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, require_debug_endpoints
+from app.api.conditional import entity_validators, is_not_modified, not_modified, set_validators
+from app.api.listing import list_response
+from app.api.serialization import FastJSONResponse, parse_fields
+from app.schemas.common import Page
+from app.schemas.position import PositionRead, PositionQuery
+from app.repositories.position_repo import PositionRepository
+from app.observability.query_budget import query_budget
+
+router = APIRouter(prefix="/positions", tags=["positions"])
+
+
+@router.get("", response_model=Page[PositionRead], response_class=FastJSONResponse)
+@query_budget(2)
+def list_positions(
+    request: Request,
+    account_id: UUID | None = None,
+    symbol_id: UUID | None = None,
+    open_only: bool = True,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    order_by: str = Query("updated_at", pattern="^(created_at|updated_at|symbol_id|qty|realized_pnl)$"),
+    order_dir: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
+    db: Session = Depends(get_db),
+):
+    """
+    List positions with filtering and pagination.
+
+    - **account_id**: Filter by account UUID
+    - **symbol_id**: Filter by symbol UUID
+    - **open_only**: Hide flat positions (default: true)
+    - **limit**: Maximum number of results (1-200, default 50)
+    - **offset**: Number of results to skip (default 0)
+    - **order_by**: Field to sort by (default: updated_at)
+    - **order_dir**: Sort direction: asc or desc (default: desc)
+    - **fields**: Comma-separated sparse fieldset (id is always included)
+    """
+    repo = PositionRepository(db)
+    selected = parse_fields(fields, PositionRead)
+    q = PositionQuery(
+        account_id=account_id,
+        symbol_id=symbol_id,
+        open_only=open_only,
+        limit=limit,
+        offset=offset,
+        order_by=order_by,
+        order_dir=order_dir,
+        fields=selected,
+    )
+    return list_response(request, repo, q, PositionRead)
+
+
+@router.post("/rebuild", response_model=dict, dependencies=[Depends(require_debug_endpoints)])
+@query_budget(2)
+def rebuild_positions(db: Session = Depends(get_db)):
+    """
+    Recompute all positions from filled orders (recovery only).
+
+    Rewrites the whole table, so it is only exposed where debug endpoints
+    are enabled; in production use `python -m app.scripts.rebuild_positions`.
+    """
+    repo = PositionRepository(db)
+    return {"positions": repo.rebuild_from_history()}
+
+
+@router.get("/{position_id}", response_model=PositionRead)
+@query_budget(1)
+def get_position(position_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    """Get a single position by ID."""
+    repo = PositionRepository(db)
+    entity = repo.get(position_id)
+    if not entity:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Position not found")
+    etag, last_modified = entity_validators(entity)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
+    return entity
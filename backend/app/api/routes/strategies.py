@@ -1,15 +1,22 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.batch import batch_response, parse_ids
+from app.api.conditional import entity_validators, is_not_modified, not_modified, set_validators
+from app.api.listing import list_response
+from app.api.serialization import FastJSONResponse, parse_fields
+from app.schemas.common import Page, BatchGet, BatchResult
 from app.schemas.strategy import StrategyCreate, StrategyRead, StrategyUpdate, StrategyQuery
 from app.repositories.strategy_repo import StrategyRepository
+from app.observability.query_budget import query_budget
 
 router = APIRouter(prefix="/strategies", tags=["strategies"])
 
 
 @router.post("", response_model=StrategyRead, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 def create_strategy(payload: StrategyCreate, db: Session = Depends(get_db)):
     """Create a new strategy."""
     repo = StrategyRepository(db)
@@ -19,8 +26,10 @@ def create_strategy(payload: StrategyCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=Page[StrategyRead], response_class=FastJSONResponse)
+@query_budget(2)
 def list_strategies(
+    request: Request,
     name: str | None = None,
     is_active: bool | None = None,
     search: str | None = None,
@@ -28,6 +37,7 @@ def list_strategies(
     offset: int = Query(0, ge=0),
     order_by: str = Query("created_at", pattern="^(created_at|updated_at|name|is_active)$"),
     order_dir: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
     db: Session = Depends(get_db),
 ):
     """
@@ -40,8 +50,10 @@ def list_strategies(
     - **offset**: Number of results to skip (default 0)
     - **order_by**: Field to sort by (default: created_at)
     - **order_dir**: Sort direction: asc or desc (default: desc)
+    - **fields**: Comma-separated sparse fieldset (id is always included)
     """
     repo = StrategyRepository(db)
+    selected = parse_fields(fields, StrategyRead)
     q = StrategyQuery(
         name=name,
         is_active=is_active,
@@ -50,27 +62,54 @@ def list_strategies(
         offset=offset,
         order_by=order_by,
         order_dir=order_dir,
+        fields=selected,
     )
-    rows, total = repo.list_and_count(q)
-    return {
-        "items": [StrategyRead.model_validate(row) for row in rows],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return list_response(request, repo, q, StrategyRead)
+
+
+@router.get("/batch", response_model=BatchResult[StrategyRead, int], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_strategies(
+    ids: list[str] = Query(..., description="Strategy IDs, repeated or comma-separated"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get several strategies by ID in one query.
+    
+    Items are returned in request order; unknown ids are listed in
+    `missing` instead of failing the whole request.
+    """
+    repo = StrategyRepository(db)
+    found, missing = repo.get_many(parse_ids(ids, int))
+    return batch_response(found, missing, StrategyRead)
+
+
+@router.post("/batch", response_model=BatchResult[StrategyRead, int], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_strategies_post(payload: BatchGet[int], db: Session = Depends(get_db)):
+    """Get several strategies by ID (POST form for long id lists)."""
+    repo = StrategyRepository(db)
+    found, missing = repo.get_many(payload.ids)
+    return batch_response(found, missing, StrategyRead)
 
 
 @router.get("/{strategy_id}", response_model=StrategyRead)
-def get_strategy(strategy_id: int, db: Session = Depends(get_db)):
+@query_budget(1)
+def get_strategy(strategy_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a single strategy by ID."""
     repo = StrategyRepository(db)
     entity = repo.get(strategy_id)
     if not entity:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Strategy not found")
+    etag, last_modified = entity_validators(entity)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return entity
 
 
 @router.patch("/{strategy_id}", response_model=StrategyRead)
+@query_budget(3)
 def update_strategy(strategy_id: int, patch: StrategyUpdate, db: Session = Depends(get_db)):
     """Update a strategy (partial update)."""
     repo = StrategyRepository(db)
@@ -84,6 +123,7 @@ def update_strategy(strategy_id: int, patch: StrategyUpdate, db: Session = Depen
 
 
 @router.delete("/{strategy_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(2)
 def delete_strategy(strategy_id: int, db: Session = Depends(get_db)):
     """Delete a strategy."""
     repo = StrategyRepository(db)
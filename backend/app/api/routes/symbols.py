@@ -1,14 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from datetime import date, datetime, timedelta, timezone
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
+from app.api.batch import batch_response, parse_ids
+from app.api.conditional import entity_validators, is_not_modified, not_modified, set_validators
+from app.api.listing import list_response
+from app.api.serialization import FastJSONResponse, parse_fields
+from app.schemas.common import Page, BatchGet, BatchResult
 from app.schemas.symbol import SymbolCreate, SymbolRead, SymbolUpdate, SymbolQuery
+from app.schemas.bar import BarSeries
+from app.schemas.corporate_action import CorporateActionCreate, CorporateActionRead
+from app.marketdata.adjust import load_factors
+from app.marketdata.resample import TIMEFRAMES, read_bars
+from app.repositories.corporate_action_repo import CorporateActionRepository
 from app.repositories.symbol_repo import SymbolRepository
+from app.observability.query_budget import query_budget
 
 router = APIRouter(prefix="/symbols", tags=["symbols"])
 
+# Longest range GET /{id}/bars serves, in bars of the requested timeframe
+MAX_BARS = 5000
+
+
+def _aware(ts: datetime) -> datetime:
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
 
 @router.post("", response_model=SymbolRead, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 def create_symbol(payload: SymbolCreate, db: Session = Depends(get_db)):
     """Create a new trading symbol."""
     repo = SymbolRepository(db)
@@ -18,8 +40,10 @@ def create_symbol(payload: SymbolCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=Page[SymbolRead], response_class=FastJSONResponse)
+@query_budget(2)
 def list_symbols(
+    request: Request,
     symbol: str | None = None,
     active: bool | None = None,
     search: str | None = None,
@@ -27,6 +51,7 @@ def list_symbols(
     offset: int = Query(0, ge=0),
     order_by: str = Query("symbol", pattern="^(created_at|updated_at|symbol|name|active)$"),
     order_dir: str = Query("asc", pattern="^(asc|desc)$"),
+    fields: str | None = Query(None, description="Comma-separated fields to return"),
     db: Session = Depends(get_db),
 ):
     """
@@ -39,8 +64,10 @@ def list_symbols(
     - **offset**: Number of results to skip (default 0)
     - **order_by**: Field to sort by (default: symbol)
     - **order_dir**: Sort direction: asc or desc (default: asc)
+    - **fields**: Comma-separated sparse fieldset (id is always included)
     """
     repo = SymbolRepository(db)
+    selected = parse_fields(fields, SymbolRead)
     q = SymbolQuery(
         symbol=symbol,
         active=active,
@@ -49,27 +76,122 @@ def list_symbols(
         offset=offset,
         order_by=order_by,
         order_dir=order_dir,
+        fields=selected,
     )
-    rows, total = repo.list_and_count(q)
-    return {
-        "items": [SymbolRead.model_validate(row) for row in rows],
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-    }
+    return list_response(request, repo, q, SymbolRead)
+
+
+@router.get("/batch", response_model=BatchResult[SymbolRead, int], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_symbols(
+    ids: list[str] = Query(..., description="Symbol IDs, repeated or comma-separated"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get several symbols by ID in one query.
+    
+    Items are returned in request order; unknown ids are listed in
+    `missing` instead of failing the whole request.
+    """
+    repo = SymbolRepository(db)
+    found, missing = repo.get_many(parse_ids(ids, int))
+    return batch_response(found, missing, SymbolRead)
+
+
+@router.post("/batch", response_model=BatchResult[SymbolRead, int], response_class=FastJSONResponse)
+@query_budget(1)
+def batch_get_symbols_post(payload: BatchGet[int], db: Session = Depends(get_db)):
+    """Get several symbols by ID (POST form for long id lists)."""
+    repo = SymbolRepository(db)
+    found, missing = repo.get_many(payload.ids)
+    return batch_response(found, missing, SymbolRead)
 
 
 @router.get("/{symbol_id}", response_model=SymbolRead)
-def get_symbol(symbol_id: int, db: Session = Depends(get_db)):
+@query_budget(1)
+def get_symbol(symbol_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a single symbol by ID."""
     repo = SymbolRepository(db)
     entity = repo.get(symbol_id)
     if not entity:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Symbol not found")
+    etag, last_modified = entity_validators(entity)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return entity
 
 
+@router.get("/{symbol_id}/bars", response_model=BarSeries, response_class=FastJSONResponse)
+@query_budget(3)
+def get_symbol_bars(
+    symbol_id: int,
+    tf: Literal["1m", "5m", "15m", "30m", "1h", "1d"] = Query("1m", description="Timeframe"),
+    start: datetime = Query(..., description="First minute bar to include"),
+    end: datetime = Query(..., description="Minute bars before this time"),
+    adjusted: bool = Query(False, description="Apply split and dividend adjustments"),
+    as_of: date | None = Query(None, description="Adjust for actions effective by this date (default: today)"),
+    db: Session = Depends(get_db),
+):
+    """
+    OHLCV bars of a symbol, resampled from stored minute bars.
+
+    - **tf**: `1m` as stored; coarser timeframes cover the regular session only
+    - **start** / **end**: bound the minute bars aggregated (start inclusive, end exclusive);
+      the range may span at most 5000 bars of `tf` (a day per `1d` bar)
+    - **adjusted**: back-adjust prices and volume for splits and dividends
+    - **as_of**: only actions with an ex-date on or before this date are applied
+
+    The series is columnar: `ts`, `open`, `high`, `low`, `close` and `volume`
+    are parallel arrays. Bars are labelled with the start of their bucket.
+    """
+    span = _aware(end) - _aware(start)
+    if span <= timedelta(0):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="end must be after start")
+    if span > MAX_BARS * timedelta(seconds=TIMEFRAMES[tf] or 86400):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Range spans more than {MAX_BARS} {tf} bars; narrow start/end",
+        )
+    if not SymbolRepository(db).get(symbol_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Symbol not found")
+    bars = read_bars(db, symbol_id, tf, start, end)
+    if adjusted:
+        bars = load_factors(db, symbol_id, as_of).apply(bars)
+    return FastJSONResponse({"symbol_id": symbol_id, "timeframe": tf, **bars.to_dict()})
+
+
+@router.post(
+    "/{symbol_id}/corporate-actions", response_model=CorporateActionRead, status_code=status.HTTP_201_CREATED,
+)
+@query_budget(4)
+def create_corporate_action(symbol_id: int, payload: CorporateActionCreate, db: Session = Depends(get_db)):
+    """
+    Record a split or cash dividend for a symbol.
+
+    - **ts**: ex-date; bars before it are adjusted
+    - **type**: `split` (needs `ratio`) or `dividend` (needs `cash`)
+    - **factor**: optional price factor; otherwise 1/ratio, or 1 - cash/prior close
+    """
+    if not SymbolRepository(db).get(symbol_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Symbol not found")
+    try:
+        return CorporateActionRepository(db).create(symbol_id, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.get("/{symbol_id}/corporate-actions", response_model=list[CorporateActionRead])
+@query_budget(2)
+def list_corporate_actions(symbol_id: int, db: Session = Depends(get_db)):
+    """Corporate actions of a symbol in ex-date order."""
+    if not SymbolRepository(db).get(symbol_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Symbol not found")
+    return CorporateActionRepository(db).list_for_symbol(symbol_id)
+
+
 @router.patch("/{symbol_id}", response_model=SymbolRead)
+@query_budget(3)
 def update_symbol(symbol_id: int, patch: SymbolUpdate, db: Session = Depends(get_db)):
     """Update a symbol (partial update)."""
     repo = SymbolRepository(db)
@@ -83,6 +205,7 @@ def update_symbol(symbol_id: int, patch: SymbolUpdate, db: Session = Depends(get
 
 
 @router.delete("/{symbol_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(2)
 def delete_symbol(symbol_id: int, db: Session = Depends(get_db)):
     """Delete a symbol."""
     repo = SymbolRepository(db)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.marketdata.universe import UniverseRules, build_universe
+from app.models.universe import UniverseSnapshot
+from app.repositories.universe_repo import UniverseRepository
+from app.schemas.universe import UniverseBuild, UniverseMemberRead, UniverseSnapshotRead, UniverseSnapshotSummary
+from app.observability.query_budget import query_budget
+
+router = APIRouter(prefix="/universe", tags=["universe"])
+
+
+def _read(repo: UniverseRepository, snapshot: UniverseSnapshot) -> UniverseSnapshotRead:
+    members = [
+        UniverseMemberRead(rank=rank, symbol_id=symbol_id, symbol=symbol, adv=adv, price=price)
+        for rank, symbol_id, symbol, adv, price in repo.members(snapshot.id)
+    ]
+    return UniverseSnapshotRead(**UniverseSnapshotSummary.model_validate(snapshot).model_dump(), members=members)
+
+
+@router.get("", response_model=UniverseSnapshotRead)
+@query_budget(2)
+def get_universe(
+    name: str = Query("default", max_length=32),
+    version: int | None = Query(None, ge=1, description="Snapshot version (default: latest)"),
+    db: Session = Depends(get_db),
+):
+    """
+    A universe snapshot with its members in rank order.
+
+    - **name**: universe name
+    - **version**: pinned version; the latest when omitted
+    """
+    repo = UniverseRepository(db)
+    snapshot = repo.get_snapshot(name, version)
+    if snapshot is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Universe snapshot not found")
+    return _read(repo, snapshot)
+
+
+@router.get("/snapshots", response_model=list[UniverseSnapshotSummary])
+@query_budget(1)
+def list_snapshots(name: str = Query("default", max_length=32), db: Session = Depends(get_db)):
+    """Versions of a universe, newest first."""
+    return UniverseRepository(db).list_snapshots(name)
+
+
+@router.post("/snapshots", response_model=UniverseSnapshotRead, status_code=status.HTTP_201_CREATED)
+@query_budget(8)
+def create_snapshot(payload: UniverseBuild, db: Session = Depends(get_db)):
+    """
+    Select the top-N symbols by average daily dollar volume and store them as a new version.
+
+    - **as_of**: only daily bars dated before it are used
+    - **lookback_days**: ADV window in trading sessions
+    - **min_price** / **min_adv** / **min_coverage**: filters applied before ranking
+    - **activate**: set `Symbol.active` (and `Asset.is_active` for equities and ETFs) to membership
+    """
+    rules = UniverseRules(**payload.model_dump(exclude={"name", "as_of", "activate"}))
+    try:
+        snapshot, _ = build_universe(db, payload.name, payload.as_of or date.today(), rules, payload.activate)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return _read(UniverseRepository(db), snapshot)
+
+
+@router.post("/activate", response_model=UniverseSnapshotSummary)
+@query_budget(3)
+def activate_snapshot(
+    name: str = Query("default", max_length=32),
+    version: int | None = Query(None, ge=1, description="Snapshot version (default: latest)"),
+    db: Session = Depends(get_db),
+):
+    """
+    Make a stored snapshot's members the active symbols, e.g. to roll back a rebalance.
+
+    - **name**: universe name
+    - **version**: version to activate; the latest when omitted
+    """
+    repo = UniverseRepository(db)
+    snapshot = repo.get_snapshot(name, version)
+    if snapshot is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Universe snapshot not found")
+    summary = UniverseSnapshotSummary.model_validate(snapshot)
+    repo.activate(snapshot.id)
+    return summary
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Iterable, Sequence, Type
+
+import orjson
+from fastapi import HTTPException, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> Any:
+    # Decimals are emitted as strings, matching pydantic's JSON mode
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(Response):
+    """orjson-backed JSON response that also handles Decimal."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def rows_to_dicts(rows: Iterable[Any], fields: Sequence[str]) -> list[dict[str, Any]]:
+    """Project ORM instances or Row tuples onto the given field names."""
+    if len(fields) == 1:
+        name = fields[0]
+        getter = attrgetter(name)
+        return [{name: getter(row)} for row in rows]
+    getter = attrgetter(*fields)
+    return [dict(zip(fields, getter(row))) for row in rows]
+
+
+def parse_fields(fields: str | None, schema: Type[BaseModel]) -> list[str] | None:
+    """
+    Parse a comma-separated sparse fieldset against a read schema.
+
+    Returns None when no projection was requested. The id is always
+    included so clients can key the returned rows.
+    """
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in schema.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown field(s): {', '.join(unknown)}",
+        )
+    selected = ["id"]
+    for f in requested:
+        if f not in selected:
+            selected.append(f)
+    return selected
+
+
+def page_response(
+    rows: Iterable[Any],
+    schema: Type[BaseModel],
+    total: int,
+    limit: int,
+    offset: int,
+    fields: Sequence[str] | None = None,
+) -> FastJSONResponse:
+    """
+    Serialize a list page in a single pass.
+
+    Rows come straight from the database, so they are read attribute by
+    attribute for the fields of the read schema (or the requested sparse
+    fieldset) and encoded by orjson, skipping per-row pydantic validation
+    and jsonable_encoder.
+    """
+    items = rows_to_dicts(rows, list(fields or schema.model_fields))
+    return FastJSONResponse({"items": items, "total": total, "limit": limit, "offset": offset})
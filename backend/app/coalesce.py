@@ -0,0 +1,84 @@
+from __future__ import annotations
+import os
+import threading
+import time
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent reads into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block and share its result (or exception). Results are then
+    kept for a short TTL. Keys live in namespaces (table names) so writes can
+    invalidate everything derived from a table; a call already in flight
+    when its namespace is invalidated is not reused by later callers.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._inflight: dict[tuple, _Call] = {}
+            self._results: dict[tuple, tuple[float, Any]] = {}
+            self._generations: dict[str, int] = {}
+
+    def do(self, namespace: str, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            full_key = (namespace, self._generations.get(namespace, 0), key)
+            cached = self._results.get(full_key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    return cached[1]
+                del self._results[full_key]
+            call = self._inflight.get(full_key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._inflight[full_key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(full_key, None)
+                current = full_key[1] == self._generations.get(namespace, 0)
+                if call.error is None and self.ttl > 0 and current:
+                    self._results[full_key] = (time.monotonic() + self.ttl, call.value)
+            call.event.set()
+        return call.value
+
+    def invalidate(self, namespace: str) -> None:
+        """Forget cached and in-flight results for a namespace."""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for full_key in [k for k in self._results if k[0] == namespace]:
+                del self._results[full_key]
+
+
+# Shared by list routes; writes through the repositories invalidate by table name
+read_coalescer = SingleFlight(ttl=float(os.getenv("READ_COALESCE_TTL_MS", "200")) / 1000)
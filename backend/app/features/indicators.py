@@ -0,0 +1,347 @@
+"""
+Technical indicators with a batch and a streaming API.
+
+Batch functions take float64 arrays shaped (..., T), e.g. one row per
+symbol, and work along the last axis; values before an indicator has a
+full window are NaN. Streaming classes take one bar per `update()` in
+O(1) time and memory and return the same value the batch function gives
+at that bar, bit for bit, so a live strategy sees exactly what its
+backtest saw.
+
+Identical bits come from identical arithmetic, not from tolerances:
+
+- Rolling sums are differences of running totals. `np.cumsum` adds in
+  order, like the streaming `total += x`, and the streaming side keeps
+  the last n+1 totals in a ring buffer. (Strided windows reduce with
+  pairwise summation, which no streaming update reproduces.)
+- Recursive filters (EMA, Wilder smoothing) have no exact closed form:
+  a parallel scan or a closed form regroups the products and rounds
+  differently. The batch side keeps the streaming update's operations
+  in the same order and runs one step per bar, over every series at
+  once. That is a Python loop over time, but not over symbols. Its cost
+  grows with the number of bars, not with bars times symbols, so wide
+  batches (many symbols per call) amortize it.
+- Squared deviations are summed around the first price, which keeps the
+  running totals small and avoids cancellation in the variance.
+
+Returns are simple (x / previous - 1): `np.log` may use vectorized
+kernels that differ from `math.log` in the last bit.
+"""
+from __future__ import annotations
+import math
+from collections import deque
+
+import numpy as np
+
+
+def _check_window(n: int, minimum: int = 1) -> None:
+    if n < minimum:
+        raise ValueError(f"window must be at least {minimum}, got {n}")
+
+
+def _window_sums(values: np.ndarray, n: int) -> np.ndarray:
+    """Trailing n-element sums along the last axis from running totals; NaN before the first full window."""
+    totals = np.cumsum(values, axis=-1)
+    padded = np.concatenate((np.zeros(values.shape[:-1] + (1,)), totals), axis=-1)
+    out = np.full(values.shape, np.nan)
+    out[..., n - 1:] = padded[..., n:] - padded[..., :-n]
+    return out
+
+
+def _recurrence(seed: np.ndarray, scale: float, values: np.ndarray, divisor: float = 1.0) -> np.ndarray:
+    """
+    prev = (prev * scale + value) / divisor along the last axis, starting from `seed`.
+
+    Returns the seed followed by each step. Each step runs in place over all
+    leading axes, in time-major order so every step reads contiguous memory.
+    """
+    lead = np.shape(seed)
+    steps = np.ascontiguousarray(np.moveaxis(values, -1, 0)).reshape(values.shape[-1], math.prod(lead))
+    out = np.empty((len(steps) + 1, steps.shape[1]))
+    out[0] = np.ravel(seed)
+    for i, value in enumerate(steps):
+        current = out[i + 1]
+        np.multiply(out[i], scale, out=current)
+        current += value
+        if divisor != 1.0:
+            current /= divisor
+    return np.moveaxis(out.reshape((len(out),) + lead), 0, -1)
+
+
+def _wilder(values: np.ndarray, n: int) -> np.ndarray:
+    """Wilder smoothing: the mean of the first n values, then (prev * (n - 1) + value) / n."""
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < n:
+        return out
+    seed = np.cumsum(values[..., :n], axis=-1)[..., -1] / n
+    out[..., n - 1:] = _recurrence(seed, float(n - 1), values[..., n:], n)
+    return out
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    return x[..., 1:] - x[..., :-1]
+
+
+# ------------------------------------------------------------------ batch
+
+
+def sma(x: np.ndarray, n: int) -> np.ndarray:
+    """Simple moving average."""
+    _check_window(n)
+    return _window_sums(np.asarray(x, dtype=np.float64), n) / n
+
+
+def ema(x: np.ndarray, n: int) -> np.ndarray:
+    """Exponential moving average with alpha = 2 / (n + 1), seeded with the first value."""
+    _check_window(n)
+    x = np.asarray(x, dtype=np.float64)
+    out = np.full(x.shape, np.nan)
+    if not x.shape[-1]:
+        return out
+    alpha = 2.0 / (n + 1)
+    beta = 1.0 - alpha
+    # alpha * value + beta * prev, as EMA.update adds them
+    values = _recurrence(x[..., 0], beta, alpha * x[..., 1:])
+    out[..., n - 1:] = values[..., n - 1:]
+    return out
+
+
+def rsi(close: np.ndarray, n: int = 14) -> np.ndarray:
+    """Wilder's relative strength index, 0-100; 50 when the window has no moves."""
+    _check_window(n)
+    close = np.asarray(close, dtype=np.float64)
+    d = _diff(close)
+    # Both averages in one pass over time
+    gain, loss = _wilder(np.stack((np.where(d > 0, d, 0.0), np.where(d < 0, -d, 0.0))), n)
+    total = gain + loss
+    out = np.full(close.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[..., 1:] = np.where(total > 0, 100.0 * gain / total, np.where(np.isnan(total), np.nan, 50.0))
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """High - low, widened to the previous close; the first bar has no previous close."""
+    high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+    tr = high - low
+    previous = close[..., :-1]
+    tr[..., 1:] = np.maximum.reduce([tr[..., 1:], np.abs(high[..., 1:] - previous), np.abs(low[..., 1:] - previous)])
+    return tr
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int = 14) -> np.ndarray:
+    """Average true range with Wilder smoothing."""
+    _check_window(n)
+    return _wilder(true_range(high, low, close), n)
+
+
+def bollinger(close: np.ndarray, n: int = 20, k: float = 2.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(middle, upper, lower) bands: n-bar mean plus and minus k population standard deviations."""
+    _check_window(n)
+    close = np.asarray(close, dtype=np.float64)
+    base = close[..., :1]
+    centered = close - base
+    mean = _window_sums(centered, n) / n
+    var = _window_sums(centered * centered, n) / n - mean * mean
+    sd = np.sqrt(np.maximum(var, 0.0))
+    mid = mean + base
+    return mid, mid + k * sd, mid - k * sd
+
+
+def returns(close: np.ndarray, k: int = 1) -> np.ndarray:
+    """Simple k-bar returns."""
+    _check_window(k)
+    close = np.asarray(close, dtype=np.float64)
+    out = np.full(close.shape, np.nan)
+    out[..., k:] = close[..., k:] / close[..., :-k] - 1.0
+    return out
+
+
+def rolling_volatility(close: np.ndarray, n: int = 20) -> np.ndarray:
+    """Sample standard deviation of the last n one-bar returns (not annualized)."""
+    _check_window(n, 2)
+    close = np.asarray(close, dtype=np.float64)
+    r = close[..., 1:] / close[..., :-1] - 1.0
+    s1 = _window_sums(r, n)
+    s2 = _window_sums(r * r, n)
+    out = np.full(close.shape, np.nan)
+    out[..., 1:] = np.sqrt(np.maximum((s2 - s1 * s1 / n) / (n - 1), 0.0))
+    return out
+
+
+# -------------------------------------------------------------- streaming
+
+
+class _WindowSum:
+    """Trailing n-element sum as the difference of two running totals."""
+
+    __slots__ = ("n", "total", "totals")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.total = 0.0
+        self.totals = deque([0.0], maxlen=n + 1)
+
+    def update(self, value: float) -> float:
+        self.total += value
+        self.totals.append(self.total)
+        return self.totals[-1] - self.totals[0] if len(self.totals) > self.n else math.nan
+
+
+class _Wilder:
+    __slots__ = ("n", "m", "count", "value")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.m = float(n - 1)
+        self.count = 0
+        self.value = 0.0
+
+    def update(self, x: float) -> float:
+        self.count += 1
+        if self.count < self.n:
+            self.value += x
+            return math.nan
+        if self.count == self.n:
+            self.value = (self.value + x) / self.n
+        else:
+            self.value = (self.value * self.m + x) / self.n
+        return self.value
+
+
+class SMA:
+    """Streaming `sma`."""
+
+    def __init__(self, n: int):
+        _check_window(n)
+        self.n = n
+        self._sum = _WindowSum(n)
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        self.value = self._sum.update(float(x)) / self.n
+        return self.value
+
+
+class EMA:
+    """Streaming `ema`."""
+
+    def __init__(self, n: int):
+        _check_window(n)
+        self.n = n
+        self.alpha = 2.0 / (n + 1)
+        self.beta = 1.0 - self.alpha
+        self.count = 0
+        self._ema = 0.0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self._ema = x if not self.count else self.alpha * x + self.beta * self._ema
+        self.count += 1
+        self.value = self._ema if self.count >= self.n else math.nan
+        return self.value
+
+
+class RSI:
+    """Streaming `rsi`."""
+
+    def __init__(self, n: int = 14):
+        _check_window(n)
+        self._gain = _Wilder(n)
+        self._loss = _Wilder(n)
+        self._previous: float | None = None
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        close = float(close)
+        if self._previous is not None:
+            d = close - self._previous
+            gain = self._gain.update(d if d > 0 else 0.0)
+            loss = self._loss.update(-d if d < 0 else 0.0)
+            total = gain + loss
+            self.value = 100.0 * gain / total if total > 0 else (math.nan if math.isnan(total) else 50.0)
+        self._previous = close
+        return self.value
+
+
+class ATR:
+    """Streaming `atr`."""
+
+    def __init__(self, n: int = 14):
+        _check_window(n)
+        self._atr = _Wilder(n)
+        self._previous: float | None = None
+        self.value = math.nan
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low = float(high), float(low)
+        tr = high - low
+        if self._previous is not None:
+            tr = max(tr, abs(high - self._previous), abs(low - self._previous))
+        self._previous = float(close)
+        self.value = self._atr.update(tr)
+        return self.value
+
+
+class Bollinger:
+    """Streaming `bollinger`; `update` returns (middle, upper, lower)."""
+
+    def __init__(self, n: int = 20, k: float = 2.0):
+        _check_window(n)
+        self.n = n
+        self.k = k
+        self._base: float | None = None
+        self._sum = _WindowSum(n)
+        self._squares = _WindowSum(n)
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, close: float) -> tuple[float, float, float]:
+        close = float(close)
+        if self._base is None:
+            self._base = close
+        c = close - self._base
+        mean = self._sum.update(c) / self.n
+        var = self._squares.update(c * c) / self.n - mean * mean
+        sd = math.sqrt(max(var, 0.0))  # max() keeps a NaN first argument
+        mid = mean + self._base
+        self.value = (mid, mid + self.k * sd, mid - self.k * sd)
+        return self.value
+
+
+class Returns:
+    """Streaming `returns`."""
+
+    def __init__(self, k: int = 1):
+        _check_window(k)
+        self._prices = deque(maxlen=k + 1)
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        self._prices.append(float(close))
+        if len(self._prices) == self._prices.maxlen:
+            self.value = self._prices[-1] / self._prices[0] - 1.0
+        return self.value
+
+
+class RollingVolatility:
+    """Streaming `rolling_volatility`."""
+
+    def __init__(self, n: int = 20):
+        _check_window(n, 2)
+        self.n = n
+        self._previous: float | None = None
+        self._sum = _WindowSum(n)
+        self._squares = _WindowSum(n)
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        close = float(close)
+        if self._previous is not None:
+            r = close / self._previous - 1.0
+            s1 = self._sum.update(r)
+            s2 = self._squares.update(r * r)
+            var = (s2 - s1 * s1 / self.n) / (self.n - 1)
+            self.value = math.sqrt(max(var, 0.0))
+        self._previous = close
+        return self.value
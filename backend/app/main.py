@@ -2,13 +2,33 @@ from fastapi import FastAPI
 import os
 import asyncpg
 import redis.asyncio as aioredis
+from opentelemetry.trace import SpanKind
 
 from app.api.routes.strategies import router as strategies_router
 from app.api.routes.assets import router as assets_router
 from app.api.routes.symbols import router as symbols_router
 from app.api.routes.orders import router as orders_router
+from app.api.routes.positions import router as positions_router
+from app.api.routes.bars import router as bars_router
+from app.api.routes.calendar import router as calendar_router
+from app.api.routes.data_quality import router as data_quality_router
+from app.api.routes.universe import router as universe_router
+from app.api.routes.debug import router as debug_router
+from app.admission import AdmissionMiddleware
+from app.observability.metrics import MetricsMiddleware, metrics_response
+from app.observability.query_budget import QueryBudgetMiddleware
+from app.observability.memory import MemoryMiddleware
+from app.observability.profiling import ProfilingMiddleware
+from app.observability.tracing import TracingMiddleware, configure_tracing_from_env, traced
 
 app = FastAPI(title="AI Trading Bot", version="0.1.0")
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(QueryBudgetMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(MemoryMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(TracingMiddleware)
+configure_tracing_from_env()
 
 @app.get("/health")
 async def health():
@@ -29,7 +49,8 @@ async def health():
             host=os.getenv("POSTGRES_HOST", "postgres"),
             port=int(os.getenv("POSTGRES_PORT", "5432")),
         ) as conn:
-            await conn.execute("SELECT 1;")
+            with traced("SELECT", kind=SpanKind.CLIENT, **{"db.system": "postgresql"}):
+                await conn.execute("SELECT 1;")
         pg_ok = True
     except Exception:
         pg_ok = False
@@ -39,7 +60,8 @@ async def health():
     r = None
     try:
         r = aioredis.from_url(os.getenv("REDIS_URL", "redis://redis:6379/0"))
-        pong = await r.ping()
+        with traced("redis PING", kind=SpanKind.CLIENT, **{"db.system": "redis"}):
+            pong = await r.ping()
         redis_ok = bool(pong)
     except Exception:
         redis_ok = False
@@ -50,6 +72,11 @@ async def health():
     status = "ok" if (env_ok and pg_ok and redis_ok) else "degraded"
     return {"status": status, "env": env_ok, "postgres": pg_ok, "redis": redis_ok}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint."""
+    return metrics_response()
+
 @app.get("/broker/status")
 def broker_status():
     broker = os.getenv("BROKER", "alpaca")
@@ -68,4 +95,10 @@ def broker_status():
 app.include_router(strategies_router)
 app.include_router(assets_router)
 app.include_router(symbols_router)
-app.include_router(orders_router)
\ No newline at end of file
+app.include_router(orders_router)
+app.include_router(positions_router)
+app.include_router(bars_router)
+app.include_router(calendar_router)
+app.include_router(data_quality_router)
+app.include_router(universe_router)
+app.include_router(debug_router)
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Split and dividend adjustment applied on read.
+
+Stored bars stay raw. For each symbol the corporate actions effective by
+an as-of date collapse into a step function: cumulative price and volume
+factors between consecutive ex-dates. Adjusting a series is one
+`searchsorted` of its timestamps into the ex-dates and a broadcast
+multiply, so it costs O(n) and never touches the bars table.
+
+Ex-dates fall between sessions, so adjusting resampled bars gives the
+same result as resampling adjusted minute bars.
+"""
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import BarArrays, SeriesCache, to_epoch_seconds
+from app.marketdata.store import BarStore
+from app.models.corporate_action import CorporateAction
+
+
+@dataclass(frozen=True)
+class AdjustmentFactors:
+    """
+    Cumulative factors of one symbol.
+
+    A bar with `ex_ts[i-1] <= ts < ex_ts[i]` is multiplied by `price[i]`
+    (open/high/low/close) and `volume[i]`; bars on or after the last
+    ex-date by `price[-1] == volume[-1] == 1`.
+    """
+    ex_ts: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def identity(cls) -> "AdjustmentFactors":
+        return cls(np.empty(0, "datetime64[s]"), np.ones(1), np.ones(1))
+
+    @classmethod
+    def from_actions(cls, actions: Sequence[tuple[datetime, float, float]]) -> "AdjustmentFactors":
+        """Build from (ex_ts, price factor, volume factor) rows ordered by ex_ts."""
+        if not actions:
+            return cls.identity()
+        ts, price, volume = zip(*actions)
+        ex_ts = to_epoch_seconds(ts, len(actions)).astype("datetime64[s]")
+        # Several actions on one ex-date multiply; cumulate from the newest back
+        price_cum = np.append(np.cumprod(np.asarray(price, np.float64)[::-1])[::-1], 1.0)
+        volume_cum = np.append(np.cumprod(np.asarray(volume, np.float64)[::-1])[::-1], 1.0)
+        return cls(ex_ts, price_cum, volume_cum)
+
+    def apply(self, bars: BarArrays) -> BarArrays:
+        """Adjusted copy of `bars`; returned unchanged when no action precedes its end."""
+        if not len(self.ex_ts) or not len(bars) or bars.ts[0] >= self.ex_ts[-1]:
+            return bars
+        step = np.searchsorted(self.ex_ts, bars.ts, "right")
+        price, volume = self.price[step], self.volume[step]
+        return BarArrays(
+            bars.ts, bars.open * price, bars.high * price, bars.low * price, bars.close * price,
+            bars.volume * volume,
+        )
+
+
+def _as_of_end(as_of: date) -> datetime:
+    return datetime.combine(as_of + timedelta(days=1), time(), timezone.utc)
+
+
+def today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+# (symbol_id, as_of) -> AdjustmentFactors; (symbol_id, store, timeframe, as_of, end) -> adjusted BarArrays
+adjustment_cache = SeriesCache(maxsize=int(os.getenv("ADJUSTMENT_CACHE_SIZE", "512")))
+
+
+def load_factors(db: Session, symbol_id: int, as_of: date | None = None) -> AdjustmentFactors:
+    """Factors of the actions with an ex-date on or before `as_of` (default: today, UTC)."""
+    as_of = as_of or today()
+    key = (symbol_id, as_of)
+    factors = adjustment_cache.get(key)
+    if factors is None:
+        generation = adjustment_cache.generation(symbol_id)
+        rows = db.execute(
+            select(CorporateAction.ts, CorporateAction.factor, CorporateAction.type, CorporateAction.ratio)
+            .where(CorporateAction.symbol_id == symbol_id, CorporateAction.ts < _as_of_end(as_of))
+            .order_by(CorporateAction.ts, CorporateAction.id)
+        ).all()
+        # Splits scale share counts by the ratio; dividends leave volume alone
+        factors = AdjustmentFactors.from_actions([
+            (ts, factor, ratio if kind == "split" and ratio else 1.0) for ts, factor, kind, ratio in rows
+        ])
+        adjustment_cache.put(key, factors, generation)
+    return factors
+
+
+def read_adjusted(
+    store: BarStore, db: Session, symbol: int | str, timeframe: str, as_of: date | None = None,
+    start: np.datetime64 | None = None, end: np.datetime64 | None = None,
+) -> BarArrays:
+    """
+    Adjusted bars from the local store, as of a date.
+
+    The adjusted full series is cached per (symbol, as-of date) and the
+    store length, so repeated range reads are views into one array and
+    appends to the store are picked up on the next read.
+    """
+    symbol_id = store.resolve(symbol)
+    as_of = as_of or today()
+    raw = store.read(symbol_id, timeframe)
+    key = (symbol_id, str(store.root), timeframe, as_of, len(raw))
+    adjusted = adjustment_cache.get(key)
+    if adjusted is None:
+        generation = adjustment_cache.generation(symbol_id)
+        adjusted = load_factors(db, symbol_id, as_of).apply(raw)
+        adjustment_cache.put(key, adjusted, generation)
+    return adjusted.between(start, end)
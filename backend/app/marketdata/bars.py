@@ -0,0 +1,120 @@
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+# Timeframes persisted in the bars table; everything else is derived
+STORED_TIMEFRAMES = ("1m", "1d")
+
+FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def to_epoch_seconds(values: Iterable[datetime], count: int = -1) -> np.ndarray:
+    """Datetimes to int64 UTC epoch seconds; naive values are taken as UTC."""
+    return np.fromiter(
+        (
+            int((v if v.tzinfo is not None else v.replace(tzinfo=timezone.utc)).timestamp())
+            for v in values
+        ),
+        dtype=np.int64,
+        count=count,
+    )
+
+
+@dataclass(frozen=True)
+class BarArrays:
+    """
+    Bars of one symbol and timeframe as parallel column arrays.
+
+    `ts` is datetime64[s] in UTC and strictly increasing; prices and
+    volume are float64.
+    """
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def empty(cls) -> "BarArrays":
+        return cls(np.empty(0, "datetime64[s]"), *(np.empty(0, np.float64) for _ in FIELDS))
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "BarArrays":
+        """Build from (ts, open, high, low, close, volume) rows ordered by ts."""
+        if not rows:
+            return cls.empty()
+        ts, *columns = zip(*rows)
+        return cls(
+            to_epoch_seconds(ts, len(rows)).astype("datetime64[s]"),
+            *(np.asarray(column, dtype=np.float64) for column in columns),
+        )
+
+    def between(self, start: np.datetime64 | None = None, end: np.datetime64 | None = None) -> "BarArrays":
+        """Bars with start <= ts < end, as views into these arrays."""
+        lo = 0 if start is None else int(np.searchsorted(self.ts, start, "left"))
+        hi = len(self.ts) if end is None else int(np.searchsorted(self.ts, end, "left"))
+        return BarArrays(*(getattr(self, name)[lo:hi] for name in ("ts", *FIELDS)))
+
+    def to_dict(self) -> dict[str, list]:
+        return {
+            "ts": np.datetime_as_string(self.ts, unit="s", timezone="UTC").tolist(),
+            **{name: getattr(self, name).tolist() for name in FIELDS},
+        }
+
+
+class SeriesCache:
+    """
+    LRU of derived series keyed by (symbol_id, ...).
+
+    Writers invalidate a symbol after committing new data; a value
+    computed while its symbol was invalidated is not cached (`put` takes
+    the generation read before computing it).
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._generations: dict[int, int] = {}
+
+    def generation(self, symbol_id: int) -> int:
+        with self._lock:
+            return self._generations.get(symbol_id, 0)
+
+    def get(self, key: tuple) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation != self._generations.get(key[0], 0):
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, symbol_ids) -> None:
+        ids = set(symbol_ids)
+        with self._lock:
+            for symbol_id in ids:
+                self._generations[symbol_id] = self._generations.get(symbol_id, 0) + 1
+            for key in [k for k in self._entries if k[0] in ids]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
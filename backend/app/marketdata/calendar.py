@@ -0,0 +1,246 @@
+"""
+Exchange trading calendars with precomputed session arrays.
+
+Each calendar holds every session from FIRST_YEAR to LAST_YEAR as three
+sorted arrays: session dates, open and close times (UTC epoch seconds).
+Holidays and early closes are generated from the exchange's rules once,
+at first use; every query afterwards is a `np.searchsorted` over those
+arrays and works on scalars and arrays of timestamps alike.
+
+Calendars are looked up by `Asset.exchange` values; US equity venues
+share the NYSE calendar. `CRYPTO` trades around the clock in daily UTC
+sessions.
+"""
+from __future__ import annotations
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+FIRST_YEAR = 1990
+LAST_YEAR = 2050
+
+# Unscheduled NYSE closures (weather, national days of mourning)
+NYSE_SPECIAL_CLOSURES = {
+    date(1994, 4, 27), date(2001, 9, 11), date(2001, 9, 12), date(2001, 9, 13), date(2001, 9, 14),
+    date(2004, 6, 11), date(2007, 1, 2), date(2012, 10, 29), date(2012, 10, 30), date(2018, 12, 5),
+    date(2025, 1, 9),
+}
+
+
+def _observed(day: date) -> date | None:
+    """NYSE observance: Saturday holidays move to Friday, Sunday ones to Monday."""
+    if day.weekday() == 5:
+        # No Friday holiday when New Year's Day falls on a Saturday
+        return None if (day.month, day.day) == (1, 1) else day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th (1-based) given weekday of a month; n=-1 for the last."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def nyse_holidays(year: int) -> set[date]:
+    holidays = {
+        _observed(date(year, 1, 1)),
+        _nth_weekday(year, 2, 0, 3),           # Washington's Birthday
+        _easter(year) - timedelta(days=2),     # Good Friday
+        _nth_weekday(year, 5, 0, -1),          # Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),           # Labor Day
+        _nth_weekday(year, 11, 3, 4),          # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    if year >= 1998:
+        holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.discard(None)
+    return holidays | {d for d in NYSE_SPECIAL_CLOSURES if d.year == year}
+
+
+def nyse_early_closes(year: int, holidays: set[date]) -> set[date]:
+    """
+    13:00 closes: July 3, the day after Thanksgiving and Christmas Eve,
+    when they are trading days. Today's rules are applied to every year.
+    """
+    days = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1), date(year, 12, 24)}
+    if date(year, 7, 4).weekday() not in (0, 5, 6):
+        days.add(date(year, 7, 3))
+    return {d for d in days if d.weekday() < 5 and d not in holidays}
+
+
+@dataclass(frozen=True)
+class Session:
+    date: date
+    open: datetime
+    close: datetime
+    early_close: bool
+
+
+class TradingCalendar:
+    """
+    Sessions of one exchange as sorted arrays.
+
+    `dates` is datetime64[D] in exchange local time; `opens` and `closes`
+    are int64 UTC epoch seconds, and sessions never overlap. `early`
+    flags sessions that close before the regular time.
+    """
+
+    def __init__(
+        self, name: str, tz: str, dates: np.ndarray, opens: np.ndarray, closes: np.ndarray, early: np.ndarray,
+    ):
+        self.name = name
+        self.tz = ZoneInfo(tz)
+        self.dates = dates
+        self.opens = opens
+        self.closes = closes
+        self.early = early
+
+    def __len__(self) -> int:
+        return len(self.opens)
+
+    @staticmethod
+    def _seconds(ts) -> np.ndarray | int:
+        """datetime, datetime64 or epoch seconds (scalar or array) to epoch seconds."""
+        if isinstance(ts, datetime):
+            return int((ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp())
+        values = np.asarray(ts)
+        if np.issubdtype(values.dtype, np.datetime64):
+            values = values.astype("datetime64[s]").astype(np.int64)
+        return values if values.ndim else int(values)
+
+    def session_index(self, ts):
+        """Index of the last session opened at or before `ts` (-1 before the first)."""
+        return np.searchsorted(self.opens, self._seconds(ts), "right") - 1
+
+    def is_open(self, ts):
+        """Whether each timestamp falls inside a session (open inclusive, close exclusive)."""
+        t = self._seconds(ts)
+        i = np.searchsorted(self.opens, t, "right") - 1
+        return (i >= 0) & (t < self.closes[np.maximum(i, 0)])
+
+    def next_open(self, ts):
+        """Epoch seconds of the first open strictly after `ts`."""
+        i = np.searchsorted(self.opens, self._seconds(ts), "right")
+        return self.opens[np.minimum(i, len(self.opens) - 1)]
+
+    def next_close(self, ts):
+        """Epoch seconds of the first close strictly after `ts`."""
+        i = np.searchsorted(self.closes, self._seconds(ts), "right")
+        return self.closes[np.minimum(i, len(self.closes) - 1)]
+
+    def between(self, start: date, end: date) -> slice:
+        """Slice of the sessions dated start..end inclusive."""
+        lo = int(np.searchsorted(self.dates, np.datetime64(start, "D"), "left"))
+        hi = int(np.searchsorted(self.dates, np.datetime64(end, "D"), "right"))
+        return slice(lo, hi)
+
+    def sessions(self, start: date, end: date) -> list[Session]:
+        window = self.between(start, end)
+        return [
+            Session(d, datetime.fromtimestamp(o, timezone.utc), datetime.fromtimestamp(c, timezone.utc), e)
+            for d, o, c, e in zip(
+                self.dates[window].astype(date).tolist(),
+                self.opens[window].tolist(),
+                self.closes[window].tolist(),
+                self.early[window].tolist(),
+            )
+        ]
+
+    def session_arrays(self, start: date, end: date) -> tuple[np.ndarray, np.ndarray]:
+        """Open and close arrays (views) of the sessions dated start..end."""
+        window = self.between(start, end)
+        return self.opens[window], self.closes[window]
+
+
+def _build(
+    name: str, tz: str, open_at: time, close_at: time,
+    trading_day: Callable[[date, set[date]], bool],
+    holidays: Callable[[int], set[date]] = lambda year: set(),
+    early_closes: Callable[[int, set[date]], set[date]] = lambda year, holidays: set(),
+    early_close_at: time | None = None,
+) -> TradingCalendar:
+    zone = ZoneInfo(tz)
+    dates, opens, closes, early_flags = [], [], [], []
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        closed = holidays(year)
+        early = early_closes(year, closed)
+        day, last = date(year, 1, 1), date(year, 12, 31)
+        while day <= last:
+            if trading_day(day, closed):
+                dates.append(day)
+                opens.append(datetime.combine(day, open_at, zone).timestamp())
+                end_at = early_close_at if day in early else close_at
+                early_flags.append(day in early)
+                # A close at midnight ends the session at the start of the next day
+                end_day = day + timedelta(days=1) if end_at <= open_at else day
+                closes.append(datetime.combine(end_day, end_at, zone).timestamp())
+            day += timedelta(days=1)
+    return TradingCalendar(
+        name, tz, np.array(dates, dtype="datetime64[D]"),
+        np.array(opens, dtype=np.int64), np.array(closes, dtype=np.int64), np.array(early_flags, dtype=bool),
+    )
+
+
+def _weekday(day: date, holidays: set[date]) -> bool:
+    return day.weekday() < 5 and day not in holidays
+
+
+CALENDARS: dict[str, Callable[[], TradingCalendar]] = {
+    "NYSE": lambda: _build(
+        "NYSE", "America/New_York", time(9, 30), time(16, 0), _weekday,
+        nyse_holidays, nyse_early_closes, time(13, 0),
+    ),
+    "CRYPTO": lambda: _build("CRYPTO", "UTC", time(0, 0), time(0, 0), lambda day, holidays: True),
+}
+
+# Asset.exchange values and MIC codes that trade on another calendar
+ALIASES = {
+    "XNYS": "NYSE", "NASDAQ": "NYSE", "XNAS": "NYSE", "ARCA": "NYSE", "NYSEARCA": "NYSE",
+    "AMEX": "NYSE", "NYSEAMERICAN": "NYSE", "BATS": "NYSE", "CBOE": "NYSE", "IEX": "NYSE",
+}
+
+_lock = threading.Lock()
+_built: dict[str, TradingCalendar] = {}
+
+
+def exchanges() -> list[str]:
+    return sorted({*CALENDARS, *ALIASES})
+
+
+def get_calendar(exchange: str) -> TradingCalendar:
+    """The calendar for an exchange name or alias, built on first use."""
+    key = exchange.upper()
+    key = ALIASES.get(key, key)
+    if key not in CALENDARS:
+        raise KeyError(f"No trading calendar for exchange {exchange!r}")
+    with _lock:
+        calendar = _built.get(key)
+        if calendar is None:
+            calendar = _built[key] = CALENDARS[key]()
+        return calendar
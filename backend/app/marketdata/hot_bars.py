@@ -0,0 +1,99 @@
+"""
+Latest-N bar ring buffers in Redis for live strategies.
+
+Each symbol has one Redis list, `bars:hot:<symbol_id>`, whose elements
+are packed little-endian records (int64 epoch seconds, then float64
+open, high, low, close, volume). An append is RPUSH + LTRIM in one
+MULTI/EXEC, so a list never holds more than `capacity` bars. Appends
+for many symbols share one pipeline, and `get_latest` reads the whole
+universe with one LRANGE per symbol in a single round trip, decoding
+all replies with one `np.frombuffer`.
+
+Appends must be newer than the bars already buffered; the buffer does
+not reorder or deduplicate.
+"""
+from __future__ import annotations
+import os
+from typing import Iterable, Mapping
+
+import numpy as np
+import redis.asyncio as aioredis
+
+from app.marketdata.bars import FIELDS, BarArrays
+
+RECORD = np.dtype([("ts", "<i8"), *((name, "<f8") for name in FIELDS)])
+DEFAULT_CAPACITY = int(os.getenv("HOT_BAR_CAPACITY", "500"))
+
+
+def pack(bars: BarArrays) -> list[bytes]:
+    """One packed record per bar."""
+    records = np.empty(len(bars), dtype=RECORD)
+    records["ts"] = bars.ts.astype("datetime64[s]").astype(np.int64)
+    for name in FIELDS:
+        records[name] = getattr(bars, name)
+    data = records.tobytes()
+    size = RECORD.itemsize
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def unpack(data: bytes) -> BarArrays:
+    records = np.frombuffer(data, dtype=RECORD)
+    return BarArrays(
+        records["ts"].astype("datetime64[s]"),
+        *(np.ascontiguousarray(records[name]) for name in FIELDS),
+    )
+
+
+class HotBarBuffer:
+    """Fixed-length per-symbol bar buffers in Redis."""
+
+    def __init__(self, redis: aioredis.Redis, capacity: int = DEFAULT_CAPACITY, prefix: str = "bars:hot"):
+        self.redis = redis
+        self.capacity = capacity
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str | None = None, **kwargs) -> "HotBarBuffer":
+        return cls(aioredis.from_url(url or os.getenv("REDIS_URL", "redis://redis:6379/0")), **kwargs)
+
+    def key(self, symbol_id: int) -> str:
+        return f"{self.prefix}:{symbol_id}"
+
+    async def append(self, bars: Mapping[int, BarArrays]) -> int:
+        """Append new bars for any number of symbols in one round trip; returns bars written."""
+        written = 0
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for symbol_id, series in bars.items():
+                if not len(series):
+                    continue
+                key = self.key(symbol_id)
+                # Only the newest `capacity` bars can survive the trim
+                records = pack(series)[-self.capacity:]
+                pipe.rpush(key, *records)
+                pipe.ltrim(key, -self.capacity, -1)
+                written += len(records)
+            if written:
+                await pipe.execute()
+        return written
+
+    async def get_latest(self, symbol_ids: Iterable[int], n: int) -> dict[int, BarArrays]:
+        """The last `n` bars (at most `capacity`) of each symbol, oldest first."""
+        symbol_ids = list(symbol_ids)
+        if not symbol_ids or n <= 0:
+            return {symbol_id: BarArrays.empty() for symbol_id in symbol_ids}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for symbol_id in symbol_ids:
+                pipe.lrange(self.key(symbol_id), -min(n, self.capacity), -1)
+            replies = await pipe.execute()
+        counts = np.fromiter((len(r) for r in replies), dtype=np.intp, count=len(replies))
+        bars = unpack(b"".join(record for reply in replies for record in reply))
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        return {
+            symbol_id: BarArrays(*(getattr(bars, name)[lo:hi] for name in ("ts", *FIELDS)))
+            for symbol_id, lo, hi in zip(symbol_ids, bounds[:-1].tolist(), bounds[1:].tolist())
+        }
+
+    async def clear(self, symbol_ids: Iterable[int]) -> None:
+        keys = [self.key(symbol_id) for symbol_id in symbol_ids]
+        if keys:
+            await self.redis.delete(*keys)
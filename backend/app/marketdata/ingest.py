@@ -0,0 +1,208 @@
+"""
+Bulk bar ingestion from CSV or Parquet.
+
+Rows are resolved to `symbols.id`, validated and written in chunks, one
+transaction per chunk. On Postgres each chunk is COPYed into a temporary
+staging table and merged with INSERT ... ON CONFLICT, so re-ingesting a
+range overwrites it instead of failing. SQLite (tests, local runs) uses
+an executemany upsert; other databases are not supported. Parquet needs
+the optional `pyarrow` package.
+
+With `scan=True` every symbol's ingested range is run through the
+data-quality scanner once all chunks are written.
+"""
+from __future__ import annotations
+import csv
+import io
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Iterable, Iterator
+
+from sqlalchemy import column, select, table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import FIELDS, STORED_TIMEFRAMES
+from app.marketdata.quality import scan_range
+from app.marketdata.resample import resample_cache
+from app.models.bar import Bar
+from app.models.symbol import Symbol
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only Parquet ingestion needs it
+    pq = None
+
+DEFAULT_CHUNK_SIZE = 50_000
+COLUMNS = ("symbol_id", "timeframe", "ts", *FIELDS, "provider")
+
+
+@dataclass
+class IngestResult:
+    rows: int = 0
+    chunks: int = 0
+    skipped: int = 0
+    unknown_symbols: list[str] = field(default_factory=list)
+    issues: int = 0
+    # symbol_id -> [first, last] bar timestamp written
+    ranges: dict[int, list[datetime]] = field(default_factory=dict)
+
+
+def _parse_ts(value: Any) -> datetime:
+    """ISO 8601 or epoch seconds; naive timestamps are UTC."""
+    if isinstance(value, datetime):
+        ts = value
+    elif isinstance(value, (int, float)) or (isinstance(value, str) and value.replace(".", "", 1).isdigit()):
+        return datetime.fromtimestamp(float(value), timezone.utc)
+    else:
+        ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def iter_csv(stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[dict[str, Any]]]:
+    """
+    Chunks of rows from a CSV with a header.
+
+    Columns: `symbol` (ticker) or `symbol_id`, `ts`, open, high, low, close, volume.
+    """
+    chunk: list[dict[str, Any]] = []
+    for row in csv.DictReader(stream):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_parquet(source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[dict[str, Any]]]:
+    """Chunks of rows from a Parquet file with the same columns as the CSV."""
+    if pq is None:
+        raise ValueError("Parquet ingestion requires the pyarrow package")
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+        yield batch.to_pylist()
+
+
+class BarIngestor:
+    """Validate raw bar rows and upsert them into the bars table chunk by chunk."""
+
+    def __init__(self, db: Session, timeframe: str, provider: str, scan: bool = False):
+        if timeframe not in STORED_TIMEFRAMES:
+            raise ValueError(f"Unsupported timeframe {timeframe!r}; stored timeframes are {', '.join(STORED_TIMEFRAMES)}")
+        self.db = db
+        self.timeframe = timeframe
+        self.provider = provider
+        self.scan = scan
+        self._symbol_ids: dict[str, int | None] = {}
+        self._known_ids: set[int] = set()
+
+    def ingest(self, chunks: Iterable[list[dict[str, Any]]]) -> IngestResult:
+        result = IngestResult()
+        unknown: set[str] = set()
+        for chunk in chunks:
+            rows = self._normalize(chunk, result, unknown)
+            if rows:
+                self._write(rows)
+                self.db.commit()
+                resample_cache.invalidate({row[0] for row in rows})
+                result.rows += len(rows)
+                for symbol_id, _, ts, *_ in rows:
+                    span = result.ranges.setdefault(symbol_id, [ts, ts])
+                    if ts < span[0]:
+                        span[0] = ts
+                    elif ts > span[1]:
+                        span[1] = ts
+            result.chunks += 1
+        result.unknown_symbols = sorted(unknown)
+        if self.scan:
+            bar = timedelta(days=1) if self.timeframe == "1d" else timedelta(minutes=1)
+            for symbol_id, (first, last) in result.ranges.items():
+                result.issues += len(scan_range(self.db, symbol_id, self.timeframe, first, last + bar))
+        return result
+
+    # ----------------------------------------------------------- validation
+
+    def _resolve(self, chunk: list[dict[str, Any]]) -> None:
+        """Look up tickers and ids not seen in earlier chunks, one query each."""
+        tickers = {str(r["symbol"]) for r in chunk if r.get("symbol") not in (None, "")} - self._symbol_ids.keys()
+        if tickers:
+            found = dict(self.db.execute(select(Symbol.symbol, Symbol.id).where(Symbol.symbol.in_(tickers))).all())
+            self._symbol_ids.update({t: found.get(t) for t in tickers})
+        ids = {int(r["symbol_id"]) for r in chunk if r.get("symbol_id") not in (None, "")} - self._known_ids
+        if ids:
+            found_ids = set(self.db.execute(select(Symbol.id).where(Symbol.id.in_(ids))).scalars())
+            self._known_ids |= found_ids
+            self._symbol_ids.update({str(i): None for i in ids - found_ids})
+
+    def _normalize(self, chunk: list[dict[str, Any]], result: IngestResult, unknown: set[str]) -> list[tuple]:
+        self._resolve(chunk)
+        rows = []
+        for line, raw in enumerate(chunk, start=result.rows + result.skipped + 1):
+            if raw.get("symbol_id") not in (None, ""):
+                symbol_id = int(raw["symbol_id"])
+                if symbol_id not in self._known_ids:
+                    unknown.add(str(symbol_id))
+                    result.skipped += 1
+                    continue
+            else:
+                symbol_id = self._symbol_ids.get(str(raw.get("symbol")))
+                if symbol_id is None:
+                    unknown.add(str(raw.get("symbol")))
+                    result.skipped += 1
+                    continue
+            try:
+                ts = _parse_ts(raw["ts"])
+                o, h, l, c, v = (float(raw[name]) for name in FIELDS)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Row {line}: {type(e).__name__}: {e}") from e
+            rows.append((symbol_id, self.timeframe, ts, o, h, l, c, v, self.provider))
+        return rows
+
+    # -------------------------------------------------------------- writing
+
+    def _write(self, rows: list[tuple]) -> None:
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            self._copy(rows)
+        elif dialect == "sqlite":
+            self._upsert(rows)
+        else:
+            raise NotImplementedError(f"Bar ingestion supports postgresql and sqlite, not {dialect}")
+
+    def _copy(self, rows: list[tuple]) -> None:
+        conn = self.db.connection()
+        conn.exec_driver_sql(
+            "CREATE TEMP TABLE IF NOT EXISTS bars_stage "
+            "(LIKE bars INCLUDING DEFAULTS, seq integer NOT NULL) ON COMMIT DELETE ROWS"
+        )
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            (symbol_id, tf, ts.isoformat(), *rest, seq) for seq, (symbol_id, tf, ts, *rest) in enumerate(rows)
+        )
+        buffer.seek(0)
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY bars_stage ({', '.join(COLUMNS)}, seq) FROM STDIN WITH (FORMAT csv)", buffer)
+        stage = table("bars_stage", *(column(name) for name in (*COLUMNS, "seq")))
+        # DISTINCT ON: ON CONFLICT cannot update the same row twice in one statement.
+        # The last row in the file wins, as with the SQLite upsert
+        deduped = (
+            select(*(stage.c[name] for name in COLUMNS))
+            .distinct(stage.c.symbol_id, stage.c.timeframe, stage.c.ts)
+            .order_by(stage.c.symbol_id, stage.c.timeframe, stage.c.ts, stage.c.seq.desc())
+        )
+        stmt = pg_insert(Bar).from_select(COLUMNS, deduped)
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["symbol_id", "timeframe", "ts"],
+            set_={name: stmt.excluded[name] for name in (*FIELDS, "provider")},
+        ))
+
+    def _upsert(self, rows: list[tuple]) -> None:
+        stmt = sqlite_insert(Bar)
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["symbol_id", "timeframe", "ts"],
+                set_={name: stmt.excluded[name] for name in (*FIELDS, "provider")},
+            ),
+            [dict(zip(COLUMNS, row)) for row in rows],
+        )
@@ -0,0 +1,429 @@
+"""
+Live minute-bar ingestion from an Alpaca-style market data WebSocket.
+
+    socket reader -> frame queue -> batch decoder -> per-sink queues -> sinks
+
+The reader only enqueues raw frames; when the frame queue is full it
+stops reading, which pushes back on the socket. The decoder drains every
+queued frame at once, decodes the JSON arrays and maps tickers to
+`symbols.id`. Each sink (the bars table, the Redis hot buffer, in-process
+subscribers) has its own bounded queue so a slow sink never stalls the
+others:
+
+- `merge` queues key pending bars by (symbol, minute); an updated bar
+  replaces the queued version, so a sink that falls behind writes each
+  minute once. Past `maxsize` distinct bars the oldest are dropped.
+- `drop_oldest` queues keep the newest `maxsize` bars, for consumers
+  that only care about fresh data.
+
+Lag from bar close to every stage is recorded in
+`marketdata_stage_lag_seconds`, and the newest bar time each stage has
+seen in `marketdata_last_bar_timestamp_seconds`, so a stalled stage is
+visible as a growing gap to wall-clock time.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable, Literal, NamedTuple
+
+import numpy as np
+import orjson
+from prometheus_client import Counter, Gauge, Histogram
+from websockets.asyncio.client import connect
+from websockets.exceptions import WebSocketException
+
+from app.marketdata.bars import FIELDS, BarArrays
+from app.marketdata.hot_bars import HotBarBuffer
+from app.marketdata.ingest import BarIngestor
+
+logger = logging.getLogger(__name__)
+
+BAR_SECONDS = 60
+
+STAGE_LAG = Histogram(
+    "marketdata_stage_lag_seconds",
+    "Delay from bar close to each live ingestion stage.",
+    ["stage"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 300),
+)
+LAST_BAR = Gauge(
+    "marketdata_last_bar_timestamp_seconds",
+    "Close time of the newest bar each live ingestion stage has handled.",
+    ["stage"],
+)
+QUEUE_DEPTH = Gauge(
+    "marketdata_queue_depth",
+    "Items waiting in a live ingestion queue.",
+    ["queue"],
+)
+DROPPED = Counter(
+    "marketdata_dropped_bars",
+    "Bars dropped because a live ingestion queue was full.",
+    ["queue"],
+)
+MESSAGES = Counter(
+    "marketdata_messages",
+    "Feed messages decoded, by message type.",
+    ["type"],
+)
+
+
+class FeedError(Exception):
+    """The feed rejected the connection (bad credentials, connection limit)."""
+
+
+class LiveBar(NamedTuple):
+    symbol_id: int
+    ts: int  # bar start, epoch seconds
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    updated: bool  # a late correction of a bar already sent
+
+
+def observe(stage: str, bars: list[LiveBar], now: float | None = None) -> None:
+    """Record lag from bar close to `now` (default: the current time) for a stage."""
+    if not bars:
+        return
+    closes = np.fromiter((bar.ts for bar in bars), dtype=np.float64, count=len(bars)) + BAR_SECONDS
+    lags = (time.time() if now is None else now) - closes
+    histogram = STAGE_LAG.labels(stage)
+    for lag in lags.tolist():
+        histogram.observe(lag)
+    LAST_BAR.labels(stage).set(float(closes.max()))
+
+
+def to_arrays(bars: list[LiveBar]) -> dict[int, BarArrays]:
+    """Group bars by symbol into time-ordered arrays (last version of each minute wins)."""
+    latest: dict[tuple[int, int], LiveBar] = {}
+    for bar in bars:
+        latest[(bar.symbol_id, bar.ts)] = bar
+    grouped: dict[int, list[LiveBar]] = {}
+    for key in sorted(latest):
+        grouped.setdefault(key[0], []).append(latest[key])
+    return {
+        symbol_id: BarArrays(
+            np.fromiter((b.ts for b in rows), dtype=np.int64, count=len(rows)).astype("datetime64[s]"),
+            *(np.fromiter((getattr(b, name) for b in rows), dtype=np.float64, count=len(rows)) for name in FIELDS),
+        )
+        for symbol_id, rows in grouped.items()
+    }
+
+
+# ------------------------------------------------------------------ queues
+
+class BarQueue(ABC):
+    """Bounded, non-blocking bar queue; `put` never waits, `get_batch` drains."""
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._ready = asyncio.Event()
+
+    @abstractmethod
+    def put(self, bars: Iterable[LiveBar]) -> None:
+        """Queue bars, dropping by the queue's policy past `maxsize`."""
+
+    @abstractmethod
+    def _take(self) -> list[LiveBar]:
+        """Remove and return everything queued."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Bars currently queued."""
+
+    def _drop(self, count: int) -> None:
+        self.dropped += count
+        DROPPED.labels(self.name).inc(count)
+
+    async def get_batch(self) -> list[LiveBar]:
+        """Wait for bars and return everything queued."""
+        while not len(self):
+            self._ready.clear()
+            await self._ready.wait()
+        batch = self._take()
+        QUEUE_DEPTH.labels(self.name).set(0)
+        return batch
+
+
+class MergeQueue(BarQueue):
+    """Pending bars keyed by (symbol, minute); a newer version replaces the queued one."""
+
+    def __init__(self, name: str, maxsize: int):
+        super().__init__(name, maxsize)
+        self._pending: dict[tuple[int, int], LiveBar] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, bars: Iterable[LiveBar]) -> None:
+        pending = self._pending
+        for bar in bars:
+            key = (bar.symbol_id, bar.ts)
+            if key in pending:
+                # An update keeps its predecessor's place in the queue
+                bar = bar._replace(updated=pending[key].updated and bar.updated)
+            pending[key] = bar
+        overflow = len(pending) - self.maxsize
+        if overflow > 0:
+            for key in list(pending)[:overflow]:
+                del pending[key]
+            self._drop(overflow)
+        QUEUE_DEPTH.labels(self.name).set(len(pending))
+        if pending:
+            self._ready.set()
+
+    def _take(self) -> list[LiveBar]:
+        batch = list(self._pending.values())
+        self._pending = {}
+        return batch
+
+
+class DropOldestQueue(BarQueue):
+    """The newest `maxsize` bars; older ones are discarded when full."""
+
+    def __init__(self, name: str, maxsize: int):
+        super().__init__(name, maxsize)
+        self._pending: deque[LiveBar] = deque()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, bars: Iterable[LiveBar]) -> None:
+        self._pending.extend(bars)
+        overflow = len(self._pending) - self.maxsize
+        if overflow > 0:
+            for _ in range(overflow):
+                self._pending.popleft()
+            self._drop(overflow)
+        QUEUE_DEPTH.labels(self.name).set(len(self._pending))
+        if self._pending:
+            self._ready.set()
+
+    def _take(self) -> list[LiveBar]:
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+
+QUEUE_POLICIES: dict[str, type[BarQueue]] = {"merge": MergeQueue, "drop_oldest": DropOldestQueue}
+
+Sink = Callable[[list[LiveBar]], Awaitable[None]]
+
+
+def hot_buffer_sink(buffer: HotBarBuffer) -> Sink:
+    """Append final bars to the Redis ring buffers; corrections are left to the bars table."""
+    async def sink(bars: list[LiveBar]) -> None:
+        await buffer.append(to_arrays([bar for bar in bars if not bar.updated]))
+    return sink
+
+
+def database_sink(session_factory: Callable[[], Any], provider: str = "alpaca") -> Sink:
+    """Upsert bars into the bars table from a worker thread."""
+    def write(bars: list[LiveBar]) -> None:
+        rows = [
+            {
+                "symbol_id": bar.symbol_id,
+                "ts": datetime.fromtimestamp(bar.ts, timezone.utc),
+                **{name: getattr(bar, name) for name in FIELDS},
+            }
+            for bar in bars
+        ]
+        db = session_factory()
+        try:
+            BarIngestor(db, "1m", provider).ingest([rows])
+        finally:
+            db.close()
+
+    async def sink(bars: list[LiveBar]) -> None:
+        await asyncio.to_thread(write, bars)
+    return sink
+
+
+# ----------------------------------------------------------------- service
+
+@dataclass
+class _SinkWorker:
+    name: str
+    queue: BarQueue
+    handler: Sink | None  # None for subscriber queues read by their owner
+
+
+class LiveIngestor:
+    """
+    Subscribe to minute bars for a universe and fan them out to sinks.
+
+    `symbols` maps tickers to `symbols.id`; bars for other tickers are
+    ignored. `run()` reconnects with exponential backoff until stopped
+    after network errors, refused handshakes, dropped connections and
+    malformed handshake messages; only the feed rejecting the credentials
+    (`FeedError`) ends it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        secret: str,
+        symbols: dict[str, int],
+        frame_queue_size: int = 1000,
+        max_backoff: float = 30.0,
+    ):
+        self.url = url
+        self.key = key
+        self.secret = secret
+        self.symbols = symbols
+        self.max_backoff = max_backoff
+        self._frames: asyncio.Queue[tuple[float, bytes | str]] = asyncio.Queue(frame_queue_size)
+        self._workers: list[_SinkWorker] = []
+        self.connected = asyncio.Event()
+
+    @classmethod
+    def from_env(cls, symbols: dict[str, int], **kwargs) -> "LiveIngestor":
+        feed = os.getenv("ALPACA_DATA_FEED", "iex")
+        return cls(
+            os.getenv("ALPACA_DATA_URL", f"wss://stream.data.alpaca.markets/v2/{feed}"),
+            os.getenv("ALPACA_API_KEY_ID", ""),
+            os.getenv("ALPACA_API_SECRET_KEY", ""),
+            symbols,
+            **kwargs,
+        )
+
+    def add_sink(
+        self, name: str, handler: Sink, policy: Literal["merge", "drop_oldest"] = "merge", maxsize: int = 100_000,
+    ) -> BarQueue:
+        """Deliver bars to `handler` from its own queue; add sinks before `run()`."""
+        queue = QUEUE_POLICIES[policy](name, maxsize)
+        self._workers.append(_SinkWorker(name, queue, handler))
+        return queue
+
+    def subscribe(self, name: str = "subscriber", maxsize: int = 10_000) -> DropOldestQueue:
+        """A queue of fresh bars for an in-process consumer; read it with `get_batch()`."""
+        queue = DropOldestQueue(name, maxsize)
+        self._workers.append(_SinkWorker(name, queue, None))
+        return queue
+
+    def unsubscribe(self, queue: BarQueue) -> None:
+        self._workers = [w for w in self._workers if w.queue is not queue]
+
+    # ------------------------------------------------------------- running
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        stop = stop or asyncio.Event()
+        tasks = [asyncio.create_task(self._decode(), name="marketdata-decode")]
+        tasks += [
+            asyncio.create_task(self._deliver(w), name=f"marketdata-{w.name}")
+            for w in self._workers if w.handler is not None
+        ]
+        stopped = asyncio.create_task(stop.wait())
+        try:
+            backoff = 0.5
+            while not stop.is_set():
+                session = asyncio.create_task(self._session())
+                done, _ = await asyncio.wait({session, stopped}, return_when=asyncio.FIRST_COMPLETED)
+                if stopped in done:
+                    session.cancel()
+                    await asyncio.gather(session, return_exceptions=True)
+                    break
+                self.connected.clear()
+                try:
+                    session.result()
+                    backoff = 0.5
+                except FeedError:
+                    raise
+                except (OSError, WebSocketException, orjson.JSONDecodeError, asyncio.TimeoutError) as e:
+                    logger.warning("Market data feed disconnected: %s; retrying in %.1fs", e, backoff)
+                try:
+                    await asyncio.wait_for(stop.wait(), backoff)
+                except asyncio.TimeoutError:
+                    pass
+                backoff = min(backoff * 2, self.max_backoff)
+        finally:
+            stopped.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(stopped, *tasks, return_exceptions=True)
+
+    async def _session(self) -> None:
+        async with connect(self.url) as ws:
+            await self._expect(ws, "connected")
+            await ws.send(orjson.dumps({"action": "auth", "key": self.key, "secret": self.secret}).decode())
+            await self._expect(ws, "authenticated")
+            await ws.send(orjson.dumps({"action": "subscribe", "bars": sorted(self.symbols)}).decode())
+            self.connected.set()
+            async for frame in ws:
+                await self._frames.put((time.time(), frame))
+                QUEUE_DEPTH.labels("frames").set(self._frames.qsize())
+
+    @staticmethod
+    async def _expect(ws, msg: str) -> None:
+        for message in orjson.loads(await ws.recv()):
+            if message.get("T") == "error":
+                raise FeedError(f"{message.get('code')}: {message.get('msg')}")
+            if message.get("T") == "success" and message.get("msg") == msg:
+                return
+        raise FeedError(f"Expected {msg!r} from the feed")
+
+    async def _decode(self) -> None:
+        while True:
+            frames = [await self._frames.get()]
+            while not self._frames.empty():
+                frames.append(self._frames.get_nowait())
+            QUEUE_DEPTH.labels("frames").set(0)
+            received: list[LiveBar] = []
+            for received_at, frame in frames:
+                try:
+                    bars = self.decode(frame)
+                except (orjson.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError) as e:
+                    MESSAGES.labels("invalid").inc()
+                    logger.error("Undecodable market data frame: %s", e)
+                    continue
+                observe("received", bars, received_at)
+                received += bars
+            if not received:
+                continue
+            observe("decoded", received)
+            for worker in self._workers:
+                worker.queue.put(received)
+
+    def decode(self, frame: bytes | str) -> list[LiveBar]:
+        """Bars in one feed frame (a JSON array of messages) for known symbols."""
+        bars = []
+        for message in orjson.loads(frame):
+            kind = message.get("T")
+            MESSAGES.labels(kind or "unknown").inc()
+            if kind == "error":
+                logger.error("Market data feed error %s: %s", message.get("code"), message.get("msg"))
+                continue
+            if kind not in ("b", "u"):
+                continue
+            symbol_id = self.symbols.get(message.get("S"))
+            if symbol_id is None:
+                continue
+            ts = datetime.fromisoformat(message["t"].replace("Z", "+00:00"))
+            bars.append(LiveBar(
+                symbol_id, int(ts.timestamp()), float(message["o"]), float(message["h"]),
+                float(message["l"]), float(message["c"]), float(message["v"]), kind == "u",
+            ))
+        return bars
+
+    async def _deliver(self, worker: _SinkWorker) -> None:
+        while True:
+            bars = await worker.queue.get_batch()
+            try:
+                await worker.handler(bars)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Market data sink %s failed on %d bars", worker.name, len(bars))
+                continue
+            observe(worker.name, bars)
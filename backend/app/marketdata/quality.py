@@ -0,0 +1,245 @@
+"""
+Vectorized data-quality checks over bar arrays.
+
+`scan()` runs every check over one symbol's bars in whole-array passes
+and returns findings as runs of consecutive affected bars (or missing
+slots), never one finding per bar:
+
+- `gap`: minutes (or sessions, for daily bars) the trading calendar
+  expects but the series lacks. Bars are mapped to a global slot number
+  (minutes into the session plus all in-session minutes before it), so
+  a hole is any jump of more than one slot, overnight breaks excluded.
+- `non_positive`: a price at or below zero.
+- `ohlc`: high below open/close/low, low above them, or negative volume.
+- `spike`: a log return more than `spike_z` standard deviations from
+  the mean of the preceding `spike_window` returns. Minute returns
+  across a break (overnight, missing bars) are left out of both the
+  test and the window statistics; the break itself is a gap or an
+  expected close. A window needs half its returns to judge a move.
+
+`stale_since()` flags feeds whose newest bar is older than `stale_after`
+while the exchange is in session, for many symbols at once.
+
+`scan_range()` re-scans a just-ingested range, reading enough bars
+before it for the spike window, and persists what it finds.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import BarArrays
+from app.marketdata.calendar import TradingCalendar, get_calendar
+from app.marketdata.resample import DEFAULT_EXCHANGE
+from app.repositories.bar_repo import BarRepository
+from app.repositories.data_quality_repo import DataQualityRepository
+
+SPIKE_WINDOW = 100
+SPIKE_Z = 8.0
+STALE_AFTER = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class Finding:
+    kind: str
+    start: datetime
+    end: datetime  # last affected bar or missing slot, inclusive
+    count: int
+    detail: str
+
+
+def _utc(seconds) -> datetime:
+    return datetime.fromtimestamp(int(seconds), timezone.utc)
+
+
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Start and end (inclusive) indices of the runs of True in a boolean array."""
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+
+def _bar_runs(kind: str, mask: np.ndarray, t: np.ndarray, detail: str) -> list[Finding]:
+    starts, ends = _runs(mask)
+    return [
+        Finding(kind, _utc(t[s]), _utc(t[e]), int(e - s + 1), detail)
+        for s, e in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+class _SlotIndex:
+    """
+    Calendar slots of the sessions dated `first`..`last`.
+
+    Minute slots are numbered across sessions, so consecutive in-session
+    minutes are consecutive slots even across an overnight break. Daily
+    bars take one slot per session, matched by date.
+    """
+
+    def __init__(self, calendar: TradingCalendar, timeframe: str, first: date, last: date):
+        window = calendar.between(first, last)
+        self.daily = timeframe == "1d"
+        self.dates = calendar.dates[window]
+        self.opens, self.closes = calendar.opens[window], calendar.closes[window]
+        per_session = np.ones(len(self.opens), dtype=np.int64) if self.daily else (self.closes - self.opens) // 60
+        self.cumulative = np.concatenate(([0], np.cumsum(per_session)))
+
+    def of(self, t: np.ndarray) -> np.ndarray:
+        """Slots of in-session bars; bars outside every session are dropped."""
+        if self.daily:
+            day = t.astype("datetime64[s]").astype("datetime64[D]")
+            session = np.searchsorted(self.dates, day)
+            inside = session < len(self.dates)
+            inside[inside] = self.dates[session[inside]] == day[inside]
+            return session[inside]
+        session = np.searchsorted(self.opens, t, "right") - 1
+        inside = (session >= 0) & (t < self.closes[np.maximum(session, 0)])
+        session = session[inside]
+        return self.cumulative[session] + (t[inside] - self.opens[session]) // 60
+
+    def at_or_after(self, t: int) -> int:
+        """The first slot starting at or after epoch second `t`."""
+        if self.daily:
+            day = np.datetime64(t, "s").astype("datetime64[D]") + int(t % 86400 > 0)
+            return int(np.searchsorted(self.dates, day, "left"))
+        session = int(np.searchsorted(self.opens, t, "right")) - 1
+        if session >= 0 and t < self.closes[session]:
+            return int(self.cumulative[session] + -(-(t - self.opens[session]) // 60))
+        return int(self.cumulative[session + 1])
+
+    def start_of(self, slot: int) -> int:
+        session = int(np.searchsorted(self.cumulative, slot, "right")) - 1
+        return int(self.opens[session] + (slot - self.cumulative[session]) * (0 if self.daily else 60))
+
+
+def find_gaps(
+    t: np.ndarray, timeframe: str, calendar: TradingCalendar,
+    start: datetime | None = None, end: datetime | None = None, min_gap: int = 1,
+) -> list[Finding]:
+    """
+    Runs of at least `min_gap` missing slots in [start, end).
+
+    `t` is sorted epoch seconds; the range defaults to its first and last bar.
+    """
+    if not len(t) and (start is None or end is None):
+        return []
+    lo = int(start.timestamp()) if start is not None else int(t[0])
+    hi = int(end.timestamp()) if end is not None else int(t[-1]) + 1
+    index = _SlotIndex(
+        calendar, timeframe,
+        datetime.fromtimestamp(lo, calendar.tz).date(), datetime.fromtimestamp(hi - 1, calendar.tz).date(),
+    )
+    first, stop = index.at_or_after(lo), index.at_or_after(hi)
+    if first >= stop:
+        return []
+    slots = index.of(t)
+    present = np.unique(slots[(slots >= first) & (slots < stop)])
+    edges = np.concatenate(([first - 1], present, [stop]))
+    unit = "session" if timeframe == "1d" else "minute"
+    findings = []
+    for i in np.flatnonzero(np.diff(edges) > min_gap).tolist():
+        gap_start, gap_end = int(edges[i]) + 1, int(edges[i + 1]) - 1
+        count = gap_end - gap_start + 1
+        findings.append(Finding(
+            "gap", _utc(index.start_of(gap_start)), _utc(index.start_of(gap_end)), count, f"{count} missing {unit}{'s' * (count > 1)}",
+        ))
+    return findings
+
+
+def scan(
+    bars: BarArrays,
+    timeframe: str = "1m",
+    calendar: TradingCalendar | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    min_gap: int = 1,
+    spike_window: int = SPIKE_WINDOW,
+    spike_z: float = SPIKE_Z,
+) -> list[Finding]:
+    """
+    All checks over one symbol's bars; findings start at or after `start`.
+
+    Bars before `start` only provide context (the spike window).
+    """
+    calendar = calendar or get_calendar(DEFAULT_EXCHANGE)
+    t = bars.ts.astype("datetime64[s]").astype(np.int64)
+    scanned = np.ones(len(t), dtype=bool) if start is None else t >= int(start.timestamp())
+    findings: list[Finding] = []
+
+    prices = np.stack([bars.open, bars.high, bars.low, bars.close])
+    findings += _bar_runs("non_positive", (prices <= 0).any(axis=0) & scanned, t, "price at or below zero")
+
+    inconsistent = (
+        (bars.high < np.maximum.reduce([bars.open, bars.close, bars.low]))
+        | (bars.low > np.minimum.reduce([bars.open, bars.close, bars.high]))
+        | (bars.volume < 0)
+    )
+    findings += _bar_runs("ohlc", inconsistent & scanned, t, "high/low do not bound open/close, or volume < 0")
+
+    if len(t) > spike_window + 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(np.log(bars.close))
+        # Returns across a break (overnight, missing bars) are neither tested nor counted
+        contiguous = np.ones(len(returns), dtype=bool) if timeframe == "1d" else np.diff(t) == 60
+        counted = np.isfinite(returns) & contiguous
+        returns = np.where(counted, returns, 0.0)
+        # Mean and std of the counted returns among the `spike_window` before each return, via prefix sums
+        s0 = np.concatenate(([0], np.cumsum(counted)))
+        s1 = np.concatenate(([0.0], np.cumsum(returns)))
+        s2 = np.concatenate(([0.0], np.cumsum(returns * returns)))
+        n = spike_window
+        k = s0[n:-1] - s0[:-n - 1]
+        # Windows mostly made of breaks are too thin to judge a move by
+        enough = k >= max(2, n // 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = (s1[n:-1] - s1[:-n - 1]) / k
+            var = np.maximum((s2[n:-1] - s2[:-n - 1]) / k - mean * mean, 0.0)
+        std = np.sqrt(var)
+        # A flat window has no meaningful z-score; any move out of it would be infinite
+        spike = np.zeros(len(t), dtype=bool)
+        spike[n + 1:] = counted[n:] & enough & (std > 1e-9) & (np.abs(returns[n:] - mean) > spike_z * std)
+        findings += _bar_runs("spike", spike & scanned, t, f"return beyond {spike_z:g} sigma")
+
+    gap_start = start if start is not None else (_utc(t[0]) if len(t) else None)
+    findings += find_gaps(t[scanned], timeframe, calendar, gap_start, end, min_gap)
+
+    return findings
+
+
+def stale_since(
+    last_bars: dict[int, datetime], now: datetime, calendar: TradingCalendar | None = None,
+    stale_after: timedelta = STALE_AFTER,
+) -> dict[int, datetime]:
+    """
+    Symbols whose newest minute bar is older than `stale_after`, while in session.
+
+    Returns the time each went quiet (its last bar's close). Outside
+    sessions nothing is stale.
+    """
+    calendar = calendar or get_calendar(DEFAULT_EXCHANGE)
+    if not last_bars or not calendar.is_open(now):
+        return {}
+    ids = np.fromiter(last_bars, dtype=np.int64, count=len(last_bars))
+    quiet = np.array(
+        [(ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp() + 60 for ts in last_bars.values()]
+    )
+    stale = now.timestamp() - quiet > stale_after.total_seconds()
+    return {int(i): _utc(q) for i, q in zip(ids[stale].tolist(), quiet[stale].tolist())}
+
+
+def scan_range(
+    db: Session, symbol_id: int, timeframe: str, start: datetime, end: datetime, **options,
+) -> list[Finding]:
+    """
+    Scan one symbol's bars in [start, end) and replace its findings there.
+
+    Bars before `start` are read as spike-window context: four calendar
+    days of minutes cover a long weekend, two days per session for daily bars.
+    """
+    window = options.get("spike_window", SPIKE_WINDOW) + 1
+    context = timedelta(days=2 * window) if timeframe == "1d" else timedelta(days=4)
+    bars = BarRepository(db).read_range(symbol_id, timeframe, start - context, end)
+    findings = scan(bars, timeframe, start=start, end=end, **options)
+    DataQualityRepository(db).record(symbol_id, timeframe, start, end, findings)
+    return findings
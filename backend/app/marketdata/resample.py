@@ -0,0 +1,110 @@
+"""
+Session-aware resampling of minute bars into coarser timeframes.
+
+Bars outside trading-calendar sessions (extended hours, holidays) are
+dropped and buckets never cross a session boundary: hourly bars are
+anchored at the open, so the last one of a 09:30-16:00 session covers
+15:30-16:00 and an early close cuts its last bucket short. Every bucket
+is reduced in one pass per column with `np.ufunc.reduceat` over the
+bucket start offsets (first open, max high, min low, last close, summed
+volume).
+Bars are labelled with the start of their bucket; daily bars with the
+session open.
+"""
+from __future__ import annotations
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import FIELDS, BarArrays, SeriesCache
+from app.marketdata.calendar import get_calendar
+from app.repositories.bar_repo import BarRepository
+
+# Bucket width in seconds; None means one bar per session
+TIMEFRAMES: dict[str, int | None] = {
+    "1m": 60, "5m": 300, "15m": 900, "30m": 1800, "1h": 3600, "1d": None,
+}
+
+# Symbols carry no exchange; minute bars are bucketed on this calendar
+DEFAULT_EXCHANGE = os.getenv("DEFAULT_EXCHANGE", "NYSE")
+
+
+def sessions_for(ts: np.ndarray, exchange: str = DEFAULT_EXCHANGE) -> tuple[np.ndarray, np.ndarray]:
+    """Sessions covering a datetime64[s] array, padded a day either side for time zones."""
+    first = ts[0].astype(datetime).date() - timedelta(days=1)
+    last = ts[-1].astype(datetime).date() + timedelta(days=1)
+    return get_calendar(exchange).session_arrays(first, last)
+
+
+def resample(
+    bars: BarArrays, timeframe: str, sessions: tuple[np.ndarray, np.ndarray] | None = None,
+) -> BarArrays:
+    """
+    Aggregate minute bars into `timeframe` buckets within each session.
+
+    `sessions` is a pair of sorted open/close epoch-second arrays; by
+    default the sessions of the DEFAULT_EXCHANGE trading calendar.
+    """
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unsupported timeframe {timeframe!r}; expected one of {', '.join(TIMEFRAMES)}")
+    if not len(bars):
+        return BarArrays.empty()
+    opens, closes = sessions if sessions is not None else sessions_for(bars.ts)
+    if not len(opens):
+        return BarArrays.empty()
+    t = bars.ts.astype(np.int64)
+
+    session = np.searchsorted(opens, t, "right") - 1
+    inside = (session >= 0) & (t < closes[np.maximum(session, 0)])
+    if not inside.all():
+        t, session = t[inside], session[inside]
+        bars = BarArrays(*(getattr(bars, name)[inside] for name in ("ts", *FIELDS)))
+        if not len(t):
+            return BarArrays.empty()
+
+    width = TIMEFRAMES[timeframe]
+    if width is None:
+        change = session[1:] != session[:-1]
+        labels = opens[session]
+    else:
+        offset = (t - opens[session]) // width
+        change = (session[1:] != session[:-1]) | (offset[1:] != offset[:-1])
+        labels = opens[session] + offset * width
+    starts = np.flatnonzero(np.concatenate(([True], change)))
+    ends = np.append(starts[1:], len(t)) - 1
+
+    return BarArrays(
+        labels[starts].astype("datetime64[s]"),
+        bars.open[starts],
+        np.maximum.reduceat(bars.high, starts),
+        np.minimum.reduceat(bars.low, starts),
+        bars.close[ends],
+        np.add.reduceat(bars.volume, starts),
+    )
+
+
+resample_cache = SeriesCache(maxsize=int(os.getenv("RESAMPLE_CACHE_SIZE", "256")))
+
+
+def read_bars(
+    db: Session, symbol_id: int, timeframe: str, start: datetime | None = None, end: datetime | None = None,
+) -> BarArrays:
+    """
+    Bars of one symbol in any timeframe, resampled from stored minute bars.
+
+    `start`/`end` bound the minute bars read, so a bucket cut by either
+    edge is partial. `1m` is returned as stored, extended hours included.
+    """
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unsupported timeframe {timeframe!r}; expected one of {', '.join(TIMEFRAMES)}")
+    key = (symbol_id, timeframe, start, end)
+    bars = resample_cache.get(key)
+    if bars is None:
+        generation = resample_cache.generation(symbol_id)
+        bars = BarRepository(db).read_range(symbol_id, "1m", start, end)
+        if timeframe != "1m":
+            bars = resample(bars, timeframe)
+        resample_cache.put(key, bars, generation)
+    return bars
@@ -0,0 +1,208 @@
+"""
+Local columnar bar cache for backtests.
+
+Each series (symbol id, timeframe) is a directory of one `.npy` file per
+column: `<root>/<timeframe>/<symbol_id>/{ts,open,high,low,close,volume}.npy`.
+Reads open the files with `mmap_mode="r"`, so range slicing touches only
+the pages it returns. Appends write the new values in place after the
+existing data and then rewrite the fixed-size `.npy` header with the new
+length. `ts.npy` is written last and its length is the length of the
+series, so an interrupted append leaves the previous bars readable.
+
+`symbols.json` at the root maps tickers to `symbols.id`.
+"""
+from __future__ import annotations
+import io
+import json
+import os
+import threading
+from datetime import timezone
+from pathlib import Path
+
+import numpy as np
+from numpy.lib import format as npy
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import FIELDS, STORED_TIMEFRAMES, BarArrays
+from app.models.symbol import Symbol
+from app.repositories.bar_repo import BarRepository
+
+COLUMNS = ("ts", *FIELDS)
+DTYPES = {"ts": np.dtype("datetime64[s]"), **{name: np.dtype(np.float64) for name in FIELDS}}
+DEFAULT_ROOT = os.getenv("BAR_STORE_DIR", "data/bars")
+
+
+def _save(path: Path, values: np.ndarray) -> None:
+    """Replace a file atomically; readers keep their mapping of the old one."""
+    tmp = path.with_suffix(".tmp.npy")
+    np.save(tmp, values)
+    os.replace(tmp, path)
+
+
+def _append_npy(path: Path, values: np.ndarray, at: int) -> None:
+    """
+    Write `values` into a 1-D .npy file from element `at` on, in place.
+
+    `at` is the series length according to `ts.npy`; anything a failed
+    earlier append left past it is overwritten.
+    """
+    if not path.exists() or at == 0:
+        _save(path, values)
+        return
+    with open(path, "r+b") as f:
+        version = npy.read_magic(f)
+        read_header, write_header = (
+            (npy.read_array_header_1_0, npy.write_array_header_1_0) if version == (1, 0)
+            else (npy.read_array_header_2_0, npy.write_array_header_2_0)
+        )
+        shape, fortran, dtype = read_header(f)
+        offset = f.tell()
+        if values.dtype != dtype or len(shape) != 1:
+            raise ValueError(f"{path}: cannot append {values.dtype} to {dtype}{shape}")
+        header = io.BytesIO()
+        write_header(header, {
+            "descr": npy.dtype_to_descr(dtype), "fortran_order": fortran, "shape": (at + len(values),),
+        })
+        if header.tell() != offset:
+            # Header grew (file written without growth padding): rewrite it
+            f.seek(offset)
+            existing = np.frombuffer(f.read(at * dtype.itemsize), dtype=dtype)
+            _save(path, np.concatenate([existing, values]))
+            return
+        f.seek(offset + at * dtype.itemsize)
+        f.write(values.tobytes())
+        f.flush()
+        f.seek(0)
+        f.write(header.getvalue())
+
+
+class BarStore:
+    """
+    Memory-mapped bar series on local disk, built from the bars table.
+
+    Symbols are addressed by `symbols.id` or ticker. Open memmaps are
+    cached per series and dropped when the series is appended to.
+    """
+
+    def __init__(self, root: str | os.PathLike = DEFAULT_ROOT):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._maps: dict[tuple[int, str], BarArrays] = {}
+        self._tickers: dict[str, int] | None = None
+
+    # ---------------------------------------------------------------- index
+
+    @property
+    def _index_path(self) -> Path:
+        return self.root / "symbols.json"
+
+    def tickers(self) -> dict[str, int]:
+        if self._tickers is None:
+            try:
+                self._tickers = json.loads(self._index_path.read_text())
+            except FileNotFoundError:
+                self._tickers = {}
+        return self._tickers
+
+    def register(self, tickers: dict[str, int]) -> None:
+        """Merge ticker -> symbols.id entries into the index."""
+        merged = {**self.tickers(), **tickers}
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(merged, sort_keys=True))
+        os.replace(tmp, self._index_path)
+        self._tickers = merged
+
+    def resolve(self, symbol: int | str) -> int:
+        if isinstance(symbol, int):
+            return symbol
+        try:
+            return self.tickers()[symbol]
+        except KeyError:
+            raise KeyError(f"Unknown symbol {symbol!r}") from None
+
+    def symbol_ids(self, timeframe: str) -> list[int]:
+        """Ids of every series stored for a timeframe."""
+        path = self.root / timeframe
+        if not path.is_dir():
+            return []
+        return sorted(int(p.name) for p in path.iterdir() if (p / "ts.npy").exists())
+
+    # ---------------------------------------------------------------- reads
+
+    def _dir(self, symbol_id: int, timeframe: str) -> Path:
+        if timeframe not in STORED_TIMEFRAMES:
+            raise ValueError(f"Unsupported timeframe {timeframe!r}")
+        return self.root / timeframe / str(symbol_id)
+
+    def _open(self, symbol_id: int, timeframe: str) -> BarArrays:
+        key = (symbol_id, timeframe)
+        with self._lock:
+            bars = self._maps.get(key)
+            if bars is None:
+                path = self._dir(symbol_id, timeframe)
+                if not (path / "ts.npy").exists():
+                    return BarArrays.empty()
+                ts = np.load(path / "ts.npy", mmap_mode="r")
+                # Columns may run past ts after an interrupted append; ts is authoritative
+                bars = BarArrays(ts, *(np.load(path / f"{name}.npy", mmap_mode="r")[:len(ts)] for name in FIELDS))
+                self._maps[key] = bars
+            return bars
+
+    def read(
+        self, symbol: int | str, timeframe: str,
+        start: np.datetime64 | None = None, end: np.datetime64 | None = None,
+    ) -> BarArrays:
+        """Bars with start <= ts < end as read-only views of the mapped files."""
+        return self._open(self.resolve(symbol), timeframe).between(start, end)
+
+    def last_ts(self, symbol_id: int, timeframe: str) -> np.datetime64 | None:
+        ts = self._open(symbol_id, timeframe).ts
+        return ts[-1] if len(ts) else None
+
+    # --------------------------------------------------------------- writes
+
+    def append(self, symbol_id: int, timeframe: str, bars: BarArrays) -> int:
+        """
+        Append bars newer than the last stored bar; returns how many were written.
+
+        `bars` must be in time order. Bars at or before the stored end are
+        ignored, so re-running a sync is harmless.
+        """
+        if len(bars) > 1 and not (np.diff(bars.ts.astype(np.int64)) > 0).all():
+            raise ValueError("Bars must be strictly increasing in ts")
+        stored = self._open(symbol_id, timeframe).ts
+        if len(stored):
+            bars = bars.between(stored[-1] + np.timedelta64(1, "s"))
+        if not len(bars):
+            return 0
+        path = self._dir(symbol_id, timeframe)
+        path.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._maps.pop((symbol_id, timeframe), None)
+            for name in (*FIELDS, "ts"):
+                _append_npy(
+                    path / f"{name}.npy", np.ascontiguousarray(getattr(bars, name), dtype=DTYPES[name]), len(stored),
+                )
+        return len(bars)
+
+    def sync(self, db: Session, timeframe: str, symbol_ids: list[int] | None = None) -> dict[int, int]:
+        """
+        Build or extend the store from the bars table.
+
+        Each series is read from the DB only from its last stored bar on.
+        Returns the number of bars appended per symbol id.
+        """
+        stmt = select(Symbol.symbol, Symbol.id)
+        if symbol_ids is not None:
+            stmt = stmt.where(Symbol.id.in_(symbol_ids))
+        tickers = dict(db.execute(stmt).all())
+        self.register(tickers)
+        repo = BarRepository(db)
+        appended = {}
+        for symbol_id in sorted(tickers.values()):
+            last = self.last_ts(symbol_id, timeframe)
+            start = None if last is None else (last + np.timedelta64(1, "s")).astype(object).replace(tzinfo=timezone.utc)
+            appended[symbol_id] = self.append(symbol_id, timeframe, repo.read_range(symbol_id, timeframe, start=start))
+        return appended
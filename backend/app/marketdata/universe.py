@@ -0,0 +1,94 @@
+"""
+Universe selection: the most liquid symbols by average daily dollar volume.
+
+`rank_universe()` ranks every symbol from one flat array of daily bars,
+ordered by symbol then time, so each symbol is a contiguous run reduced
+with `np.add.reduceat`: ADV is the mean of close * volume over the
+window (dollar volume is unaffected by splits inside the window), the
+price filter uses the last close, and symbols with too few bars in the
+window are dropped. The window is counted in trading-calendar sessions
+before `as_of`, so a selection only uses data known at that day's open.
+
+`build_universe()` stores the result as the next version of a named
+universe and can make it the set of active symbols.
+"""
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.marketdata.calendar import get_calendar
+from app.marketdata.resample import DEFAULT_EXCHANGE
+from app.models.universe import UniverseSnapshot
+from app.repositories.universe_repo import UniverseRepository
+
+
+@dataclass(frozen=True)
+class UniverseRules:
+    top_n: int = 500
+    lookback_days: int = 63  # sessions, about three months
+    min_price: float = 5.0
+    min_adv: float = 0.0  # dollars per day
+    min_coverage: float = 0.8  # share of lookback sessions with a bar
+
+
+@dataclass(frozen=True)
+class Selection:
+    """Selected symbols in rank order (highest ADV first)."""
+    symbol_ids: np.ndarray
+    adv: np.ndarray
+    price: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbol_ids)
+
+
+def rank_universe(
+    symbol_ids: np.ndarray, close: np.ndarray, volume: np.ndarray, sessions: int, rules: UniverseRules,
+) -> Selection:
+    """
+    Rank symbols from daily bars grouped by symbol (contiguous runs, time order).
+
+    `sessions` is the number of sessions in the window, for the coverage rule.
+    """
+    if not len(symbol_ids):
+        empty = np.empty(0)
+        return Selection(np.empty(0, dtype=np.int64), empty, empty)
+    starts = np.flatnonzero(np.concatenate(([True], symbol_ids[1:] != symbol_ids[:-1])))
+    counts = np.diff(np.append(starts, len(symbol_ids)))
+    adv = np.add.reduceat(close * volume, starts) / counts
+    price = close[starts + counts - 1]
+    ids = symbol_ids[starts]
+
+    eligible = (
+        (price >= rules.min_price)
+        & (adv >= rules.min_adv)
+        & (counts >= math.ceil(rules.min_coverage * sessions))
+    )
+    ids, adv, price = ids[eligible], adv[eligible], price[eligible]
+    # Highest ADV first; ties go to the lower symbol id so reruns are stable
+    order = np.lexsort((ids, -adv))[:rules.top_n]
+    return Selection(ids[order], adv[order], price[order])
+
+
+def lookback_start(as_of: date, sessions: int, exchange: str = DEFAULT_EXCHANGE) -> tuple[date, int]:
+    """First session date of the `sessions` sessions before `as_of`, and how many there are."""
+    calendar = get_calendar(exchange)
+    end = int(np.searchsorted(calendar.dates, np.datetime64(as_of, "D"), "left"))
+    start = max(end - sessions, 0)
+    if start == end:
+        return as_of, 0
+    return calendar.dates[start].astype(date), end - start
+
+
+def build_universe(
+    db: Session, name: str, as_of: date, rules: UniverseRules = UniverseRules(), activate: bool = False,
+) -> tuple[UniverseSnapshot, Selection]:
+    """Select, store as the next version of `name`, and optionally activate it."""
+    repo = UniverseRepository(db)
+    start, sessions = lookback_start(as_of, rules.lookback_days)
+    selection = rank_universe(*repo.daily_window(start, as_of), sessions, rules)
+    return repo.create_snapshot(name, as_of, rules, selection, activate), selection
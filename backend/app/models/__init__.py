@@ -2,5 +2,10 @@ from app.models.strategy import Strategy
 from app.models.asset import Asset
 from app.models.symbol import Symbol
 from app.models.order import Order
+from app.models.position import Position
+from app.models.bar import Bar
+from app.models.corporate_action import CorporateAction
+from app.models.data_quality_issue import DataQualityIssue
+from app.models.universe import UniverseSnapshot, UniverseMember
 
-__all__ = ["Strategy", "Asset", "Symbol", "Order"]
\ No newline at end of file
+__all__ = ["Strategy", "Asset", "Symbol", "Order", "Position", "Bar", "CorporateAction", "DataQualityIssue", "UniverseSnapshot", "UniverseMember"]
\ No newline at end of file
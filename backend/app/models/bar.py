@@ -0,0 +1,26 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Double, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class Bar(Base):
+    """
+    One OHLCV bar. Stored timeframes are `1m` and `1d`; coarser ones are
+    resampled on read. The primary key doubles as the range-read index.
+    """
+    __tablename__ = "bars"
+
+    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id", ondelete="CASCADE"), primary_key=True)
+    timeframe: Mapped[str] = mapped_column(String(8), primary_key=True)
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    open: Mapped[float] = mapped_column(Double, nullable=False)
+    high: Mapped[float] = mapped_column(Double, nullable=False)
+    low: Mapped[float] = mapped_column(Double, nullable=False)
+    close: Mapped[float] = mapped_column(Double, nullable=False)
+    volume: Mapped[float] = mapped_column(Double, nullable=False)
+    provider: Mapped[str] = mapped_column(String(32), nullable=False)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import String, DateTime, Double, ForeignKey, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class CorporateAction(Base):
+    """
+    A split or cash dividend effective at `ts` (the ex-date).
+
+    `factor` multiplies prices of bars before `ts` to make them comparable
+    with prices after it: 1/ratio for a split, 1 - cash/prior close for a
+    dividend. Stored bars are never rewritten; adjustment happens on read.
+    """
+    __tablename__ = "corporate_actions"
+    __table_args__ = (UniqueConstraint("symbol_id", "ts", "type", name="uq_corporate_actions_symbol_ts_type"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id", ondelete="CASCADE"), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    type: Mapped[str] = mapped_column(String(16), nullable=False)
+    ratio: Mapped[float | None] = mapped_column(Double)
+    cash: Mapped[float | None] = mapped_column(Double)
+    factor: Mapped[float] = mapped_column(Double, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
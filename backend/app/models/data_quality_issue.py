@@ -0,0 +1,31 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import Index, String, DateTime, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class DataQualityIssue(Base):
+    """
+    A run of bad or missing bars found by the data-quality scanner.
+
+    `kind` is one of gap, non_positive, ohlc, spike or stale; `start_ts`
+    and `end_ts` are the first and last affected bar (or missing slot),
+    and `count` how many there are. Re-scanning a range replaces the
+    issues that start inside it, so fixed data clears its findings.
+    """
+    __tablename__ = "data_quality_issues"
+    __table_args__ = (Index("ix_data_quality_issues_symbol_tf_start", "symbol_id", "timeframe", "start_ts"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id", ondelete="CASCADE"), nullable=False)
+    timeframe: Mapped[str] = mapped_column(String(8), nullable=False)
+    kind: Mapped[str] = mapped_column(String(16), nullable=False)
+    start_ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    detail: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    detected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
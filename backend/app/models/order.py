@@ -66,6 +66,7 @@ class Order(Base):
         UniqueConstraint("account_id", "client_order_id", name="uq_orders_account_client_order_id"),
         Index("ix_orders_created_symbol_status", "created_at", "symbol_id", "status"),
         Index("ix_orders_broker_broker_order_id", "broker", "broker_order_id"),
+        Index("ix_orders_filled_at", "filled_at"),
     )
 
     # Primary key
@@ -0,0 +1,38 @@
+from __future__ import annotations
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import Numeric, DateTime, UniqueConstraint, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.db import Base
+
+
+class Position(Base):
+    """Net position per account and symbol, maintained incrementally from fills."""
+    __tablename__ = "positions"
+
+    __table_args__ = (
+        # Positions without an account are one book per symbol, not one per fill
+        UniqueConstraint(
+            "account_id", "symbol_id", name="uq_positions_account_symbol", postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_positions_symbol", "symbol_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    account_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    symbol_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+
+    qty: Mapped[Decimal] = mapped_column(Numeric(28, 10), nullable=False, default=Decimal("0"))
+    avg_price: Mapped[Decimal] = mapped_column(Numeric(28, 10), nullable=False, default=Decimal("0"))
+    realized_pnl: Mapped[Decimal] = mapped_column(Numeric(28, 10), nullable=False, default=Decimal("0"))
+    # Marked to the last fill price until live prices are wired in
+    mark_price: Mapped[Decimal | None] = mapped_column(Numeric(28, 10), nullable=True)
+    unrealized_pnl: Mapped[Decimal | None] = mapped_column(Numeric(28, 10), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from datetime import date, datetime
+
+from sqlalchemy import String, Date, DateTime, Double, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class UniverseSnapshot(Base):
+    """
+    One selection run of a named universe.
+
+    Versions count up per name and snapshots are never rewritten, so a
+    backtest can pin the universe it ran on. The selection rules are
+    stored with it.
+    """
+    __tablename__ = "universe_snapshots"
+    __table_args__ = (UniqueConstraint("name", "version", name="uq_universe_snapshots_name_version"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(32), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    as_of: Mapped[date] = mapped_column(Date, nullable=False)
+    top_n: Mapped[int] = mapped_column(Integer, nullable=False)
+    lookback_days: Mapped[int] = mapped_column(Integer, nullable=False)
+    min_price: Mapped[float] = mapped_column(Double, nullable=False)
+    min_adv: Mapped[float] = mapped_column(Double, nullable=False)
+    min_coverage: Mapped[float] = mapped_column(Double, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class UniverseMember(Base):
+    """A symbol selected into a snapshot, with the figures it was ranked on."""
+    __tablename__ = "universe_members"
+
+    snapshot_id: Mapped[int] = mapped_column(ForeignKey("universe_snapshots.id", ondelete="CASCADE"), primary_key=True)
+    symbol_id: Mapped[int] = mapped_column(ForeignKey("symbols.id", ondelete="CASCADE"), primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer, nullable=False)
+    adv: Mapped[float] = mapped_column(Double, nullable=False)
+    price: Mapped[float] = mapped_column(Double, nullable=False)
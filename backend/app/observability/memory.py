@@ -0,0 +1,207 @@
+from __future__ import annotations
+import gc
+import itertools
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, OrderedDict
+from typing import Any, Iterable
+
+from prometheus_client import Histogram
+
+REQUEST_PEAK_MEMORY = Histogram(
+    "http_request_peak_memory_bytes",
+    "Traced memory high-water mark above the starting point, per request.",
+    ["method", "route"],
+    buckets=(16e3, 64e3, 256e3, 1e6, 4e6, 16e6, 64e6, 256e6),
+)
+
+# Allocation sites inside these files are bookkeeping, not application memory
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+DEFAULT_TRACKED_TYPES = ("Order", "OrderRead")
+
+
+def object_counts(type_names: Iterable[str] = DEFAULT_TRACKED_TYPES) -> dict[str, int]:
+    """Live gc-tracked instances per class name. Walks the whole heap; debug use only."""
+    wanted = set(type_names)
+    counts = Counter(
+        name for name in (type(o).__name__ for o in gc.get_objects()) if name in wanted
+    )
+    return {name: counts.get(name, 0) for name in sorted(wanted)}
+
+
+def rss_peak_bytes() -> int:
+    """Process max RSS (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryTracker:
+    """
+    tracemalloc snapshots and per-route peaks for leak hunting.
+
+    Tracing is off until started (TRACEMALLOC_FRAMES at boot or
+    `start()`), since it roughly doubles allocation cost. Only the last
+    few snapshots are kept because each one holds every live traceback.
+    """
+
+    def __init__(self, max_snapshots: int = 5):
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[int, tuple[float, tracemalloc.Snapshot]] = OrderedDict()
+        self._ids = itertools.count(1)
+        self._route_peaks: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 10) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+            self._route_peaks.clear()
+
+    def _take(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise ValueError("tracemalloc is not tracing; start it first")
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def snapshot(self) -> int:
+        """Take and keep a filtered snapshot; the oldest is dropped past the limit."""
+        snap = self._take()
+        with self._lock:
+            snapshot_id = next(self._ids)
+            self._snapshots[snapshot_id] = (time.time(), snap)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return snapshot_id
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        with self._lock:
+            items = list(self._snapshots.items())
+        return [
+            {"id": sid, "taken_at": taken, "traced_bytes": sum(s.size for s in snap.statistics("filename"))}
+            for sid, (taken, snap) in items
+        ]
+
+    def diff(self, old_id: int, new_id: int | None = None, limit: int = 20, key_type: str = "lineno") -> list[dict[str, Any]]:
+        """
+        Allocation sites that grew the most between two snapshots.
+
+        Without `new_id` the comparison is against the heap right now, using
+        a snapshot that is not kept, so it cannot evict `old_id`.
+        """
+        with self._lock:
+            old = self._snapshots.get(old_id)
+            new = self._snapshots.get(new_id) if new_id is not None else None
+        if old is None or (new_id is not None and new is None):
+            raise KeyError(old_id if old is None else new_id)
+        current = new[1] if new is not None else self._take()
+        stats = current.compare_to(old[1], key_type)
+        return [
+            {
+                "site": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+                "size_diff": stat.size_diff,
+                "size": stat.size,
+                "count_diff": stat.count_diff,
+                "count": stat.count,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def record_peak(self, route: str, peak: int) -> None:
+        with self._lock:
+            if peak > self._route_peaks.get(route, 0):
+                self._route_peaks[route] = peak
+
+    def route_peaks(self) -> dict[str, int]:
+        with self._lock:
+            return dict(sorted(self._route_peaks.items(), key=lambda item: item[1], reverse=True))
+
+    def status(self, type_names: Iterable[str] = DEFAULT_TRACKED_TYPES) -> dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory() if self.tracing else (0, 0)
+        return {
+            "tracing": self.tracing,
+            "traced_current_bytes": current,
+            "traced_peak_bytes": peak,
+            "rss_peak_bytes": rss_peak_bytes(),
+            "gc_counts": gc.get_count(),
+            "objects": object_counts(type_names),
+            "route_peaks": self.route_peaks(),
+            "snapshots": self.snapshots(),
+        }
+
+
+memory_tracker = MemoryTracker()
+if os.getenv("TRACEMALLOC_FRAMES"):
+    memory_tracker.start(int(os.getenv("TRACEMALLOC_FRAMES", "10")))
+
+
+class _InFlight:
+    __slots__ = ("start", "peak")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.peak = start
+
+
+class MemoryMiddleware:
+    """
+    Record the traced-memory high-water mark of each request.
+
+    Active only while tracemalloc is tracing. The peak counter is process
+    wide and every request resets it, so before each reset the peak so far
+    is credited to all requests in flight; nothing is lost, but under
+    concurrency a request's figure includes whatever its neighbours
+    allocated at the same time. Worst-case per route is still a good
+    regression signal.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._in_flight: set[_InFlight] = set()
+        self._lock = threading.Lock()
+
+    def _harvest_locked(self) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        for request in self._in_flight:
+            request.peak = max(request.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+
+        with self._lock:
+            request = _InFlight(self._harvest_locked())
+            self._in_flight.add(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            with self._lock:
+                self._in_flight.discard(request)
+                if tracemalloc.is_tracing():
+                    _, peak = tracemalloc.get_traced_memory()
+                    request.peak = max(request.peak, peak)
+                    self._harvest_locked()
+            if tracemalloc.is_tracing():
+                route = getattr(scope.get("route"), "path", None) or "unmatched"
+                grown = max(request.peak - request.start, 0)
+                REQUEST_PEAK_MEMORY.labels(scope["method"], route).observe(grown)
+                memory_tracker.record_peak(f"{scope['method']} {route}", grown)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+import functools
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from fastapi import Response
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+from app.observability.sql import statement_verb
+from app.observability.tracing import traced
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Latency buckets tuned for an API whose hot paths sit in the low milliseconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request.",
+    ["method", "route"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL statements per HTTP request.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+)
+REPOSITORY_DURATION = Histogram(
+    "repository_operation_duration_seconds",
+    "Repository call latency.",
+    ["repository", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+REPOSITORY_QUERIES = Histogram(
+    "repository_operation_db_queries",
+    "SQL statements executed per repository call.",
+    ["repository", "operation"],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REPOSITORY_DB_TIME = Histogram(
+    "repository_operation_db_seconds",
+    "Time spent in SQL statements per repository call.",
+    ["repository", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement latency by statement verb.",
+    ["verb"],
+    buckets=LATENCY_BUCKETS,
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Connections currently checked out of the pool.",
+)
+POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts",
+    "Connections handed out by the pool.",
+)
+
+
+@dataclass
+class QueryStats:
+    """SQL statement count and time accumulated for one request or call."""
+    queries: int = 0
+    db_seconds: float = 0.0
+    # Statement texts, kept only when a caller asks for them
+    statements: list[str] | None = None
+
+
+# Every active collector (request, repository call) sees each statement.
+# The tuple holds mutable objects so that statements executed in a copied
+# context (sync routes run in the threadpool) still reach the request.
+_collectors: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_collectors", default=())
+_in_repository: ContextVar[bool] = ContextVar("in_repository_call", default=False)
+
+
+class collect_queries:
+    """Context manager counting SQL statements executed inside the block."""
+
+    def __init__(self, keep_statements: bool = False):
+        self.keep_statements = keep_statements
+
+    def __enter__(self) -> QueryStats:
+        self.stats = QueryStats(statements=[] if self.keep_statements else None)
+        self._token = _collectors.set(_collectors.get() + (self.stats,))
+        return self.stats
+
+    def __exit__(self, *exc) -> None:
+        _collectors.reset(self._token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    DB_STATEMENT_DURATION.labels(statement_verb(statement)).observe(elapsed)
+    for stats in _collectors.get():
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if stats.statements is not None:
+            stats.statements.append(statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # Keep the timing stack balanced when a statement fails
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+@event.listens_for(Pool, "checkout")
+def _pool_checkout(dbapi_conn, connection_record, connection_proxy):
+    POOL_CHECKED_OUT.inc()
+    POOL_CHECKOUTS.inc()
+
+
+@event.listens_for(Pool, "checkin")
+def _pool_checkin(dbapi_conn, connection_record):
+    POOL_CHECKED_OUT.dec()
+
+
+def instrumented(operation: str) -> Callable[[F], F]:
+    """
+    Record latency, statement count and DB time of a repository method,
+    and trace it as a span when tracing is enabled.
+
+    Only the outermost instrumented call is recorded, so an override that
+    delegates to `super()` or a method built from other repository calls
+    is measured once, under its own operation name.
+    """
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if _in_repository.get():
+                return fn(self, *args, **kwargs)
+            repository = type(self).__name__
+            flag = _in_repository.set(True)
+            start = time.perf_counter()
+            try:
+                with traced(f"{repository}.{operation}"), collect_queries() as stats:
+                    return fn(self, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                _in_repository.reset(flag)
+                labels = (repository, operation)
+                REPOSITORY_DURATION.labels(*labels).observe(elapsed)
+                REPOSITORY_QUERIES.labels(*labels).observe(stats.queries)
+                REPOSITORY_DB_TIME.labels(*labels).observe(stats.db_seconds)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency, statement count and DB time.
+
+    Requests are labelled with the matched route template (`/orders/{order_id}`)
+    rather than the raw path to keep label cardinality bounded; requests that
+    match no route are labelled `unmatched`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc()
+        start = time.perf_counter()
+        try:
+            with collect_queries() as stats:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_PROGRESS.dec()
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            REQUEST_DURATION.labels(method, template, str(status_code)).observe(elapsed)
+            REQUEST_QUERIES.labels(method, template).observe(stats.queries)
+            REQUEST_DB_TIME.labels(method, template).observe(stats.db_seconds)
+
+
+def metrics_response() -> Response:
+    """Render the default registry in the Prometheus text format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
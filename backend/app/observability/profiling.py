@@ -0,0 +1,233 @@
+from __future__ import annotations
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from app.api.deps import debug_endpoints_enabled
+
+PROFILE_HEADER = "x-debug-profile"
+
+# Leaf frames that mean "this thread is parked", not working for a request
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("base_events.py", "_run_once"),
+    ("thread.py", "_worker"),
+}
+
+
+# Sampler threads never profile themselves or each other
+_sampler_threads: set[int] = set()
+
+
+def _frame_key(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{code.co_name}:{frame.f_lineno}"
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES
+
+
+def _component(frame) -> str:
+    """Bucket a leaf frame by package, splitting SQLAlchemy into ORM and engine."""
+    module = frame.f_globals.get("__name__", "?")
+    parts = module.split(".")
+    if parts[0] == "sqlalchemy" and len(parts) > 1:
+        return f"sqlalchemy.{parts[1]}"
+    return parts[0]
+
+
+class StackSampler:
+    """
+    Statistical profiler sampling every thread's Python stack.
+
+    Sync routes run in the threadpool while middleware runs on the event
+    loop, so a per-thread profiler such as cProfile would only see half of
+    a request. Instead a daemon thread snapshots `sys._current_frames()`
+    at a fixed interval and drops threads parked in known idle frames.
+    Concurrent requests are sampled too, so profiles are clearest when the
+    request is reproduced on an otherwise quiet worker.
+    """
+
+    def __init__(self, interval: float = 0.002, max_depth: int = 64):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter[str] = Counter()
+        self.components: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        _sampler_threads.add(own)
+        try:
+            while not self._stop.wait(self.interval):
+                self.sample(skip=_sampler_threads)
+        finally:
+            _sampler_threads.discard(own)
+
+    def sample(self, skip: set[int] | frozenset[int] = frozenset()) -> None:
+        self.samples += 1
+        for ident, frame in sys._current_frames().items():
+            if ident in skip or _is_idle(frame):
+                continue
+            self.components[_component(frame)] += 1
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_key(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+
+
+@dataclass
+class Profile:
+    id: int
+    method: str
+    path: str
+    route: str | None
+    status: int | None
+    duration_ms: float
+    interval_ms: float
+    samples: int
+    recorded_at: datetime
+    components: dict[str, int] = field(default_factory=dict)
+    stacks: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "samples": self.samples,
+            "recorded_at": self.recorded_at,
+        }
+
+    def top(self, n: int = 25) -> list[dict[str, Any]]:
+        """Leaf frames with the most samples (self time)."""
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return [{"frame": frame, "samples": count} for frame, count in leaves.most_common(n)]
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed-stack format, for flamegraph.pl or speedscope."""
+        ordered = sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{stack} {count}\n" for stack, count in ordered)
+
+
+class ProfileBuffer:
+    """Bounded ring buffer of finished profiles."""
+
+    def __init__(self, capacity: int = 50):
+        self._profiles: deque[Profile] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def get(self, profile_id: int) -> Profile | None:
+        with self._lock:
+            return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def list(self) -> list[Profile]:
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+profiles = ProfileBuffer(capacity=int(os.getenv("PROFILE_BUFFER_SIZE", "50")))
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests that ask for it or are picked by sampling.
+
+    A request is profiled when it carries `X-Debug-Profile: 1` while debug
+    endpoints are enabled, or at random with probability
+    PROFILE_SAMPLE_RATE. The profile id is returned in `X-Profile-Id` and
+    the result is served from /debug/profiles.
+    """
+
+    def __init__(self, app, sample_rate: float | None = None, interval: float | None = None):
+        self.app = app
+        self.sample_rate = sample_rate if sample_rate is not None else float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+        self.interval = interval if interval is not None else float(os.getenv("PROFILE_INTERVAL_MS", "2")) / 1000
+
+    def _wanted(self, scope) -> bool:
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return True
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER.encode() and value not in (b"", b"0"):
+                return debug_endpoints_enabled()
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profiles.next_id()
+        status_code: int | None = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", str(profile_id).encode())
+                ]
+            await send(message)
+
+        sampler = StackSampler(interval=self.interval)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            profiles.add(Profile(
+                id=profile_id,
+                method=scope["method"],
+                path=scope["path"],
+                route=getattr(scope.get("route"), "path", None),
+                status=status_code,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                interval_ms=self.interval * 1000,
+                samples=sampler.samples,
+                recorded_at=datetime.now(timezone.utc),
+                components=dict(sampler.components.most_common()),
+                stacks=dict(sampler.stacks),
+            ))
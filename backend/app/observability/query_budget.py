@@ -0,0 +1,120 @@
+from __future__ import annotations
+import logging
+from typing import Any, Callable, TypeVar
+
+from prometheus_client import Counter
+
+from app.api.deps import debug_endpoints_enabled
+from app.observability.metrics import QueryStats, collect_queries
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+QUERY_COUNT_HEADER = "x-debug-query-count"
+
+BUDGET_EXCEEDED = Counter(
+    "http_request_query_budget_exceeded",
+    "Requests that executed more SQL statements than their route's budget.",
+    ["method", "route"],
+)
+
+logger = logging.getLogger(__name__)
+
+# Called with (method, route, queries, budget, statements) on every overrun;
+# the test suite registers one to fail the test that caused it
+budget_listeners: list[Callable[[str, str, int, int, list[str]], None]] = []
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by `max_queries` when a block executes too many statements."""
+
+
+def query_budget(max_queries: int | None) -> Callable[[F], F]:
+    """
+    Declare the most SQL statements a route may execute per request.
+
+    None declares a route whose statement count scales with its input
+    (bulk ingestion); it is counted but never checked.
+    """
+    def decorator(fn: F) -> F:
+        fn.query_budget = max_queries  # type: ignore[attr-defined]
+        return fn
+    return decorator
+
+
+def route_budget(route: Any) -> int | None:
+    return getattr(getattr(route, "endpoint", None), "query_budget", None)
+
+
+def _describe(stats: QueryStats) -> str:
+    return "\n".join(f"  {i}. {sql}" for i, sql in enumerate(stats.statements or (), 1))
+
+
+class max_queries(collect_queries):
+    """
+    Fail the block if it executes more than `limit` statements.
+
+        with max_queries(2):
+            repo.list_and_count(q)
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(keep_statements=True)
+        self.limit = limit
+
+    def __exit__(self, exc_type, *exc) -> None:
+        super().__exit__(exc_type, *exc)
+        if exc_type is None and self.stats.queries > self.limit:
+            raise QueryBudgetExceeded(
+                f"{self.stats.queries} statements executed, budget is {self.limit}:\n{_describe(self.stats)}"
+            )
+
+
+class QueryBudgetMiddleware:
+    """
+    Check each request's statement count against its route's budget.
+
+    Overruns are counted in Prometheus and logged with the statements that
+    ran. When debug endpoints are enabled, a request sent with
+    `X-Debug-Query-Count: 1` gets `X-Query-Count` (and `X-Query-Budget`
+    for annotated routes) on the response. Statement texts are kept only
+    for those requests and while listeners are registered.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        report = any(
+            name == QUERY_COUNT_HEADER.encode() and value not in (b"", b"0")
+            for name, value in scope["headers"]
+        ) and debug_endpoints_enabled()
+        collector = collect_queries(keep_statements=report or bool(budget_listeners))
+
+        async def send_wrapper(message):
+            if report and message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-query-count", str(stats.queries).encode()))
+                budget = route_budget(scope.get("route"))
+                if budget is not None:
+                    headers.append((b"x-query-budget", str(budget).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        with collector as stats:
+            await self.app(scope, receive, send_wrapper)
+
+        route = scope.get("route")
+        budget = route_budget(route)
+        if budget is None or stats.queries <= budget:
+            return
+        template = getattr(route, "path", None) or "unmatched"
+        BUDGET_EXCEEDED.labels(scope["method"], template).inc()
+        logger.warning(
+            "%s %s executed %d statements, budget is %d", scope["method"], template, stats.queries, budget,
+        )
+        for listener in budget_listeners:
+            listener(scope["method"], template, stats.queries, budget, list(stats.statements or ()))
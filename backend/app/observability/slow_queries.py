@@ -0,0 +1,230 @@
+from __future__ import annotations
+import itertools
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.observability.sql import statement_verb
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+|\$\d+|%s)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+|\$\d+|%s))+\s*\)")
+_BIND = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_LOCKING = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b", re.IGNORECASE)
+_SELECT_INTO = re.compile(r"^\s*SELECT\b.*?\bINTO\b", re.IGNORECASE | re.DOTALL)
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace, literals and bind lists so equivalent statements group together."""
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?, ...)", sql)
+    return _BIND.sub("?", sql)
+
+
+def parameter_shape(parameters: Any, executemany: bool) -> Any:
+    """Type names of the bound parameters, never their values."""
+    if executemany:
+        rows = list(parameters or ())
+        return {"rows": len(rows), "row": parameter_shape(rows[0], False) if rows else None}
+    if isinstance(parameters, dict):
+        return {k: type(v).__name__ for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(v).__name__ for v in parameters]
+    return None
+
+
+def explain_sql(statement: str, dialect: str) -> str:
+    """
+    EXPLAIN statement used to capture a plan.
+
+    Only read-only SELECTs are run with ANALYZE on Postgres: ANALYZE
+    executes the query, so a `SELECT ... FOR UPDATE` would take row locks
+    and wait behind the request that issued it.
+    """
+    if dialect == "postgresql":
+        read_only = (
+            statement_verb(statement) == "SELECT"
+            and not _LOCKING.search(statement)
+            and not _SELECT_INTO.search(statement)
+        )
+        return f"EXPLAIN (ANALYZE, BUFFERS) {statement}" if read_only else f"EXPLAIN {statement}"
+    if dialect == "sqlite":
+        return f"EXPLAIN QUERY PLAN {statement}"
+    return f"EXPLAIN {statement}"
+
+
+@dataclass
+class SlowQuery:
+    id: int
+    statement: str
+    parameters: Any
+    duration_ms: float
+    recorded_at: datetime
+    dialect: str
+    plan: list[str] | None = None
+    plan_error: str | None = None
+
+
+@dataclass
+class _ExplainJob:
+    entry: SlowQuery
+    engine: Engine
+    statement: str
+    parameters: Any = field(repr=False)
+
+
+class SlowQueryLog:
+    """
+    Record statements slower than a threshold, with sampled query plans.
+
+    Statements are timed with cursor events. Slow ones land in a bounded
+    ring buffer with their normalized SQL and parameter types. A plan is
+    captured at most once per normalized statement per `explain_interval`
+    seconds, on a separate connection in a background thread, so the slow
+    request itself never waits for EXPLAIN. Postgres gets
+    `EXPLAIN (ANALYZE, BUFFERS)` for SELECTs and plain `EXPLAIN` for
+    writes, which must not be re-executed; SQLite gets
+    `EXPLAIN QUERY PLAN`.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float | None = None,
+        capacity: int = 200,
+        explain_interval: float = 60.0,
+        background: bool = True,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_interval = explain_interval
+        self.background = background
+        self._entries: deque[SlowQuery] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._last_explained: dict[str, float] = {}
+        self._jobs: queue.Queue[_ExplainJob] = queue.Queue(maxsize=100)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms is not None
+
+    def configure(self, threshold_ms: float | None, background: bool | None = None) -> None:
+        self.threshold_ms = threshold_ms
+        if background is not None:
+            self.background = background
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._last_explained.clear()
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Recorded queries, slowest first."""
+        with self._lock:
+            items = list(self._entries)
+        return [asdict(e) for e in sorted(items, key=lambda e: e.duration_ms, reverse=True)]
+
+    def record(self, conn, statement: str, parameters: Any, executemany: bool, elapsed: float) -> None:
+        normalized = normalize_sql(statement)
+        entry = SlowQuery(
+            id=next(self._ids),
+            statement=normalized,
+            parameters=parameter_shape(parameters, executemany),
+            duration_ms=round(elapsed * 1000, 3),
+            recorded_at=datetime.now(timezone.utc),
+            dialect=conn.dialect.name,
+        )
+        now = time.monotonic()
+        with self._lock:
+            self._entries.append(entry)
+            last = self._last_explained.get(normalized)
+            explain = not executemany and (last is None or now - last >= self.explain_interval)
+            if explain:
+                self._last_explained[normalized] = now
+        if explain:
+            try:
+                self._jobs.put_nowait(_ExplainJob(entry, conn.engine, statement, parameters))
+            except queue.Full:
+                return
+            if self.background:
+                self._ensure_worker()
+
+    def flush(self) -> None:
+        """Run pending EXPLAINs in the calling thread."""
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            self._explain(job)
+
+    @property
+    def explaining(self) -> bool:
+        return getattr(self._local, "explaining", False)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="slow-query-explain", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            self._explain(self._jobs.get())
+
+    def _explain(self, job: _ExplainJob) -> None:
+        sql = explain_sql(job.statement, job.entry.dialect)
+        self._local.explaining = True
+        try:
+            with job.engine.connect() as conn:
+                rows = conn.exec_driver_sql(sql, job.parameters).all()
+            job.entry.plan = [str(row[-1]) for row in rows]
+        except Exception as e:
+            job.entry.plan_error = f"{type(e).__name__}: {e}"
+        finally:
+            self._local.explaining = False
+
+
+def _threshold_from_env() -> float | None:
+    value = os.getenv("SLOW_QUERY_THRESHOLD_MS")
+    return float(value) if value else None
+
+
+slow_query_log = SlowQueryLog(threshold_ms=_threshold_from_env())
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if slow_query_log.enabled:
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("slow_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    threshold = slow_query_log.threshold_ms
+    if threshold is not None and elapsed * 1000 >= threshold and not slow_query_log.explaining:
+        slow_query_log.record(conn, statement, parameters, executemany, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    starts = conn.info.get("slow_query_start") if conn is not None else None
+    if starts:
+        starts.pop()
@@ -0,0 +1,17 @@
+from __future__ import annotations
+import re
+
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|JOIN)\s+[\"`]?([\w.]+)", re.IGNORECASE)
+
+
+def statement_verb(statement: str) -> str:
+    """Leading keyword of a SQL statement (SELECT, INSERT, ...)."""
+    parts = statement.lstrip().split(None, 1)
+    return parts[0].upper() if parts else "OTHER"
+
+
+def statement_name(statement: str) -> str:
+    """Low-cardinality name for a statement: verb plus first table, e.g. `SELECT orders`."""
+    verb = statement_verb(statement)
+    match = _TABLE.search(statement)
+    return f"{verb} {match.group(1)}" if match else verb
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+)
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.observability.sql import statement_name
+
+# None while tracing is disabled: every hook below checks this first so the
+# untraced hot path costs one global lookup.
+_tracer: trace.Tracer | None = None
+_provider: TracerProvider | None = None
+
+
+def configure_tracing(exporter: SpanExporter, batch: bool = True) -> None:
+    """Enable tracing with the given exporter, replacing any previous setup."""
+    global _tracer, _provider
+    disable_tracing()
+    resource = Resource.create({"service.name": os.getenv("OTEL_SERVICE_NAME", "ai-trading-bot")})
+    _provider = TracerProvider(resource=resource)
+    processor = BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+    _provider.add_span_processor(processor)
+    _tracer = _provider.get_tracer("app")
+
+
+def configure_tracing_from_env() -> None:
+    """
+    Enable tracing when TRACING_EXPORTER is set.
+
+    - `otlp`: OTLP over HTTP; the endpoint comes from the standard
+      OTEL_EXPORTER_OTLP_ENDPOINT variables.
+    - `file`: one JSON span per line appended to TRACING_FILE.
+    """
+    kind = os.getenv("TRACING_EXPORTER", "").lower()
+    if kind == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        configure_tracing(OTLPSpanExporter())
+    elif kind == "file":
+        out = open(os.getenv("TRACING_FILE", "traces.jsonl"), "a", encoding="utf-8")
+        configure_tracing(ConsoleSpanExporter(out=out, formatter=lambda s: s.to_json(indent=None) + "\n"))
+
+
+def disable_tracing() -> None:
+    """Flush and drop the current provider."""
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+@contextmanager
+def traced(name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any) -> Iterator[Span | None]:
+    """Run the block in a child span, or do nothing when tracing is off."""
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(name, kind=kind, attributes=attributes) as span:
+        yield span
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _tracer is None:
+        return
+    span = _tracer.start_span(
+        statement_name(statement),
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.dialect.name,
+            "db.statement": statement,
+            "db.executemany": executemany,
+        },
+    )
+    conn.info.setdefault("trace_spans", []).append(span)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans = conn.info.get("trace_spans")
+    if spans:
+        spans.pop().end()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    spans = conn.info.get("trace_spans") if conn is not None else None
+    if spans:
+        span = spans.pop()
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span per HTTP request.
+
+    Incoming W3C trace context is honoured. The span is renamed to
+    `METHOD /route/{template}` once routing has matched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _tracer is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        method = scope["method"]
+        with _tracer.start_as_current_span(
+            method,
+            context=propagate.extract(headers),
+            kind=SpanKind.SERVER,
+            attributes={"http.method": method, "http.target": scope["path"]},
+        ) as span:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.set_attribute("http.route", route)
+                    span.update_name(f"{method} {route}")
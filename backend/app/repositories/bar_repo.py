@@ -0,0 +1,46 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import BarArrays
+from app.models.bar import Bar
+from app.observability.metrics import instrumented
+
+
+class BarRepository:
+    """
+    Range reads over the bars table.
+
+    Bars are read as NumPy column arrays, never as ORM objects: a year of
+    minute bars is ~100k rows per symbol.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @instrumented("read_range")
+    def read_range(
+        self, symbol_id: int, timeframe: str, start: datetime | None = None, end: datetime | None = None,
+    ) -> BarArrays:
+        """Bars of one symbol with start <= ts < end, in time order."""
+        stmt = (
+            select(Bar.ts, Bar.open, Bar.high, Bar.low, Bar.close, Bar.volume)
+            .where(Bar.symbol_id == symbol_id, Bar.timeframe == timeframe)
+            .order_by(Bar.ts)
+        )
+        if start is not None:
+            stmt = stmt.where(Bar.ts >= start)
+        if end is not None:
+            stmt = stmt.where(Bar.ts < end)
+        return BarArrays.from_rows(self.db.execute(stmt).all())
+
+    @instrumented("bounds")
+    def bounds(self, symbol_id: int, timeframe: str) -> tuple[datetime | None, datetime | None, int]:
+        """First and last bar timestamps and the bar count of one series."""
+        first, last, count = self.db.execute(
+            select(func.min(Bar.ts), func.max(Bar.ts), func.count())
+            .where(Bar.symbol_id == symbol_id, Bar.timeframe == timeframe)
+        ).one()
+        return first, last, count
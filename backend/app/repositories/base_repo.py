@@ -1,10 +1,14 @@
 from __future__ import annotations
+from datetime import datetime
 from typing import Generic, TypeVar, Type, Sequence, Tuple, Any
 from sqlalchemy import select, func, asc, desc
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.coalesce import read_coalescer
+from app.observability.metrics import instrumented
+
 # Type variables for generic repository
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -28,6 +32,11 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Quer
         """Apply query filters to statement. Override in subclasses for specific filtering."""
         return stmt
     
+    def invalidate_reads(self) -> None:
+        """Drop coalesced list results for this table after a write."""
+        read_coalescer.invalidate(self.model.__tablename__)
+    
+    @instrumented("create")
     def create(self, payload: CreateSchemaType, error_msg: str = "Entity already exists") -> ModelType:
         """Create a new entity."""
         entity = self.model(**payload.model_dump())
@@ -37,16 +46,46 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Quer
         except IntegrityError as e:
             self.db.rollback()
             raise ValueError(error_msg) from e
+        self.invalidate_reads()
         self.db.refresh(entity)
         return entity
     
+    @instrumented("get")
     def get(self, entity_id: Any) -> ModelType | None:
         """Get entity by ID."""
         return self.db.get(self.model, entity_id)
     
-    def list_and_count(self, q: QuerySchemaType) -> Tuple[Sequence[ModelType], int]:
-        """List entities with filtering and count total."""
-        stmt = select(self.model)
+    @instrumented("get_many")
+    def get_many(self, ids: Sequence[Any]) -> Tuple[list[ModelType], list[Any]]:
+        """
+        Get several entities by ID in one query.
+        
+        Returns the found entities in request order (duplicates collapsed)
+        and the ids that do not exist.
+        """
+        unique = list(dict.fromkeys(ids))
+        if not unique:
+            return [], []
+        rows = self.db.execute(select(self.model).where(self.model.id.in_(unique))).scalars().all()
+        by_id = {row.id: row for row in rows}
+        found = [by_id[i] for i in unique if i in by_id]
+        missing = [i for i in unique if i not in by_id]
+        return found, missing
+    
+    @instrumented("list_page")
+    def list_page(self, q: QuerySchemaType) -> Sequence[ModelType]:
+        """
+        List one page of entities with filtering and ordering.
+        
+        When the query carries `fields`, only those columns are selected and
+        plain Row tuples are returned instead of ORM instances, so projected
+        pages skip identity-map hydration entirely.
+        """
+        fields = getattr(q, "fields", None)
+        if fields:
+            stmt = select(*(getattr(self.model, f) for f in fields))
+        else:
+            stmt = select(self.model)
         stmt = self._apply_filters(stmt, q)
         
         order_by = getattr(q, "order_by", None)
@@ -59,15 +98,30 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Quer
         offset = getattr(q, "offset", 0)
         stmt = stmt.offset(offset).limit(limit)
         
-        rows = self.db.execute(stmt).scalars().all()
-        
-        # Count query with same filters
+        result = self.db.execute(stmt)
+        return result.all() if fields else result.scalars().all()
+    
+    @instrumented("count")
+    def count(self, q: QuerySchemaType) -> int:
+        """Count entities matching the query filters."""
         count_stmt = select(func.count()).select_from(self.model)
         count_stmt = self._apply_filters(count_stmt, q)
-        total = self.db.execute(count_stmt).scalar_one()
-        
-        return rows, total
+        return self.db.execute(count_stmt).scalar_one()
+    
+    @instrumented("fingerprint")
+    def fingerprint(self, q: QuerySchemaType) -> Tuple[int, datetime | None]:
+        """Count and max(updated_at) of the filtered set, in one query."""
+        stmt = select(func.count(), func.max(self.model.updated_at)).select_from(self.model)
+        stmt = self._apply_filters(stmt, q)
+        total, max_updated = self.db.execute(stmt).one()
+        return total, max_updated
+    
+    @instrumented("list_and_count")
+    def list_and_count(self, q: QuerySchemaType) -> Tuple[Sequence[ModelType], int]:
+        """List entities with filtering and count total."""
+        return self.list_page(q), self.count(q)
     
+    @instrumented("update")
     def update(self, entity: ModelType, patch: UpdateSchemaType, error_msg: str = "Update failed due to constraint violation") -> ModelType:
         """Update entity with partial data."""
         data = patch.model_dump(exclude_unset=True)
@@ -78,10 +132,13 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType, Quer
         except IntegrityError as e:
             self.db.rollback()
             raise ValueError(error_msg) from e
+        self.invalidate_reads()
         self.db.refresh(entity)
         return entity
     
+    @instrumented("delete")
     def delete(self, entity: ModelType) -> None:
         """Delete entity."""
         self.db.delete(entity)
         self.db.commit()
+        self.invalidate_reads()
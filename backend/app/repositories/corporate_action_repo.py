@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.marketdata.adjust import adjustment_cache
+from app.models.bar import Bar
+from app.models.corporate_action import CorporateAction
+from app.observability.metrics import instrumented
+from app.schemas.corporate_action import CorporateActionCreate
+
+
+class CorporateActionRepository:
+    """Splits and dividends per symbol, and the factors they imply."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @instrumented("create")
+    def create(self, symbol_id: int, payload: CorporateActionCreate) -> CorporateAction:
+        """
+        Record an action, deriving its price factor when not given.
+
+        A dividend is priced against the last close before the ex-date;
+        without one (and without an explicit factor) it is rejected.
+        """
+        factor = payload.factor
+        if factor is None and payload.type == "split":
+            factor = 1 / payload.ratio
+        elif factor is None:
+            prior_close = self.db.execute(
+                select(Bar.close)
+                .where(Bar.symbol_id == symbol_id, Bar.ts < payload.ts)
+                .order_by(Bar.ts.desc())
+                .limit(1)
+            ).scalar()
+            if prior_close is None:
+                raise ValueError("No bar before the ex-date to price the dividend; pass factor explicitly")
+            if payload.cash >= prior_close:
+                raise ValueError(f"Dividend {payload.cash} is not below the prior close {prior_close}")
+            factor = 1 - payload.cash / prior_close
+        entity = CorporateAction(symbol_id=symbol_id, **payload.model_dump(exclude={"factor"}), factor=factor)
+        self.db.add(entity)
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise ValueError("Corporate action already exists") from e
+        adjustment_cache.invalidate([symbol_id])
+        self.db.refresh(entity)
+        return entity
+
+    @instrumented("list_for_symbol")
+    def list_for_symbol(self, symbol_id: int) -> Sequence[CorporateAction]:
+        return self.db.execute(
+            select(CorporateAction)
+            .where(CorporateAction.symbol_id == symbol_id)
+            .order_by(CorporateAction.ts, CorporateAction.id)
+        ).scalars().all()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.bar import Bar
+from app.models.data_quality_issue import DataQualityIssue
+from app.observability.metrics import instrumented
+
+if TYPE_CHECKING:
+    from app.marketdata.quality import Finding
+
+
+class DataQualityRepository:
+    """Persisted data-quality findings per symbol."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @instrumented("record")
+    def record(
+        self, symbol_id: int, timeframe: str, start: datetime, end: datetime, findings: Iterable[Finding],
+    ) -> None:
+        """Replace the issues starting in [start, end) with `findings`, and commit."""
+        self.db.execute(
+            delete(DataQualityIssue).where(
+                DataQualityIssue.symbol_id == symbol_id,
+                DataQualityIssue.timeframe == timeframe,
+                DataQualityIssue.start_ts >= start,
+                DataQualityIssue.start_ts < end,
+            )
+        )
+        rows = [
+            {
+                "symbol_id": symbol_id, "timeframe": timeframe, "kind": f.kind,
+                "start_ts": f.start, "end_ts": f.end, "count": f.count, "detail": f.detail[:255],
+            }
+            for f in findings
+        ]
+        if rows:
+            self.db.execute(insert(DataQualityIssue), rows)
+        self.db.commit()
+
+    @instrumented("list_issues")
+    def list_issues(
+        self, symbol_id: int | None = None, kind: str | None = None, since: datetime | None = None, limit: int = 100,
+    ) -> Sequence[DataQualityIssue]:
+        """Most recent issues first."""
+        stmt = select(DataQualityIssue).order_by(DataQualityIssue.start_ts.desc(), DataQualityIssue.id.desc())
+        if symbol_id is not None:
+            stmt = stmt.where(DataQualityIssue.symbol_id == symbol_id)
+        if kind is not None:
+            stmt = stmt.where(DataQualityIssue.kind == kind)
+        if since is not None:
+            stmt = stmt.where(DataQualityIssue.start_ts >= since)
+        return self.db.execute(stmt.limit(limit)).scalars().all()
+
+    @instrumented("summary")
+    def summary(self, since: datetime | None = None, symbol_id: int | None = None) -> list[tuple]:
+        """(symbol_id, kind, issues, affected bars, last issue start) per symbol and kind."""
+        stmt = (
+            select(
+                DataQualityIssue.symbol_id,
+                DataQualityIssue.kind,
+                func.count(),
+                func.sum(DataQualityIssue.count),
+                func.max(DataQualityIssue.start_ts),
+            )
+            .group_by(DataQualityIssue.symbol_id, DataQualityIssue.kind)
+            .order_by(DataQualityIssue.symbol_id, DataQualityIssue.kind)
+        )
+        if since is not None:
+            stmt = stmt.where(DataQualityIssue.start_ts >= since)
+        if symbol_id is not None:
+            stmt = stmt.where(DataQualityIssue.symbol_id == symbol_id)
+        return [tuple(row) for row in self.db.execute(stmt).all()]
+
+    @instrumented("last_bars")
+    def last_bars(self, timeframe: str, since: datetime, symbol_id: int | None = None) -> dict[int, datetime]:
+        """Newest bar of each symbol with bars at or after `since`."""
+        stmt = (
+            select(Bar.symbol_id, func.max(Bar.ts))
+            .where(Bar.timeframe == timeframe, Bar.ts >= since)
+            .group_by(Bar.symbol_id)
+        )
+        if symbol_id is not None:
+            stmt = stmt.where(Bar.symbol_id == symbol_id)
+        return dict(self.db.execute(stmt).all())
@@ -1,17 +1,27 @@
 from __future__ import annotations
+from typing import Sequence
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import select
+from decimal import Decimal
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models.order import Order, OrderStatus
-from app.schemas.order import OrderCreate, OrderUpdate, OrderQuery
+from app.models.order import Order, OrderStatus, QuantityType
+from app.schemas.order import OrderCreate, OrderUpdate, OrderQuery, OrderFill
 from app.repositories.base_repo import BaseRepository
+from app.repositories.position_repo import PositionRepository
+from app.observability.metrics import instrumented
+from app.services.risk_engine import RiskEngine, risk_engine
+
+# Relative shortfall at which a notional order counts as completely filled
+NOTIONAL_FILL_TOLERANCE = Decimal("1e-8")
 
 
 class OrderRepository(BaseRepository[Order, OrderCreate, OrderUpdate, OrderQuery]):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, risk: RiskEngine | None = None):
         super().__init__(Order, db)
+        self.risk = risk if risk is not None else risk_engine
 
     def _apply_filters(self, stmt, q: OrderQuery):
         """Apply order-specific filters."""
@@ -31,6 +41,7 @@ class OrderRepository(BaseRepository[Order, OrderCreate, OrderUpdate, OrderQuery
             stmt = stmt.where(Order.created_at <= q.created_to)
         return stmt
 
+    @instrumented("create")
     def create(self, payload: OrderCreate) -> Order:
         """Create a new order with idempotency support via client_order_id."""
         # Check for duplicate client_order_id if provided
@@ -45,8 +56,60 @@ class OrderRepository(BaseRepository[Order, OrderCreate, OrderUpdate, OrderQuery
             if existing:
                 raise ValueError("Order with this client_order_id already exists for this account")
         
-        return super().create(payload, error_msg="Order creation failed due to constraint violation")
+        self.risk.ensure_warm(self.db)
+        ticket = self.risk.check(payload)
+        try:
+            order = super().create(payload, error_msg="Order creation failed due to constraint violation")
+        except Exception:
+            self.risk.release(ticket)
+            raise
+        self.risk.confirm(ticket, order.id)
+        return order
+
+    @instrumented("create_many")
+    def create_many(self, payloads: Sequence[OrderCreate]) -> list[Order]:
+        """Create a batch of orders in one transaction (all or nothing)."""
+        keys = [(p.account_id, p.client_order_id) for p in payloads if p.client_order_id and p.account_id]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate client_order_id in batch")
+        if keys:
+            existing = self.db.execute(
+                select(Order.id).where(tuple_(Order.account_id, Order.client_order_id).in_(keys))
+            ).first()
+            if existing:
+                raise ValueError("Order with this client_order_id already exists for this account")
 
+        # Checks are cumulative: each accepted order reserves exposure for the next
+        self.risk.ensure_warm(self.db)
+        tickets = []
+        try:
+            for payload in payloads:
+                tickets.append(self.risk.check(payload))
+        except ValueError:
+            for ticket in tickets:
+                self.risk.release(ticket)
+            raise
+
+        orders = [Order(**payload.model_dump()) for payload in payloads]
+        self.db.add_all(orders)
+        try:
+            self.db.flush()
+            ids = [order.id for order in orders]
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            for ticket in tickets:
+                self.risk.release(ticket)
+            raise ValueError("Order creation failed due to constraint violation") from e
+        self.invalidate_reads()
+
+        for ticket, order_id in zip(tickets, ids):
+            self.risk.confirm(ticket, order_id)
+        # Reload the whole batch in one round trip instead of a refresh per order
+        self.db.execute(select(Order).where(Order.id.in_(ids))).scalars().all()
+        return orders
+
+    @instrumented("update")
     def update(self, order: Order, patch: OrderUpdate) -> Order:
         """Update order with validation for status and fields."""
         # Only allow updates in certain states
@@ -58,9 +121,22 @@ class OrderRepository(BaseRepository[Order, OrderCreate, OrderUpdate, OrderQuery
         # Don't allow changing quantity after creation
         if "quantity" in data:
             raise ValueError("Cannot change quantity after order creation")
-        
-        return super().update(order, patch, error_msg="Order update failed due to constraint violation")
 
+        # A new limit or stop price changes the order's notional
+        repriced = "price" in data or "stop_price" in data
+        if repriced:
+            self.risk.ensure_warm(self.db)
+            previous = self.risk.reprice(
+                order, data.get("price", order.price), data.get("stop_price", order.stop_price)
+            )
+        try:
+            return super().update(order, patch, error_msg="Order update failed due to constraint violation")
+        except Exception:
+            if repriced:
+                self.risk.restore(order.id, previous)
+            raise
+
+    @instrumented("cancel")
     def cancel(self, order: Order) -> Order:
         """Cancel an order (sets status and timestamp)."""
         # Check if order can be canceled
@@ -75,5 +151,60 @@ class OrderRepository(BaseRepository[Order, OrderCreate, OrderUpdate, OrderQuery
         order.canceled_at = datetime.utcnow()
         
         self.db.commit()
+        self.invalidate_reads()
+        self.db.refresh(order)
+        self.risk.on_order_closed(order.id)
+        return order
+
+    @instrumented("record_fill")
+    def record_fill(self, order: Order, fill: OrderFill) -> Order:
+        """
+        Apply an execution to an order (quantity, average price and status).
+
+        The order row is re-read under FOR UPDATE first, so concurrent fills
+        on one order serialize instead of overwriting each other's totals.
+        """
+        self.db.refresh(order, with_for_update=True)
+        if order.status not in (
+            OrderStatus.new,
+            OrderStatus.pending_broker,
+            OrderStatus.partially_filled,
+        ):
+            raise ValueError(f"Cannot fill order in status: {order.status.value}")
+
+        filled = order.filled_quantity or 0
+        avg = order.average_fill_price or 0
+        new_filled = filled + fill.quantity
+        new_avg = (avg * filled + fill.price * fill.quantity) / new_filled
+
+        # Notional orders are sized in currency, unit orders in units
+        if order.quantity_type == QuantityType.notional:
+            done = new_avg * new_filled
+        else:
+            done = new_filled
+        # Unit quantities are stored to 10 places, so a notional order's filled
+        # value can miss its size by rounding in either direction
+        slack = order.quantity * NOTIONAL_FILL_TOLERANCE if order.quantity_type == QuantityType.notional else 0
+        if done > order.quantity + slack:
+            raise ValueError("Fill quantity exceeds remaining order quantity")
+
+        order.filled_quantity = new_filled
+        order.average_fill_price = new_avg
+        order.status = OrderStatus.filled if done >= order.quantity - slack else OrderStatus.partially_filled
+        order.filled_at = fill.filled_at or datetime.utcnow()
+
+        # Position update shares the transaction with the order update
+        positions = PositionRepository(self.db)
+        positions.apply_fill(
+            order.account_id, order.symbol_id, order.side, fill.quantity, fill.price
+        )
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise ValueError("Fill failed due to constraint violation") from e
+        self.invalidate_reads()
+        positions.invalidate_reads()
         self.db.refresh(order)
+        self.risk.on_fill(order, fill.quantity, fill.price)
         return order
\ No newline at end of file
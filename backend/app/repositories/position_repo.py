@@ -0,0 +1,172 @@
+from __future__ import annotations
+from decimal import Decimal
+from uuid import UUID
+from pydantic import BaseModel
+from sqlalchemy import select, delete, insert, case, func, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.order import Order, OrderSide
+from app.models.position import Position
+from app.schemas.position import PositionQuery
+from app.repositories.base_repo import BaseRepository
+from app.observability.metrics import instrumented
+from app.services.accounting import apply_fill
+
+
+class PositionRepository(BaseRepository[Position, BaseModel, BaseModel, PositionQuery]):
+    """Positions are derived from fills; they are never created or patched directly."""
+
+    def __init__(self, db: Session):
+        super().__init__(Position, db)
+
+    def _apply_filters(self, stmt, q: PositionQuery):
+        """Apply position-specific filters."""
+        if q.account_id:
+            stmt = stmt.where(Position.account_id == q.account_id)
+        if q.symbol_id:
+            stmt = stmt.where(Position.symbol_id == q.symbol_id)
+        if q.open_only:
+            stmt = stmt.where(Position.qty != 0)
+        return stmt
+
+    def apply_fill(self, account_id: UUID | None, symbol_id: UUID, side: OrderSide, qty: Decimal, price: Decimal) -> Position:
+        """
+        Apply a fill to the matching position row.
+
+        Does not commit: callers flush this together with the order update so
+        the position and the fill land in the same transaction. On Postgres
+        the row is created with ON CONFLICT DO NOTHING before it is locked,
+        since FOR UPDATE on a missing row locks nothing and two first fills
+        would both insert; the unique key treats NULL accounts as equal.
+        SQLite serializes writers, so there the row is inserted if missing.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(
+                pg_insert(Position)
+                .values(account_id=account_id, symbol_id=symbol_id, qty=0, avg_price=0, realized_pnl=0)
+                .on_conflict_do_nothing(constraint="uq_positions_account_symbol")
+            )
+        account_clause = Position.account_id.is_(None) if account_id is None else Position.account_id == account_id
+        position = self.db.execute(
+            select(Position)
+            .where(account_clause, Position.symbol_id == symbol_id)
+            .with_for_update()
+        ).scalar_one_or_none()
+        if position is None:
+            position = Position(
+                account_id=account_id,
+                symbol_id=symbol_id,
+                qty=Decimal("0"),
+                avg_price=Decimal("0"),
+                realized_pnl=Decimal("0"),
+            )
+            self.db.add(position)
+
+        signed = qty if side == OrderSide.buy else -qty
+        new_qty, new_avg, realized = apply_fill(position.qty, position.avg_price, signed, price)
+        position.qty = new_qty
+        position.avg_price = new_avg
+        position.realized_pnl = position.realized_pnl + realized
+        position.mark_price = price
+        position.unrealized_pnl = (price - new_avg) * new_qty
+        return position
+
+    @instrumented("rebuild_from_history")
+    def rebuild_from_history(self) -> int:
+        """
+        Recompute every position from filled orders in one set-based statement.
+
+        Orders are replayed per account and symbol in fill order (filled_at,
+        then created_at), each as one fill at its average fill price. A
+        running quantity over that history splits it into segments: a new
+        segment starts when the position was flat before an order, or when
+        an order flips it through zero, and then only the part beyond zero
+        opens the new segment. Realized PnL over the whole history is the
+        net cash flow plus the open quantity at its average price, so only
+        the last segment's average price is needed: the mean price of the
+        quantity it opened or added.
+
+        This matches incremental average-cost accounting when each order
+        was filled in one execution. Orders whose partial fills interleave
+        with other orders' fills are placed at their last fill. Average
+        prices match as long as the position was never partly reduced and
+        then added to within its last segment; a reduction keeps the
+        average, so an add afterwards blends against a smaller basis.
+
+        The mark price is the last order's average fill price, as the
+        incremental path marks to the last fill.
+        """
+        key = (Order.account_id, Order.symbol_id)
+        history = (Order.filled_at, Order.created_at, Order.id)
+        signed = case((Order.side == OrderSide.buy, Order.filled_quantity), else_=-Order.filled_quantity)
+        fills = (
+            select(
+                Order.account_id,
+                Order.symbol_id,
+                Order.filled_quantity.label("qty"),
+                Order.average_fill_price.label("price"),
+                signed.label("signed"),
+                func.sum(signed).over(partition_by=key, order_by=history, rows=(None, 0)).label("running"),
+                func.row_number().over(partition_by=key, order_by=tuple(c.desc() for c in history)).label("recency"),
+                func.row_number().over(partition_by=key, order_by=history).label("seq"),
+            )
+            .where(Order.filled_quantity > 0, Order.average_fill_price.is_not(None))
+            .subquery()
+        )
+        before = fills.c.running - fills.c.signed
+        starts = case((before == 0, 1), (before * fills.c.running < 0, 1), else_=0)
+        fill_key = (fills.c.account_id, fills.c.symbol_id)
+        segmented = select(
+            fills,
+            func.sum(starts).over(partition_by=fill_key, order_by=fills.c.seq, rows=(None, 0)).label("segment"),
+        ).subquery()
+        tagged = select(
+            segmented,
+            func.max(segmented.c.segment).over(partition_by=(segmented.c.account_id, segmented.c.symbol_id))
+            .label("last_segment"),
+            func.sum(segmented.c.signed).over(partition_by=(segmented.c.account_id, segmented.c.symbol_id))
+            .label("net"),
+        ).subquery()
+
+        # Quantity opened by an order on the side of the final position, within the last segment;
+        # a flipping order opens only what lies beyond zero
+        opening = (
+            (tagged.c.segment == tagged.c.last_segment)
+            & (tagged.c.signed * tagged.c.net > 0)
+        )
+        opened = case((tagged.c.qty < func.abs(tagged.c.running), tagged.c.qty), else_=func.abs(tagged.c.running))
+        agg = (
+            select(
+                tagged.c.account_id.label("account_id"),
+                tagged.c.symbol_id.label("symbol_id"),
+                func.max(tagged.c.net).label("net"),
+                func.sum(-tagged.c.signed * tagged.c.price).label("cash"),
+                func.sum(case((opening, opened), else_=0)).label("open_qty"),
+                func.sum(case((opening, opened * tagged.c.price), else_=0)).label("open_notional"),
+                func.max(case((tagged.c.recency == 1, tagged.c.price))).label("mark"),
+            )
+            .group_by(tagged.c.account_id, tagged.c.symbol_id)
+            .subquery()
+        )
+        avg_price = case((agg.c.open_qty > 0, agg.c.open_notional / agg.c.open_qty), else_=literal(0))
+        source = select(
+            agg.c.account_id,
+            agg.c.symbol_id,
+            agg.c.net,
+            avg_price,
+            agg.c.cash + agg.c.net * avg_price,
+            agg.c.mark,
+            (agg.c.mark - avg_price) * agg.c.net,
+        )
+
+        self.db.execute(delete(Position))
+        result = self.db.execute(
+            insert(Position).from_select(
+                ["account_id", "symbol_id", "qty", "avg_price", "realized_pnl", "mark_price", "unrealized_pnl"],
+                source,
+            )
+        )
+        self.db.commit()
+        self.invalidate_reads()
+        return result.rowcount
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+from sqlalchemy import and_, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.coalesce import read_coalescer
+from app.models.asset import Asset, AssetType
+from app.models.bar import Bar
+from app.models.symbol import Symbol
+from app.models.universe import UniverseMember, UniverseSnapshot
+from app.observability.metrics import instrumented
+
+if TYPE_CHECKING:
+    from app.marketdata.universe import Selection, UniverseRules
+
+# Asset types whose is_active follows the equity universe; others are left alone
+UNIVERSE_ASSET_TYPES = (AssetType.equity, AssetType.etf)
+
+
+class UniverseRepository:
+    """Versioned universe snapshots and the active flags they drive."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @instrumented("daily_window")
+    def daily_window(self, start: date, end: date) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (symbol_id, close, volume) of every daily bar dated start <= day < end.
+
+        One query over all symbols, ordered by symbol then time, so each
+        symbol's bars are one contiguous run.
+        """
+        rows = self.db.execute(
+            select(Bar.symbol_id, Bar.close, Bar.volume)
+            .where(
+                Bar.timeframe == "1d",
+                Bar.ts >= datetime.combine(start, datetime.min.time(), timezone.utc),
+                Bar.ts < datetime.combine(end, datetime.min.time(), timezone.utc),
+            )
+            .order_by(Bar.symbol_id, Bar.ts)
+        ).all()
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+        symbol_ids, close, volume = zip(*rows)
+        return (
+            np.array(symbol_ids, dtype=np.int64),
+            np.array(close, dtype=np.float64),
+            np.array(volume, dtype=np.float64),
+        )
+
+    @instrumented("create_snapshot")
+    def create_snapshot(
+        self, name: str, as_of: date, rules: UniverseRules, selection: Selection, activate: bool = False,
+    ) -> UniverseSnapshot:
+        """Store a selection as the next version of `name`, activating it in the same transaction."""
+        version = self.db.execute(
+            select(func.coalesce(func.max(UniverseSnapshot.version), 0)).where(UniverseSnapshot.name == name)
+        ).scalar_one() + 1
+        snapshot = UniverseSnapshot(name=name, version=version, as_of=as_of, **vars(rules))
+        self.db.add(snapshot)
+        try:
+            self.db.flush()
+            if len(selection):
+                self.db.execute(insert(UniverseMember), [
+                    {"snapshot_id": snapshot.id, "symbol_id": symbol_id, "rank": rank, "adv": adv, "price": price}
+                    for rank, (symbol_id, adv, price) in enumerate(
+                        zip(selection.symbol_ids.tolist(), selection.adv.tolist(), selection.price.tolist()), 1,
+                    )
+                ])
+            if activate:
+                self._set_active(snapshot.id)
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise ValueError(f"Universe {name!r} version {version} was created concurrently; retry") from e
+        if activate:
+            self._invalidate_flags()
+        self.db.refresh(snapshot)
+        return snapshot
+
+    @instrumented("activate")
+    def activate(self, snapshot_id: int) -> tuple[int, int]:
+        """
+        Make a snapshot's members the active symbols, one UPDATE per table.
+
+        Only rows whose flag changes are written. Equity and ETF assets
+        follow their ticker; other asset types keep their flag. Returns
+        the (symbols, assets) rows changed.
+        """
+        changed = self._set_active(snapshot_id)
+        self.db.commit()
+        self._invalidate_flags()
+        return changed
+
+    def _set_active(self, snapshot_id: int) -> tuple[int, int]:
+        members = select(UniverseMember.symbol_id).where(UniverseMember.snapshot_id == snapshot_id)
+        selected = Symbol.id.in_(members)
+        symbols = self.db.execute(
+            update(Symbol).where(Symbol.active != selected).values(active=selected)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        tickers = select(Symbol.symbol).join(UniverseMember, UniverseMember.symbol_id == Symbol.id).where(
+            UniverseMember.snapshot_id == snapshot_id
+        )
+        listed = Asset.symbol.in_(tickers)
+        assets = self.db.execute(
+            update(Asset)
+            .where(and_(Asset.asset_type.in_(UNIVERSE_ASSET_TYPES), Asset.is_active != listed))
+            .values(is_active=listed)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        return symbols, assets
+
+    def _invalidate_flags(self) -> None:
+        read_coalescer.invalidate(Symbol.__tablename__)
+        read_coalescer.invalidate(Asset.__tablename__)
+
+    @instrumented("get_snapshot")
+    def get_snapshot(self, name: str, version: int | None = None) -> UniverseSnapshot | None:
+        """A version of a universe, the latest by default."""
+        stmt = select(UniverseSnapshot).where(UniverseSnapshot.name == name)
+        if version is not None:
+            stmt = stmt.where(UniverseSnapshot.version == version)
+        return self.db.execute(stmt.order_by(UniverseSnapshot.version.desc()).limit(1)).scalar_one_or_none()
+
+    @instrumented("list_snapshots")
+    def list_snapshots(self, name: str) -> Sequence[UniverseSnapshot]:
+        return self.db.execute(
+            select(UniverseSnapshot).where(UniverseSnapshot.name == name).order_by(UniverseSnapshot.version.desc())
+        ).scalars().all()
+
+    @instrumented("members")
+    def members(self, snapshot_id: int) -> list[tuple]:
+        """(rank, symbol_id, ticker, adv, price) of a snapshot in rank order."""
+        return [tuple(row) for row in self.db.execute(
+            select(UniverseMember.rank, UniverseMember.symbol_id, Symbol.symbol, UniverseMember.adv, UniverseMember.price)
+            .join(Symbol, Symbol.id == UniverseMember.symbol_id)
+            .where(UniverseMember.snapshot_id == snapshot_id)
+            .order_by(UniverseMember.rank)
+        ).all()]
@@ -1,6 +1,12 @@
 from app.schemas.strategy import StrategyCreate, StrategyRead, StrategyUpdate, StrategyQuery
 from app.schemas.symbol import SymbolCreate, SymbolRead, SymbolUpdate, SymbolQuery
 from app.schemas.asset import AssetCreate, AssetRead, AssetUpdate, AssetQuery
+from app.schemas.position import PositionRead, PositionQuery
+from app.schemas.bar import BarIngestResult, BarSeries
+from app.schemas.corporate_action import CorporateActionCreate, CorporateActionRead
+from app.schemas.calendar import SessionRead, CalendarRead, MarketClock
+from app.schemas.data_quality import DataQualityIssueRead, IssueCounts, SymbolQuality, StaleFeed, DataQualitySummary
+from app.schemas.universe import UniverseBuild, UniverseMemberRead, UniverseSnapshotSummary, UniverseSnapshotRead
 
 __all__ = [
     "StrategyCreate",
@@ -15,4 +21,22 @@ __all__ = [
     "AssetRead",
     "AssetUpdate",
     "AssetQuery",
+    "PositionRead",
+    "PositionQuery",
+    "BarIngestResult",
+    "BarSeries",
+    "CorporateActionCreate",
+    "CorporateActionRead",
+    "SessionRead",
+    "CalendarRead",
+    "MarketClock",
+    "DataQualityIssueRead",
+    "IssueCounts",
+    "SymbolQuality",
+    "StaleFeed",
+    "DataQualitySummary",
+    "UniverseBuild",
+    "UniverseMemberRead",
+    "UniverseSnapshotSummary",
+    "UniverseSnapshotRead",
 ]
\ No newline at end of file
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
-from typing import Annotated, Literal, Optional
+from typing import Annotated, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 AssetType = Literal["equity", "etf", "forex", "crypto", "future", "option", "bond", "other"]
@@ -46,3 +46,4 @@ class AssetQuery(BaseModel):
     offset: int = Field(0, ge=0)
     order_by: Optional[Literal["created_at","updated_at","symbol","exchange","asset_type","name"]] = "symbol"
     order_dir: Optional[Literal["asc","desc"]] = "asc"
+    fields: Optional[List[str]] = Field(None, description="Sparse fieldset: only these columns are selected")
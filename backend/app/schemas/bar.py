@@ -0,0 +1,27 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel
+
+
+class BarIngestResult(BaseModel):
+    """Outcome of a bulk bar upload."""
+    rows: int
+    chunks: int
+    skipped: int
+    unknown_symbols: List[str]
+    issues: int = 0
+
+    model_config = {"from_attributes": True}
+
+
+class BarSeries(BaseModel):
+    """Columnar OHLCV series of one symbol and timeframe."""
+    symbol_id: int
+    timeframe: str
+    ts: List[datetime]
+    open: List[float]
+    high: List[float]
+    low: List[float]
+    close: List[float]
+    volume: List[float]
@@ -0,0 +1,28 @@
+from __future__ import annotations
+from datetime import date, datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class SessionRead(BaseModel):
+    date: date
+    open: datetime
+    close: datetime
+    early_close: bool
+
+
+class CalendarRead(BaseModel):
+    """Sessions of an exchange over a date range."""
+    exchange: str
+    timezone: str
+    sessions: List[SessionRead]
+
+
+class MarketClock(BaseModel):
+    """Session state of an exchange at one instant."""
+    exchange: str
+    at: datetime
+    is_open: bool
+    session: Optional[SessionRead] = None
+    next_open: datetime
+    next_close: datetime
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from typing import Generic, List, TypeVar
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Paginated list response."""
+    items: List[T]
+    total: int
+    limit: int
+    offset: int
+
+
+K = TypeVar("K")
+
+MAX_BATCH_IDS = 500
+
+
+class BatchGet(BaseModel, Generic[K]):
+    """Request body for batch multi-get."""
+    ids: List[K] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class BatchResult(BaseModel, Generic[T, K]):
+    """Batch multi-get response: found entities in request order plus unknown ids."""
+    items: List[T]
+    missing: List[K]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+
+
+class CorporateActionCreate(BaseModel):
+    ts: datetime = Field(..., description="Ex-date; bars before it are adjusted")
+    type: Literal["split", "dividend"]
+    ratio: Optional[float] = Field(None, gt=0, description="New shares per old share, e.g. 4 for a 4-for-1 split")
+    cash: Optional[float] = Field(None, gt=0, description="Dividend per share")
+    factor: Optional[float] = Field(
+        None, gt=0, le=1e6, description="Price factor override; derived from ratio or cash when omitted",
+    )
+
+    @model_validator(mode="after")
+    def validate_type_requirements(self):
+        """Splits need a ratio, dividends a cash amount."""
+        if self.type == "split" and self.ratio is None:
+            raise ValueError("ratio is required for splits")
+        if self.type == "dividend" and self.cash is None:
+            raise ValueError("cash is required for dividends")
+        return self
+
+
+class CorporateActionRead(BaseModel):
+    id: int
+    symbol_id: int
+    ts: datetime
+    type: str
+    ratio: Optional[float] = None
+    cash: Optional[float] = None
+    factor: float
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
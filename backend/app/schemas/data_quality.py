@@ -0,0 +1,43 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+
+class DataQualityIssueRead(BaseModel):
+    id: int
+    symbol_id: int
+    timeframe: str
+    kind: str
+    start_ts: datetime
+    end_ts: datetime
+    count: int
+    detail: str
+    detected_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class IssueCounts(BaseModel):
+    """Issues of one kind: how many runs, how many bars they cover, and the latest start."""
+    issues: int
+    bars: int
+    last_start: datetime
+
+
+class SymbolQuality(BaseModel):
+    symbol_id: int
+    kinds: Dict[str, IssueCounts]
+
+
+class StaleFeed(BaseModel):
+    symbol_id: int
+    last_bar_close: datetime
+
+
+class DataQualitySummary(BaseModel):
+    """Findings per symbol and kind, plus feeds that are quiet during the session."""
+    since: Optional[datetime] = None
+    at: datetime
+    symbols: List[SymbolQuality]
+    stale: List[StaleFeed]
@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
-from typing import Annotated, Literal, Optional
+from typing import Annotated, List, Literal, Optional
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 # Import enums from model
@@ -89,6 +89,20 @@ class OrderUpdate(BaseModel):
         return v
 
 
+class OrderFill(BaseModel):
+    """An execution reported for an order."""
+    quantity: Annotated[Decimal, Field(gt=0)]
+    price: Annotated[Decimal, Field(gt=0)]
+    filled_at: Optional[datetime] = None
+
+    @field_validator("quantity", "price", mode="before")
+    @classmethod
+    def convert_to_decimal(cls, v):
+        if isinstance(v, str):
+            return Decimal(v)
+        return v
+
+
 class OrderRead(OrderBase):
     id: UUID
     status: OrderStatus
@@ -118,4 +132,5 @@ class OrderQuery(BaseModel):
     order_by: Optional[Literal[
         "created_at", "updated_at", "symbol_id", "status", "side", "quantity"
     ]] = "created_at"
-    order_dir: Optional[Literal["asc", "desc"]] = "desc"
\ No newline at end of file
+    order_dir: Optional[Literal["asc", "desc"]] = "desc"
+    fields: Optional[List[str]] = Field(None, description="Sparse fieldset: only these columns are selected")
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class PositionRead(BaseModel):
+    id: int
+    account_id: Optional[UUID] = None
+    symbol_id: UUID
+    qty: Decimal
+    avg_price: Decimal
+    realized_pnl: Decimal
+    mark_price: Optional[Decimal] = None
+    unrealized_pnl: Optional[Decimal] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class PositionQuery(BaseModel):
+    """Query parameters for listing positions."""
+    account_id: Optional[UUID] = None
+    symbol_id: Optional[UUID] = None
+    open_only: bool = Field(True, description="Hide flat positions")
+    limit: int = Field(50, ge=1, le=200)
+    offset: int = Field(0, ge=0)
+    order_by: Optional[Literal["created_at", "updated_at", "symbol_id", "qty", "realized_pnl"]] = "updated_at"
+    order_dir: Optional[Literal["asc", "desc"]] = "desc"
+    fields: Optional[List[str]] = Field(None, description="Sparse fieldset: only these columns are selected")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import Annotated, Literal, Optional
+from typing import Annotated, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 class StrategyBase(BaseModel):
@@ -33,3 +33,4 @@ class StrategyQuery(BaseModel):
     offset: int = Field(0, ge=0)
     order_by: Optional[Literal["created_at", "updated_at", "name", "is_active"]] = "created_at"
     order_dir: Optional[Literal["asc", "desc"]] = "desc"
+    fields: Optional[List[str]] = Field(None, description="Sparse fieldset: only these columns are selected")
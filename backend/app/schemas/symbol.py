@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import Annotated, Literal, Optional
+from typing import Annotated, List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -37,4 +37,5 @@ class SymbolQuery(BaseModel):
     limit: int = Field(50, ge=1, le=200)
     offset: int = Field(0, ge=0)
     order_by: Optional[Literal["created_at", "updated_at", "symbol", "name", "active"]] = "symbol"
-    order_dir: Optional[Literal["asc", "desc"]] = "asc"
\ No newline at end of file
+    order_dir: Optional[Literal["asc", "desc"]] = "asc"
+    fields: Optional[List[str]] = Field(None, description="Sparse fieldset: only these columns are selected")
@@ -0,0 +1,43 @@
+from __future__ import annotations
+from datetime import date, datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class UniverseBuild(BaseModel):
+    name: str = Field("default", min_length=1, max_length=32)
+    as_of: Optional[date] = Field(None, description="Selection date; only bars before it are used (default: today)")
+    top_n: int = Field(500, ge=1, le=10_000)
+    lookback_days: int = Field(63, ge=1, le=756, description="Lookback window in trading sessions")
+    min_price: float = Field(5.0, ge=0, description="Minimum last close")
+    min_adv: float = Field(0.0, ge=0, description="Minimum average daily dollar volume")
+    min_coverage: float = Field(0.8, ge=0, le=1, description="Share of lookback sessions that must have a bar")
+    activate: bool = Field(False, description="Make the members the active symbols")
+
+
+class UniverseMemberRead(BaseModel):
+    rank: int
+    symbol_id: int
+    symbol: str
+    adv: float
+    price: float
+
+
+class UniverseSnapshotSummary(BaseModel):
+    id: int
+    name: str
+    version: int
+    as_of: date
+    top_n: int
+    lookback_days: int
+    min_price: float
+    min_adv: float
+    min_coverage: float
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class UniverseSnapshotRead(UniverseSnapshotSummary):
+    """A snapshot with its members in rank order."""
+    members: List[UniverseMemberRead]
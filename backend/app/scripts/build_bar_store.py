@@ -0,0 +1,28 @@
+"""
+Build or extend the local memory-mapped bar store from the bars table.
+
+Usage: python -m app.scripts.build_bar_store [timeframe ...]
+
+Writes under BAR_STORE_DIR (default data/bars). Re-running only appends
+bars newer than what each series already holds.
+"""
+import sys
+
+from app.db import SessionLocal
+from app.marketdata.bars import STORED_TIMEFRAMES
+from app.marketdata.store import BarStore
+
+
+def main() -> None:
+    store = BarStore()
+    db = SessionLocal()
+    try:
+        for timeframe in sys.argv[1:] or STORED_TIMEFRAMES:
+            appended = store.sync(db, timeframe)
+            print(f"{timeframe}: appended {sum(appended.values())} bars across {len(appended)} symbols")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Select the monthly universe and make it the active symbol set.
+
+Usage: python -m app.scripts.build_universe [name] [as_of YYYY-MM-DD]
+
+Meant to run from cron on the first trading day of each month. Rules
+come from UNIVERSE_TOP_N, UNIVERSE_LOOKBACK_DAYS, UNIVERSE_MIN_PRICE,
+UNIVERSE_MIN_ADV and UNIVERSE_MIN_COVERAGE.
+"""
+import os
+import sys
+from datetime import date
+
+from app.db import SessionLocal
+from app.marketdata.universe import UniverseRules, build_universe
+
+
+def main() -> None:
+    name = sys.argv[1] if len(sys.argv) > 1 else "default"
+    as_of = date.fromisoformat(sys.argv[2]) if len(sys.argv) > 2 else date.today()
+    defaults = UniverseRules()
+    rules = UniverseRules(
+        top_n=int(os.getenv("UNIVERSE_TOP_N", defaults.top_n)),
+        lookback_days=int(os.getenv("UNIVERSE_LOOKBACK_DAYS", defaults.lookback_days)),
+        min_price=float(os.getenv("UNIVERSE_MIN_PRICE", defaults.min_price)),
+        min_adv=float(os.getenv("UNIVERSE_MIN_ADV", defaults.min_adv)),
+        min_coverage=float(os.getenv("UNIVERSE_MIN_COVERAGE", defaults.min_coverage)),
+    )
+    db = SessionLocal()
+    try:
+        snapshot, selection = build_universe(db, name, as_of, rules, activate=True)
+        print(f"{name} v{snapshot.version} as of {as_of}: {len(selection)} symbols active")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
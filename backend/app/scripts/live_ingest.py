@@ -0,0 +1,46 @@
+"""
+Stream live minute bars for active symbols into the bars table and Redis.
+
+Usage: python -m app.scripts.live_ingest
+
+Reads ALPACA_DATA_URL (or ALPACA_DATA_FEED), ALPACA_API_KEY_ID,
+ALPACA_API_SECRET_KEY and REDIS_URL. Stops on SIGINT/SIGTERM.
+"""
+import asyncio
+import logging
+import signal
+
+from sqlalchemy import select
+
+from app.db import SessionLocal
+from app.marketdata.hot_bars import HotBarBuffer
+from app.marketdata.live import LiveIngestor, database_sink, hot_buffer_sink
+from app.models.symbol import Symbol
+
+
+async def main() -> None:
+    db = SessionLocal()
+    try:
+        symbols = dict(db.execute(select(Symbol.symbol, Symbol.id).where(Symbol.active.is_(True))).all())
+    finally:
+        db.close()
+
+    buffer = HotBarBuffer.from_url()
+    ingestor = LiveIngestor.from_env(symbols)
+    ingestor.add_sink("database", database_sink(SessionLocal))
+    ingestor.add_sink("hot_buffer", hot_buffer_sink(buffer))
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    print(f"Streaming bars for {len(symbols)} symbols")
+    try:
+        await ingestor.run(stop)
+    finally:
+        await buffer.redis.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,20 @@
+"""
+Rebuild the positions table from order history.
+
+Usage: python -m app.scripts.rebuild_positions
+"""
+from app.db import SessionLocal
+from app.repositories.position_repo import PositionRepository
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        count = PositionRepository(db).rebuild_from_history()
+    finally:
+        db.close()
+    print(f"Rebuilt {count} positions")
+
+
+if __name__ == "__main__":
+    main()
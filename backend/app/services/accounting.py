@@ -0,0 +1,31 @@
+from __future__ import annotations
+from decimal import Decimal
+
+ZERO = Decimal("0")
+
+
+def apply_fill(qty: Decimal, avg_price: Decimal, signed_qty: Decimal, price: Decimal) -> tuple[Decimal, Decimal, Decimal]:
+    """
+    Apply a signed fill to a position using average-cost accounting.
+
+    Returns the new quantity, the new average price and the realized PnL
+    produced by the part of the fill that closed existing exposure.
+    """
+    if qty == 0 or (qty > 0) == (signed_qty > 0):
+        # Opening or adding: blend the average price
+        new_qty = qty + signed_qty
+        new_avg = (abs(qty) * avg_price + abs(signed_qty) * price) / abs(new_qty)
+        return new_qty, new_avg, ZERO
+
+    closed = min(abs(signed_qty), abs(qty))
+    direction = 1 if qty > 0 else -1
+    realized = (price - avg_price) * closed * direction
+    new_qty = qty + signed_qty
+    if new_qty == 0:
+        new_avg = ZERO
+    elif (new_qty > 0) != (qty > 0):
+        # Flipped through zero: the remainder opens at the fill price
+        new_avg = price
+    else:
+        new_avg = avg_price
+    return new_qty, new_avg, realized
@@ -0,0 +1,467 @@
+from __future__ import annotations
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Any, Hashable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.order import Order, OrderSide, OrderStatus, QuantityType
+from app.models.position import Position
+from app.services.accounting import apply_fill
+
+# Statuses whose unfilled remainder still counts towards open exposure
+WORKING_STATUSES = (OrderStatus.new, OrderStatus.pending_broker, OrderStatus.partially_filled)
+
+ZERO = Decimal("0")
+
+
+class RiskCheckError(ValueError):
+    """Raised when an order breaches a pre-trade risk limit."""
+
+
+def _env_decimal(name: str) -> Decimal | None:
+    raw = os.getenv(name)
+    return Decimal(raw) if raw else None
+
+
+@dataclass(frozen=True)
+class RiskLimits:
+    """Hard pre-trade limits. A limit set to None is not enforced."""
+    max_order_notional: Decimal | None = None
+    max_open_notional_per_account: Decimal | None = None
+    max_open_notional_per_strategy: Decimal | None = None
+    max_position_qty: Decimal | None = None
+    max_daily_loss: Decimal | None = None
+    max_reject_rate: float | None = None
+    reject_window_seconds: float = 60.0
+    reject_min_samples: int = 10
+
+    @classmethod
+    def from_env(cls) -> "RiskLimits":
+        rate = os.getenv("RISK_MAX_REJECT_RATE")
+        return cls(
+            max_order_notional=_env_decimal("RISK_MAX_ORDER_NOTIONAL"),
+            max_open_notional_per_account=_env_decimal("RISK_MAX_OPEN_NOTIONAL_PER_ACCOUNT"),
+            max_open_notional_per_strategy=_env_decimal("RISK_MAX_OPEN_NOTIONAL_PER_STRATEGY"),
+            max_position_qty=_env_decimal("RISK_MAX_POSITION_QTY"),
+            max_daily_loss=_env_decimal("RISK_MAX_DAILY_LOSS"),
+            max_reject_rate=float(rate) if rate else None,
+            reject_window_seconds=float(os.getenv("RISK_REJECT_WINDOW_SECONDS", "60")),
+            reject_min_samples=int(os.getenv("RISK_REJECT_MIN_SAMPLES", "10")),
+        )
+
+    @property
+    def needs_notional(self) -> bool:
+        return any(
+            limit is not None
+            for limit in (
+                self.max_order_notional,
+                self.max_open_notional_per_account,
+                self.max_open_notional_per_strategy,
+            )
+        )
+
+
+@dataclass
+class _Position:
+    qty: Decimal = ZERO
+    avg_price: Decimal = ZERO
+
+
+@dataclass
+class _OpenOrder:
+    account_id: UUID | None
+    strategy_id: UUID | None
+    symbol_id: UUID
+    sign: int
+    remaining_qty: Decimal
+    unit_price: Decimal | None
+    notional: Decimal
+
+
+@dataclass
+class RiskTicket:
+    """Exposure reserved by a passed check until the order is persisted or released."""
+    key: Hashable
+    order: _OpenOrder
+    released: bool = field(default=False)
+
+
+class RiskEngine:
+    """
+    In-memory pre-trade risk engine.
+
+    Keeps per-account positions, per-account and per-strategy open notional
+    and daily realized PnL so that checks never touch the orders table.
+    State is warmed from the positions table, today's fills and working
+    orders once, then maintained incrementally from order acceptance,
+    repricing, fills and cancels reported by the order repository.
+    """
+
+    def __init__(self, limits: RiskLimits | None = None):
+        self.limits = limits or RiskLimits()
+        self._lock = threading.Lock()
+        # Serializes warmups so a burst of first requests loads the book once
+        self._warm_lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all cached state; the next check re-warms from the database."""
+        with self._lock:
+            self._warm = False
+            self._account_pos: dict[tuple[UUID | None, UUID], _Position] = {}
+            self._pending_qty: dict[tuple[UUID | None, UUID], Decimal] = {}
+            self._account_open: dict[UUID | None, Decimal] = {}
+            self._strategy_open: dict[UUID | None, Decimal] = {}
+            self._open_orders: dict[Hashable, _OpenOrder] = {}
+            self._daily_pnl: dict[UUID | None, Decimal] = {}
+            self._pnl_day: date = datetime.utcnow().date()
+            self._marks: dict[UUID, Decimal] = {}
+            self._decisions: dict[UUID | None, deque[tuple[float, bool]]] = {}
+
+    # ------------------------------------------------------------------ warmup
+
+    def ensure_warm(self, db: Session) -> None:
+        if self._warm:
+            return
+        with self._warm_lock:
+            if not self._warm:
+                self._load(db)
+
+    def warm(self, db: Session) -> None:
+        """Rebuild positions, open notional and today's PnL from the database."""
+        with self._warm_lock:
+            self._load(db)
+
+    def _load(self, db: Session) -> None:
+        """
+        Load state from the positions table, today's fills and working orders.
+
+        Today's realized PnL is replayed from the position each symbol held
+        before today's fills, taken as the current position less those fills
+        at the current average price, so no history beyond today is read.
+        """
+        today = datetime.utcnow().date()
+        start_of_day = datetime(today.year, today.month, today.day)
+        positions = db.execute(
+            select(Position.account_id, Position.symbol_id, Position.qty, Position.avg_price, Position.mark_price)
+        ).all()
+        fills = db.execute(
+            select(
+                Order.account_id, Order.symbol_id, Order.side,
+                Order.filled_quantity, Order.average_fill_price,
+            )
+            .where(
+                Order.filled_at >= start_of_day,
+                Order.filled_quantity > 0,
+                Order.average_fill_price.is_not(None),
+            )
+            .order_by(Order.filled_at)
+        ).all()
+        working = db.execute(
+            select(
+                Order.id, Order.account_id, Order.strategy_id, Order.symbol_id, Order.side,
+                Order.quantity, Order.quantity_type, Order.filled_quantity,
+                Order.price, Order.stop_price,
+            ).where(Order.status.in_(WORKING_STATUSES))
+        ).all()
+
+        with self._lock:
+            self._warm = False
+            self._account_pos.clear()
+            self._pending_qty.clear()
+            self._account_open.clear()
+            self._strategy_open.clear()
+            self._open_orders.clear()
+            self._daily_pnl.clear()
+            self._marks.clear()
+            self._pnl_day = today
+
+            for account_id, symbol_id, qty, avg_price, mark_price in positions:
+                self._account_pos[(account_id, symbol_id)] = _Position(qty, avg_price)
+                if mark_price is not None:
+                    self._marks[symbol_id] = mark_price
+
+            replay: dict[tuple[UUID | None, UUID], _Position] = {}
+            for account_id, symbol_id, side, qty, _ in fills:
+                key = (account_id, symbol_id)
+                if key not in replay:
+                    current = self._account_pos.get(key, _Position())
+                    replay[key] = _Position(current.qty, current.avg_price)
+                replay[key].qty -= qty if side == OrderSide.buy else -qty
+            for account_id, symbol_id, side, qty, price in fills:
+                pos = replay[(account_id, symbol_id)]
+                signed = qty if side == OrderSide.buy else -qty
+                pos.qty, pos.avg_price, pnl = apply_fill(pos.qty, pos.avg_price, signed, price)
+                self._daily_pnl[account_id] = self._daily_pnl.get(account_id, ZERO) + pnl
+
+            for row in working:
+                (order_id, account_id, strategy_id, symbol_id, side,
+                 quantity, quantity_type, filled_qty, price, stop_price) = row
+                entry, _, _ = self._working_entry_locked(
+                    account_id, strategy_id, symbol_id, side, quantity, quantity_type, filled_qty, price, stop_price,
+                )
+                self._reserve_locked(order_id, entry)
+
+            self._warm = True
+
+    # ------------------------------------------------------------- pre-trade
+
+    def check(self, payload: Any, key: Hashable | None = None) -> RiskTicket:
+        """
+        Run all pre-trade checks for an order payload and reserve its exposure.
+
+        Raises RiskCheckError on breach. The returned ticket must be either
+        confirmed with the persisted order id or released.
+        """
+        account_id = payload.account_id
+        now = time.monotonic()
+
+        with self._lock:
+            self._roll_day_locked()
+            self._check_reject_rate_locked(account_id, now)
+            entry, qty, notional = self._working_entry_locked(
+                account_id, payload.strategy_id, payload.symbol_id, payload.side, payload.quantity,
+                payload.quantity_type, ZERO, payload.price, payload.stop_price,
+            )
+            try:
+                self._check_limits_locked(entry, qty, notional, payload.reduce_only)
+            except RiskCheckError:
+                self._record_decision_locked(account_id, now, rejected=True)
+                raise
+            self._record_decision_locked(account_id, now, rejected=False)
+
+            ticket = RiskTicket(key if key is not None else object(), entry)
+            self._reserve_locked(ticket.key, entry)
+            return ticket
+
+    def confirm(self, ticket: RiskTicket, order_id: Hashable) -> None:
+        """Re-key a reservation to the id of the persisted order."""
+        with self._lock:
+            entry = self._open_orders.pop(ticket.key, None)
+            if entry is not None:
+                self._open_orders[order_id] = entry
+            ticket.key = order_id
+
+    def reprice(self, order: Order, price: Decimal | None, stop_price: Decimal | None) -> _OpenOrder | None:
+        """
+        Re-check a working order at a new limit or stop price and swap its reservation.
+
+        Raises RiskCheckError on breach, keeping the old reservation. Returns
+        the previous reservation so `restore` can put it back if the change
+        is not persisted.
+        """
+        with self._lock:
+            self._roll_day_locked()
+            entry, qty, notional = self._working_entry_locked(
+                order.account_id, order.strategy_id, order.symbol_id, order.side, order.quantity,
+                order.quantity_type, order.filled_quantity or ZERO, price, stop_price,
+            )
+            previous = self._open_orders.get(order.id)
+            self._unreserve_locked(order.id)
+            try:
+                self._check_limits_locked(entry, qty, notional, order.reduce_only)
+            except RiskCheckError:
+                if previous is not None:
+                    self._reserve_locked(order.id, previous)
+                raise
+            self._reserve_locked(order.id, entry)
+            return previous
+
+    def restore(self, order_id: Hashable, previous: _OpenOrder | None) -> None:
+        """Undo a `reprice` whose order update failed."""
+        with self._lock:
+            self._unreserve_locked(order_id)
+            if previous is not None:
+                self._reserve_locked(order_id, previous)
+
+    def release(self, ticket: RiskTicket) -> None:
+        """Return the exposure reserved by a ticket whose order was not persisted."""
+        with self._lock:
+            if not ticket.released:
+                self._unreserve_locked(ticket.key)
+                ticket.released = True
+
+    # ------------------------------------------------------ lifecycle updates
+
+    def on_fill(self, order: Order, qty: Decimal, price: Decimal) -> None:
+        """Apply a fill to positions, open notional and daily PnL."""
+        sign = 1 if order.side == OrderSide.buy else -1
+        with self._lock:
+            self._roll_day_locked()
+            pnl = self._apply_position_locked(order.account_id, order.symbol_id, sign, qty, price)
+            self._daily_pnl[order.account_id] = self._daily_pnl.get(order.account_id, ZERO) + pnl
+
+            entry = self._open_orders.get(order.id)
+            if entry is None:
+                return
+            self._unreserve_locked(order.id)
+            if order.status in WORKING_STATUSES:
+                if order.quantity_type == QuantityType.notional:
+                    entry.notional = max(entry.notional - qty * price, ZERO)
+                    entry.remaining_qty = entry.notional / price
+                else:
+                    entry.remaining_qty = max(entry.remaining_qty - qty, ZERO)
+                    entry.notional = entry.remaining_qty * (entry.unit_price or price)
+                self._reserve_locked(order.id, entry)
+
+    def on_order_closed(self, order_id: Hashable) -> None:
+        """Release the open exposure of a canceled, rejected or expired order."""
+        with self._lock:
+            self._unreserve_locked(order_id)
+
+    # ------------------------------------------------------------ inspection
+
+    def snapshot(self, account_id: UUID | None = None) -> dict[str, Any]:
+        """Current exposure for one account (used by tests and diagnostics)."""
+        with self._lock:
+            return {
+                "positions": {
+                    symbol_id: pos.qty
+                    for (acct, symbol_id), pos in self._account_pos.items()
+                    if acct == account_id and pos.qty != 0
+                },
+                "open_notional": self._account_open.get(account_id, ZERO),
+                "daily_pnl": self._daily_pnl.get(account_id, ZERO),
+            }
+
+    # --------------------------------------------------------------- helpers
+
+    def _check_limits_locked(self, entry: _OpenOrder, qty: Decimal | None, notional: Decimal | None, reduce_only: bool) -> None:
+        limits = self.limits
+        pos_key = (entry.account_id, entry.symbol_id)
+        current = self._account_pos.get(pos_key)
+        current_qty = current.qty if current else ZERO
+        projected = None if qty is None else current_qty + self._pending_qty.get(pos_key, ZERO) + entry.sign * qty
+        reducing = qty is not None and abs(current_qty + entry.sign * qty) < abs(current_qty)
+
+        if reduce_only and reducing:
+            # De-risking is always allowed, even when caps are already breached
+            return
+
+        if notional is None and limits.needs_notional:
+            raise RiskCheckError("Risk check failed: no reference price to compute order notional")
+
+        if limits.max_order_notional is not None and notional > limits.max_order_notional:
+            raise RiskCheckError(
+                f"Risk check failed: order notional {notional} exceeds limit {limits.max_order_notional}"
+            )
+
+        if limits.max_open_notional_per_account is not None:
+            open_notional = self._account_open.get(entry.account_id, ZERO) + notional
+            if open_notional > limits.max_open_notional_per_account:
+                raise RiskCheckError(
+                    f"Risk check failed: account open notional {open_notional} exceeds limit "
+                    f"{limits.max_open_notional_per_account}"
+                )
+
+        if limits.max_open_notional_per_strategy is not None and entry.strategy_id is not None:
+            open_notional = self._strategy_open.get(entry.strategy_id, ZERO) + notional
+            if open_notional > limits.max_open_notional_per_strategy:
+                raise RiskCheckError(
+                    f"Risk check failed: strategy open notional {open_notional} exceeds limit "
+                    f"{limits.max_open_notional_per_strategy}"
+                )
+
+        if limits.max_position_qty is not None:
+            if projected is None:
+                raise RiskCheckError("Risk check failed: no reference price to convert notional to units")
+            if abs(projected) > limits.max_position_qty and not reducing:
+                raise RiskCheckError(
+                    f"Risk check failed: projected position {projected} exceeds limit {limits.max_position_qty}"
+                )
+
+        if limits.max_daily_loss is not None and not reducing:
+            pnl = self._daily_pnl.get(entry.account_id, ZERO)
+            if pnl <= -limits.max_daily_loss:
+                raise RiskCheckError(
+                    f"Risk check failed: daily loss {-pnl} reached limit {limits.max_daily_loss}"
+                )
+
+    def _check_reject_rate_locked(self, account_id: UUID | None, now: float) -> None:
+        limits = self.limits
+        if limits.max_reject_rate is None:
+            return
+        window = self._decisions.get(account_id)
+        if not window:
+            return
+        horizon = now - limits.reject_window_seconds
+        while window and window[0][0] < horizon:
+            window.popleft()
+        if len(window) < limits.reject_min_samples:
+            return
+        rejects = sum(1 for _, rejected in window if rejected)
+        if rejects / len(window) >= limits.max_reject_rate:
+            raise RiskCheckError("Risk check failed: reject rate limit reached, order flow halted")
+
+    def _record_decision_locked(self, account_id: UUID | None, now: float, rejected: bool) -> None:
+        if self.limits.max_reject_rate is None:
+            return
+        self._decisions.setdefault(account_id, deque()).append((now, rejected))
+
+    def _roll_day_locked(self) -> None:
+        today = datetime.utcnow().date()
+        if today != self._pnl_day:
+            self._pnl_day = today
+            self._daily_pnl.clear()
+
+    def _reserve_locked(self, key: Hashable, entry: _OpenOrder) -> None:
+        self._open_orders[key] = entry
+        pos_key = (entry.account_id, entry.symbol_id)
+        self._pending_qty[pos_key] = self._pending_qty.get(pos_key, ZERO) + entry.sign * entry.remaining_qty
+        self._account_open[entry.account_id] = self._account_open.get(entry.account_id, ZERO) + entry.notional
+        if entry.strategy_id is not None:
+            self._strategy_open[entry.strategy_id] = self._strategy_open.get(entry.strategy_id, ZERO) + entry.notional
+
+    def _unreserve_locked(self, key: Hashable) -> None:
+        entry = self._open_orders.pop(key, None)
+        if entry is None:
+            return
+        pos_key = (entry.account_id, entry.symbol_id)
+        self._pending_qty[pos_key] = self._pending_qty.get(pos_key, ZERO) - entry.sign * entry.remaining_qty
+        self._account_open[entry.account_id] = self._account_open.get(entry.account_id, ZERO) - entry.notional
+        if entry.strategy_id is not None:
+            self._strategy_open[entry.strategy_id] = self._strategy_open.get(entry.strategy_id, ZERO) - entry.notional
+
+    def _working_entry_locked(
+        self, account_id: UUID | None, strategy_id: UUID | None, symbol_id: UUID, side: OrderSide,
+        quantity: Decimal, quantity_type: QuantityType, filled_qty: Decimal,
+        price: Decimal | None, stop_price: Decimal | None,
+    ) -> tuple[_OpenOrder, Decimal | None, Decimal | None]:
+        """Reservation for an order's unfilled remainder, plus its qty and notional (None when unknown)."""
+        sign = 1 if side == OrderSide.buy else -1
+        ref = price if price is not None else stop_price
+        if ref is None:
+            ref = self._marks.get(symbol_id)
+        if quantity_type == QuantityType.notional:
+            notional = max(quantity - filled_qty * (ref or ZERO), ZERO)
+            qty = notional / ref if ref else None
+        else:
+            qty = max(quantity - filled_qty, ZERO)
+            notional = qty * ref if ref is not None else None
+        entry = _OpenOrder(
+            account_id, strategy_id, symbol_id, sign,
+            qty if qty is not None else ZERO, ref, notional if notional is not None else ZERO,
+        )
+        return entry, qty, notional
+
+    def _apply_position_locked(
+        self, account_id: UUID | None, symbol_id: UUID, sign: int, qty: Decimal, price: Decimal,
+    ) -> Decimal:
+        """Update positions with a fill and return the realized PnL it produced."""
+        self._marks[symbol_id] = price
+
+        pos = self._account_pos.setdefault((account_id, symbol_id), _Position())
+        pos.qty, pos.avg_price, realized = apply_fill(pos.qty, pos.avg_price, sign * qty, price)
+        return realized
+
+
+# Process-wide engine shared by all order repositories
+risk_engine = RiskEngine(RiskLimits.from_env())
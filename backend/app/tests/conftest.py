@@ -21,6 +21,11 @@ os.environ["ENV"] = "test"
 from app.main import app
 from app.db import Base
 from app.api.deps import get_db
+from app.coalesce import read_coalescer
+from app.marketdata.adjust import adjustment_cache
+from app.marketdata.resample import resample_cache
+from app.services.risk_engine import risk_engine
+from app.observability import query_budget
 
 # Create in-memory SQLite engine for tests
 TEST_DATABASE_URL = "sqlite:///:memory:"
@@ -49,11 +54,39 @@ def override_get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@pytest.fixture(autouse=True)
+def query_budget_violations() -> Generator[list[str], None, None]:
+    """Fail any test whose requests run more SQL statements than the route's budget."""
+    violations: list[str] = []
+
+    def record(method, route, queries, budget, statements):
+        listing = "\n".join(f"  {sql}" for sql in statements)
+        violations.append(f"{method} {route}: {queries} statements, budget {budget}\n{listing}")
+
+    query_budget.budget_listeners.append(record)
+    yield violations
+    query_budget.budget_listeners.remove(record)
+    assert not violations, "Query budget exceeded:\n" + "\n".join(violations)
+
+
+@pytest.fixture
+def max_queries():
+    """`with max_queries(n):` fails if the block executes more than n statements."""
+    return query_budget.max_queries
+
+
 @pytest.fixture(scope="function")
 def db() -> Generator[Session, None, None]:
     """Create a fresh database for each test."""
     Base.metadata.create_all(bind=engine)
+    risk_engine.reset()
+    read_coalescer.reset()
+    resample_cache.clear()
+    adjustment_cache.clear()
     db = TestingSessionLocal()
+    # Warm up front, like a running server, so route budgets count steady-state queries
+    risk_engine.warm(db)
+    db.rollback()
     try:
         yield db
     finally:
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.admission import AdmissionMiddleware
+
+
+class TestAdmissionMiddleware:
+
+    @staticmethod
+    def _slow_app(release: asyncio.Event):
+        async def app(scope, receive, send):
+            if scope["path"] == "/orders":
+                await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+        return app
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_wait_expires(self):
+        """Requests beyond the limit wait, then get 503 with Retry-After."""
+        release = asyncio.Event()
+        app = AdmissionMiddleware(self._slow_app(release), limit=1, queue_timeout=0.05)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/orders"))
+            await asyncio.sleep(0.01)
+            second = await client.get("/orders")
+            release.set()
+            assert (await first).status_code == 200
+        assert second.status_code == 503
+        assert second.headers["retry-after"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_exempt_paths_bypass_limit(self):
+        """/metrics and /health answer even when every slot is taken."""
+        release = asyncio.Event()
+        app = AdmissionMiddleware(self._slow_app(release), limit=1, queue_timeout=0.05)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            held = asyncio.create_task(client.get("/orders"))
+            await asyncio.sleep(0.01)
+            metrics = await client.get("/metrics")
+            release.set()
+            assert (await held).status_code == 200
+        assert metrics.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_disables(self):
+        """A limit of 0 (the in-memory SQLite default) admits everything."""
+        release = asyncio.Event()
+        app = AdmissionMiddleware(self._slow_app(release), limit=0, queue_timeout=0.05)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            held = asyncio.create_task(client.get("/orders"))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(client.get("/orders"))
+            await asyncio.sleep(0.1)
+            release.set()
+            assert (await held).status_code == 200
+            assert (await second).status_code == 200
@@ -37,3 +37,19 @@ async def test_list_filters(async_client: AsyncClient):
     payload = r.json()
     assert payload["total"] >= 1
     assert any(item["symbol"] == "AAPL" for item in payload["items"])
+
+
+@pytest.mark.asyncio
+async def test_batch_get(async_client: AsyncClient):
+    r = await async_client.post("/assets", json=sample())
+    asset_id = r.json()["id"]
+    unknown = str(uuid.uuid4())
+
+    r2 = await async_client.post("/assets/batch", json={"ids": [unknown, asset_id]})
+    assert r2.status_code == 200
+    payload = r2.json()
+    assert [item["id"] for item in payload["items"]] == [asset_id]
+    assert payload["missing"] == [unknown]
+
+    r3 = await async_client.get(f"/assets/batch?ids={asset_id}")
+    assert r3.json()["items"][0]["symbol"] == "AAPL"
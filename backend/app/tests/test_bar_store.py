@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import BarArrays
+from app.marketdata.store import BarStore
+from app.models.bar import Bar
+from app.models.symbol import Symbol
+
+
+def make_bars(start: int, count: int) -> BarArrays:
+    ts = (np.datetime64("2026-10-16T13:30:00", "s") + np.arange(start, start + count) * 60).astype("datetime64[s]")
+    close = 100.0 + np.arange(start, start + count)
+    return BarArrays(ts, close, close + 1, close - 1, close, np.full(count, 10.0))
+
+
+class TestBarStore:
+    """Test the memory-mapped bar store."""
+
+    def test_append_and_read_are_memory_mapped(self, tmp_path):
+        store = BarStore(tmp_path)
+        assert store.append(1, "1m", make_bars(0, 3)) == 3
+        assert store.append(1, "1m", make_bars(3, 2)) == 2
+
+        bars = store.read(1, "1m")
+        assert isinstance(bars.close.base, np.memmap) or isinstance(bars.close, np.memmap)
+        assert bars.close.tolist() == [100.0, 101.0, 102.0, 103.0, 104.0]
+        assert np.load(tmp_path / "1m" / "1" / "ts.npy").shape == (5,)
+
+        window = store.read(1, "1m", start=bars.ts[1], end=bars.ts[3])
+        assert window.close.tolist() == [101.0, 102.0]
+
+    def test_append_skips_stored_bars(self, tmp_path):
+        store = BarStore(tmp_path)
+        store.append(1, "1m", make_bars(0, 3))
+        assert store.append(1, "1m", make_bars(1, 4)) == 2
+        assert len(store.read(1, "1m")) == 5
+
+    def test_interrupted_append_is_ignored(self, tmp_path):
+        """Columns longer than ts (a crash mid-append) are cut back to ts."""
+        store = BarStore(tmp_path)
+        store.append(1, "1m", make_bars(0, 2))
+        stale = np.concatenate([np.load(tmp_path / "1m" / "1" / "close.npy"), [999.0]])
+        np.save(tmp_path / "1m" / "1" / "close.npy", stale)
+
+        assert BarStore(tmp_path).read(1, "1m").close.tolist() == [100.0, 101.0]
+        store = BarStore(tmp_path)
+        store.append(1, "1m", make_bars(2, 1))
+        assert store.read(1, "1m").close.tolist() == [100.0, 101.0, 102.0]
+
+    def test_rejects_unordered_bars(self, tmp_path):
+        bars = make_bars(0, 3)
+        with pytest.raises(ValueError, match="strictly increasing"):
+            BarStore(tmp_path).append(1, "1m", BarArrays(bars.ts[::-1], *(bars.close for _ in range(5))))
+
+    def test_sync_from_db(self, db: Session, tmp_path):
+        """Sync builds the store, indexes tickers and appends only new bars."""
+        symbol = Symbol(symbol="AAPL")
+        db.add(symbol)
+        db.commit()
+
+        def add(minute):
+            db.add(Bar(
+                symbol_id=symbol.id, timeframe="1m", ts=datetime(2026, 10, 16, 13, minute, tzinfo=timezone.utc),
+                open=1.0, high=2.0, low=0.5, close=float(minute), volume=5.0, provider="test",
+            ))
+            db.commit()
+
+        add(30)
+        add(31)
+        store = BarStore(tmp_path)
+        assert store.sync(db, "1m") == {symbol.id: 2}
+        add(32)
+        assert store.sync(db, "1m") == {symbol.id: 1}
+
+        reopened = BarStore(tmp_path)
+        assert reopened.read("AAPL", "1m").close.tolist() == [30.0, 31.0, 32.0]
+        assert reopened.symbol_ids("1m") == [symbol.id]
+        with pytest.raises(KeyError):
+            reopened.read("MSFT", "1m")
@@ -0,0 +1,110 @@
+import io
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.marketdata import ingest
+from app.marketdata.ingest import BarIngestor, iter_csv
+from app.models.symbol import Symbol
+from app.repositories.bar_repo import BarRepository
+
+CSV = """symbol,ts,open,high,low,close,volume
+AAPL,2026-10-16T13:30:00Z,100,101,99.5,100.5,1200
+AAPL,2026-10-16T13:31:00Z,100.5,102,100,101.5,900
+MSFT,2026-10-16T13:30:00Z,300,301,299,300.5,500
+ZZZZ,2026-10-16T13:30:00Z,1,1,1,1,1
+"""
+
+
+@pytest.fixture
+def symbols(db: Session) -> dict[str, int]:
+    rows = [Symbol(symbol="AAPL"), Symbol(symbol="MSFT")]
+    db.add_all(rows)
+    db.commit()
+    return {s.symbol: s.id for s in rows}
+
+
+class TestBarRepository:
+    """Test bar ingestion and array range reads."""
+
+    def test_ingest_and_read_range(self, db: Session, symbols):
+        """Rows are resolved by ticker, unknown tickers skipped, reads return arrays."""
+        result = BarIngestor(db, "1m", "test").ingest(iter_csv(io.StringIO(CSV), chunk_size=2))
+        assert (result.rows, result.chunks, result.skipped) == (3, 2, 1)
+        assert result.unknown_symbols == ["ZZZZ"]
+
+        bars = BarRepository(db).read_range(symbols["AAPL"], "1m")
+        assert bars.ts.dtype == np.dtype("datetime64[s]")
+        assert bars.ts.tolist() == [datetime(2026, 10, 16, 13, 30), datetime(2026, 10, 16, 13, 31)]
+        assert bars.close.tolist() == [100.5, 101.5]
+        assert bars.volume.dtype == np.float64
+
+        window = BarRepository(db).read_range(
+            symbols["AAPL"], "1m", start=datetime(2026, 10, 16, 13, 31, tzinfo=timezone.utc),
+        )
+        assert len(window) == 1
+
+    def test_reingest_overwrites(self, db: Session, symbols):
+        """Loading the same bar again upserts instead of failing."""
+        BarIngestor(db, "1m", "a").ingest(iter_csv(io.StringIO(CSV)))
+        fixed = f"symbol_id,ts,open,high,low,close,volume\n{symbols['AAPL']},1792157400,100,101,99.5,100.9,1300\n"
+        BarIngestor(db, "1m", "b").ingest(iter_csv(io.StringIO(fixed)))
+
+        bars = BarRepository(db).read_range(symbols["AAPL"], "1m")
+        assert len(bars) == 2
+        assert bars.close[0] == 100.9
+
+    def test_duplicate_rows_last_wins(self, db: Session, symbols):
+        """A bar repeated within one file keeps its last row."""
+        repeated = (
+            "symbol,ts,open,high,low,close,volume\n"
+            "AAPL,2026-10-16T13:30:00Z,100,101,99,100.5,1\n"
+            "AAPL,2026-10-16T13:30:00Z,100,101,99,100.7,2\n"
+        )
+        BarIngestor(db, "1m", "test").ingest(iter_csv(io.StringIO(repeated)))
+
+        bars = BarRepository(db).read_range(symbols["AAPL"], "1m")
+        assert (bars.close.tolist(), bars.volume.tolist()) == ([100.7], [2.0])
+
+    def test_unsupported_dialect(self, db: Session, symbols, monkeypatch):
+        """Databases other than Postgres and SQLite are refused rather than given the SQLite upsert."""
+        monkeypatch.setattr(db.get_bind().dialect, "name", "mysql")
+        with pytest.raises(NotImplementedError, match="mysql"):
+            BarIngestor(db, "1m", "test").ingest(iter_csv(io.StringIO(CSV)))
+
+    def test_bad_row_is_reported(self, db: Session, symbols):
+        """A malformed row names its line."""
+        bad = "symbol,ts,open,high,low,close,volume\nAAPL,2026-10-16T13:30:00Z,x,1,1,1,1\n"
+        with pytest.raises(ValueError, match="Row 1"):
+            BarIngestor(db, "1m", "test").ingest(iter_csv(io.StringIO(bad)))
+
+    def test_unsupported_timeframe(self, db: Session):
+        with pytest.raises(ValueError, match="Unsupported timeframe"):
+            BarIngestor(db, "5m", "test")
+
+
+@pytest.mark.asyncio
+class TestBarEndpoints:
+    """Test the bar upload endpoint."""
+
+    async def test_upload_csv(self, async_client: AsyncClient, symbols):
+        """A CSV upload reports rows written and unknown symbols."""
+        response = await async_client.post(
+            "/bars/ingest",
+            files={"file": ("bars.csv", CSV.encode(), "text/csv")},
+            data={"timeframe": "1m", "provider": "upload"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"rows": 3, "chunks": 1, "skipped": 1, "unknown_symbols": ["ZZZZ"], "issues": 0}
+
+    @pytest.mark.skipif(ingest.pq is not None, reason="pyarrow is installed")
+    async def test_parquet_without_pyarrow(self, async_client: AsyncClient):
+        """Parquet is optional and reported as unsupported without pyarrow."""
+        response = await async_client.post(
+            "/bars/ingest", files={"file": ("bars.parquet", b"PAR1", "application/octet-stream")},
+        )
+        assert response.status_code == 422
+        assert "pyarrow" in response.json()["detail"]
@@ -0,0 +1,36 @@
+import json
+
+from benchmarks.run import compare, main, run
+
+
+class TestBenchmarkRunner:
+    """Smoke-test the benchmark runner so it keeps working as the API changes."""
+
+    def test_run_small_dataset(self, tmp_path):
+        """Every case runs without errors against a tiny seeded database."""
+        report = run(f"sqlite:///{tmp_path / 'bench.db'}", orders=300, assets=50, symbols=50, iterations=3, warmup=1)
+        assert report["meta"]["orders"] == 300
+        for name, result in report["results"].items():
+            assert result["n"] == 3, name
+            assert result["errors"] == 0, name
+            assert result["p50_ms"] > 0, name
+
+    def test_compare_flags_regressions(self):
+        """Only p50 growth beyond the tolerance is reported."""
+        baseline = {"get": {"p50_ms": 1.0}, "create": {"p50_ms": 2.0}}
+        results = {"get": {"p50_ms": 1.5}, "create": {"p50_ms": 2.1}, "new_case": {"p50_ms": 9.0}}
+        regressions = compare(results, baseline, tolerance=0.2)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("get:")
+
+    def test_baseline_exit_code(self, tmp_path):
+        """Comparing against a much faster baseline exits non-zero."""
+        db_url = f"sqlite:///{tmp_path / 'bench.db'}"
+        baseline = tmp_path / "baseline.json"
+        args = ["--database-url", db_url, "--orders", "100", "--assets", "10", "--symbols", "10",
+                "--iterations", "2", "--warmup", "0", "--case", "get"]
+        assert main(args + ["--save", str(baseline)]) == 0
+        report = json.loads(baseline.read_text())
+        report["results"]["get"]["p50_ms"] = 1e-6
+        baseline.write_text(json.dumps(report))
+        assert main(args + ["--baseline", str(baseline)]) == 1
@@ -0,0 +1,84 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from app.marketdata.calendar import get_calendar, nyse_holidays
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestTradingCalendar:
+    """Test precomputed sessions and searchsorted lookups."""
+
+    def test_nyse_session_counts(self):
+        calendar = get_calendar("NYSE")
+        for year, expected in ((2023, 250), (2024, 252), (2025, 250)):
+            window = calendar.between(date(year, 1, 1), date(year, 12, 31))
+            assert window.stop - window.start == expected
+
+    def test_holiday_rules(self):
+        assert date(2026, 4, 3) in nyse_holidays(2026)   # Good Friday
+        assert date(2026, 7, 3) in nyse_holidays(2026)   # July 4 on a Saturday
+        assert date(2021, 12, 31) not in nyse_holidays(2022)  # Saturday New Year's Day is not observed
+        assert date(2021, 6, 18) not in nyse_holidays(2021)   # Juneteenth starts in 2022
+
+    def test_early_close_and_dst(self):
+        sessions = get_calendar("NYSE").sessions(date(2026, 11, 26), date(2026, 11, 27))
+        assert [(s.date, s.open, s.close, s.early_close) for s in sessions] == [
+            (date(2026, 11, 27), utc(2026, 11, 27, 14, 30), utc(2026, 11, 27, 18, 0), True),
+        ]
+        summer = get_calendar("NYSE").sessions(date(2026, 7, 1), date(2026, 7, 1))[0]
+        assert summer.open == utc(2026, 7, 1, 13, 30)
+
+    def test_vectorized_queries(self):
+        calendar = get_calendar("NASDAQ")
+        ts = np.array(["2026-10-16T13:29", "2026-10-16T13:30", "2026-10-16T19:59", "2026-10-16T20:00",
+                       "2026-10-17T15:00"], dtype="datetime64[s]")
+        assert calendar.is_open(ts).tolist() == [False, True, True, False, False]
+        # Friday after the close -> Monday open
+        assert calendar.next_open(utc(2026, 10, 16, 20)) == int(utc(2026, 10, 19, 13, 30).timestamp())
+        assert calendar.next_close(utc(2026, 10, 16, 14)) == int(utc(2026, 10, 16, 20).timestamp())
+        assert bool(calendar.is_open(utc(2026, 12, 25, 15))) is False
+
+    def test_crypto_and_unknown(self):
+        crypto = get_calendar("crypto")
+        assert crypto.is_open(utc(2026, 10, 17, 0, 0)) and crypto.is_open(utc(2026, 10, 18, 23, 59))
+        with pytest.raises(KeyError):
+            get_calendar("LSE")
+
+
+@pytest.mark.asyncio
+class TestCalendarEndpoints:
+    """Test GET /calendar and /calendar/clock."""
+
+    async def test_sessions(self, async_client: AsyncClient):
+        response = await async_client.get(
+            "/calendar", params={"exchange": "XNAS", "start": "2026-12-23", "end": "2026-12-28"},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["exchange"], body["timezone"]) == ("NYSE", "America/New_York")
+        assert [(s["date"], s["early_close"]) for s in body["sessions"]] == [
+            ("2026-12-23", False), ("2026-12-24", True), ("2026-12-28", False),
+        ]
+
+    async def test_invalid_requests(self, async_client: AsyncClient):
+        assert (await async_client.get("/calendar", params={"exchange": "LSE"})).status_code == 404
+        response = await async_client.get("/calendar", params={"start": "2026-01-10", "end": "2026-01-01"})
+        assert response.status_code == 422
+
+    async def test_clock(self, async_client: AsyncClient):
+        response = await async_client.get("/calendar/clock", params={"at": "2026-10-16T14:00:00Z"})
+        body = response.json()
+        assert body["is_open"] is True
+        assert body["session"]["date"] == "2026-10-16"
+        assert body["next_close"] == "2026-10-16T20:00:00Z"
+
+        response = await async_client.get("/calendar/clock", params={"at": "2026-10-17T14:00:00Z"})
+        body = response.json()
+        assert (body["is_open"], body["session"]) == (False, None)
+        assert body["next_open"] == "2026-10-19T13:30:00Z"
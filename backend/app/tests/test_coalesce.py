@@ -0,0 +1,78 @@
+import threading
+import time
+import pytest
+from httpx import AsyncClient
+
+from app.coalesce import SingleFlight
+
+
+class TestSingleFlight:
+    """Test request coalescing."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Callers arriving while a call is in flight reuse its result."""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def slow():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return "rows"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("symbols", "active", slow)))
+        leader.start()
+        started.wait()
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("symbols", "active", slow)))
+            for _ in range(10)
+        ]
+        for t in followers:
+            t.start()
+        for t in [leader, *followers]:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == ["rows"] * 11
+
+    def test_ttl_and_invalidation(self):
+        """Results live for the TTL unless their namespace is invalidated."""
+        flight = SingleFlight(ttl=60)
+        counter = iter(range(100))
+
+        assert flight.do("symbols", "k", lambda: next(counter)) == 0
+        assert flight.do("symbols", "k", lambda: next(counter)) == 0
+        assert flight.do("strategies", "k", lambda: next(counter)) == 1
+
+        flight.invalidate("symbols")
+        assert flight.do("symbols", "k", lambda: next(counter)) == 2
+        assert flight.do("strategies", "k", lambda: next(counter)) == 1
+
+    def test_zero_ttl_does_not_cache(self):
+        """With no TTL only in-flight calls are shared."""
+        flight = SingleFlight(ttl=0)
+        counter = iter(range(100))
+
+        assert flight.do("symbols", "k", lambda: next(counter)) == 0
+        assert flight.do("symbols", "k", lambda: next(counter)) == 1
+
+    def test_errors_are_not_cached(self):
+        """A failed call raises for its caller and is retried next time."""
+        flight = SingleFlight(ttl=60)
+
+        def boom():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            flight.do("symbols", "k", boom)
+        assert flight.do("symbols", "k", lambda: "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_list_sees_writes_immediately(async_client: AsyncClient):
+    """Repository writes invalidate coalesced list results."""
+    assert (await async_client.get("/symbols?active=true")).json()["total"] == 0
+    await async_client.post("/symbols", json={"symbol": "AAPL"})
+    assert (await async_client.get("/symbols?active=true")).json()["total"] == 1
@@ -0,0 +1,136 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.marketdata.adjust import AdjustmentFactors, load_factors, read_adjusted
+from app.marketdata.bars import BarArrays
+from app.marketdata.store import BarStore
+from app.models.bar import Bar
+from app.models.symbol import Symbol
+from app.repositories.corporate_action_repo import CorporateActionRepository
+from app.schemas.corporate_action import CorporateActionCreate
+
+
+def utc(day: int, hour: int = 0) -> datetime:
+    return datetime(2026, 10, day, hour, tzinfo=timezone.utc)
+
+
+def daily(*days: int, close: float = 100.0) -> BarArrays:
+    ts = np.array([f"2026-10-{d:02d}T13:30" for d in days], dtype="datetime64[s]")
+    prices = np.full(len(days), close)
+    return BarArrays(ts, prices, prices, prices, prices, np.full(len(days), 1000.0))
+
+
+@pytest.fixture
+def symbol(db: Session) -> Symbol:
+    entity = Symbol(symbol="AAPL")
+    db.add(entity)
+    db.commit()
+    return entity
+
+
+def add_close(db: Session, symbol_id: int, day: int, close: float) -> None:
+    db.add(Bar(symbol_id=symbol_id, timeframe="1d", ts=utc(day, 13), open=close, high=close, low=close,
+               close=close, volume=1000.0, provider="test"))
+    db.commit()
+
+
+class TestAdjustmentFactors:
+    """Test cumulative factors and their vectorized application."""
+
+    def test_steps_between_ex_dates(self):
+        factors = AdjustmentFactors.from_actions([(utc(12), 0.5, 2.0), (utc(14), 0.98, 1.0)])
+        bars = factors.apply(daily(9, 12, 13, 14, 15))
+        assert bars.close.tolist() == pytest.approx([49.0, 98.0, 98.0, 100.0, 100.0])
+        assert bars.volume.tolist() == [2000.0, 1000.0, 1000.0, 1000.0, 1000.0]
+
+    def test_unaffected_series_is_returned_as_is(self):
+        bars = daily(15, 16)
+        assert AdjustmentFactors.identity().apply(bars) is bars
+        assert AdjustmentFactors.from_actions([(utc(12), 0.5, 2.0)]).apply(bars) is bars
+
+
+class TestCorporateActionRepository:
+    """Test action recording and factor loading."""
+
+    def test_split_and_dividend_factors(self, db: Session, symbol: Symbol):
+        repo = CorporateActionRepository(db)
+        split = repo.create(symbol.id, CorporateActionCreate(ts=utc(12), type="split", ratio=4))
+        assert split.factor == 0.25
+        add_close(db, symbol.id, 13, 50.0)
+        dividend = repo.create(symbol.id, CorporateActionCreate(ts=utc(14), type="dividend", cash=0.5))
+        assert dividend.factor == pytest.approx(0.99)
+
+        with pytest.raises(ValueError, match="already exists"):
+            repo.create(symbol.id, CorporateActionCreate(ts=utc(12), type="split", ratio=2))
+        with pytest.raises(ValueError, match="No bar before"):
+            repo.create(symbol.id, CorporateActionCreate(ts=utc(1), type="dividend", cash=0.5))
+
+    def test_as_of_and_invalidation(self, db: Session, symbol: Symbol):
+        repo = CorporateActionRepository(db)
+        repo.create(symbol.id, CorporateActionCreate(ts=utc(12), type="split", ratio=2))
+        assert load_factors(db, symbol.id, date(2026, 10, 11)).price.tolist() == [1.0]
+        assert load_factors(db, symbol.id, date(2026, 10, 12)).price.tolist() == [0.5, 1.0]
+
+        repo.create(symbol.id, CorporateActionCreate(ts=utc(13), type="split", ratio=3))
+        assert load_factors(db, symbol.id, date(2026, 10, 20)).price.tolist() == pytest.approx([1 / 6, 1 / 3, 1.0])
+
+    def test_read_adjusted_from_store(self, db: Session, symbol: Symbol, tmp_path, max_queries):
+        store = BarStore(tmp_path)
+        store.register({"AAPL": symbol.id})
+        store.append(symbol.id, "1d", daily(9, 10))
+        CorporateActionRepository(db).create(symbol.id, CorporateActionCreate(ts=utc(12), type="split", ratio=2))
+
+        assert read_adjusted(store, db, "AAPL", "1d", date(2026, 10, 20)).close.tolist() == [50.0, 50.0]
+        with max_queries(0):
+            window = read_adjusted(store, db, "AAPL", "1d", date(2026, 10, 20), start=np.datetime64("2026-10-10"))
+        assert window.close.tolist() == [50.0]
+
+        store.append(symbol.id, "1d", daily(13))
+        assert read_adjusted(store, db, "AAPL", "1d", date(2026, 10, 20)).close.tolist() == [50.0, 50.0, 100.0]
+
+
+@pytest.mark.asyncio
+class TestCorporateActionEndpoints:
+    """Test the corporate action routes and adjusted bar reads."""
+
+    async def test_create_and_list(self, async_client: AsyncClient, symbol: Symbol):
+        response = await async_client.post(
+            f"/symbols/{symbol.id}/corporate-actions",
+            json={"ts": "2026-10-12T00:00:00Z", "type": "split", "ratio": 2},
+        )
+        assert response.status_code == 201
+        assert response.json()["factor"] == 0.5
+
+        response = await async_client.get(f"/symbols/{symbol.id}/corporate-actions")
+        assert [a["type"] for a in response.json()] == ["split"]
+
+    async def test_validation(self, async_client: AsyncClient, symbol: Symbol):
+        url = f"/symbols/{symbol.id}/corporate-actions"
+        assert (await async_client.post(url, json={"ts": "2026-10-12T00:00:00Z", "type": "split"})).status_code == 422
+        response = await async_client.post(url, json={"ts": "2026-10-12T00:00:00Z", "type": "dividend", "cash": 1})
+        assert response.status_code == 409
+        assert (await async_client.get("/symbols/999/corporate-actions")).status_code == 404
+
+    async def test_adjusted_bars(self, async_client: AsyncClient, db: Session, symbol: Symbol):
+        for day in (9, 13):
+            db.add(Bar(symbol_id=symbol.id, timeframe="1m", ts=utc(day, 14), open=100.0, high=100.0, low=100.0,
+                       close=100.0, volume=10.0, provider="test"))
+        db.commit()
+        await async_client.post(
+            f"/symbols/{symbol.id}/corporate-actions",
+            json={"ts": "2026-10-12T00:00:00Z", "type": "split", "ratio": 4},
+        )
+
+        url = f"/symbols/{symbol.id}/bars"
+        window = {"start": "2026-10-01T00:00:00Z", "end": "2026-11-01T00:00:00Z"}
+        raw = (await async_client.get(url, params={"tf": "1d", **window})).json()
+        assert raw["close"] == [100.0, 100.0]
+        adjusted = (await async_client.get(url, params={"tf": "1d", "adjusted": True, **window})).json()
+        assert adjusted["close"] == [25.0, 100.0]
+        assert adjusted["volume"] == [40.0, 10.0]
+        before = (await async_client.get(url, params={"tf": "1d", "adjusted": True, "as_of": "2026-10-11", **window})).json()
+        assert before["close"] == [100.0, 100.0]
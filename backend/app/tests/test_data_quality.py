@@ -0,0 +1,186 @@
+import io
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import BarArrays
+from app.marketdata.calendar import get_calendar
+from app.marketdata.ingest import BarIngestor, iter_csv
+from app.marketdata.quality import find_gaps, scan, stale_since
+from app.models.symbol import Symbol
+from app.repositories.data_quality_repo import DataQualityRepository
+
+NYSE = get_calendar("NYSE")
+FRIDAY_OPEN = datetime(2026, 10, 16, 13, 30, tzinfo=timezone.utc)
+MONDAY_OPEN = datetime(2026, 10, 19, 13, 30, tzinfo=timezone.utc)
+
+
+def session_minutes(open_: datetime, n: int = 390, seed: int = 0) -> BarArrays:
+    """A random walk of `n` minute bars from a session open."""
+    rng = np.random.default_rng(seed)
+    ts = np.datetime64(open_.replace(tzinfo=None), "s") + np.arange(n) * np.timedelta64(60, "s")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, n)))
+    open_prices = np.concatenate(([100.0], close[:-1]))
+    high = np.maximum(open_prices, close) * 1.0005
+    low = np.minimum(open_prices, close) * 0.9995
+    return BarArrays(ts, open_prices, high, low, close, np.full(n, 1000.0))
+
+
+def take(bars: BarArrays, keep) -> BarArrays:
+    return BarArrays(*(getattr(bars, name)[keep] for name in ("ts", "open", "high", "low", "close", "volume")))
+
+
+def concat(*series: BarArrays) -> BarArrays:
+    return BarArrays(*(
+        np.concatenate([getattr(s, name) for s in series]) for name in ("ts", "open", "high", "low", "close", "volume")
+    ))
+
+
+def to_csv(symbol: str, bars: BarArrays) -> str:
+    lines = ["symbol,ts,open,high,low,close,volume"]
+    for ts, *values in zip(np.datetime_as_string(bars.ts, timezone="UTC"), bars.open, bars.high, bars.low,
+                           bars.close, bars.volume):
+        lines.append(",".join([symbol, ts, *map(repr, map(float, values))]))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def symbol(db: Session) -> Symbol:
+    entity = Symbol(symbol="AAPL")
+    db.add(entity)
+    db.commit()
+    return entity
+
+
+class TestScan:
+    """Test the vectorized checks on in-memory bars."""
+
+    def test_clean_sessions_have_no_findings(self):
+        """Full sessions, including the weekend between them, are not gaps."""
+        bars = concat(session_minutes(FRIDAY_OPEN), session_minutes(MONDAY_OPEN, seed=1))
+        assert scan(bars, calendar=NYSE) == []
+
+    def test_missing_minutes_are_one_run(self):
+        bars = session_minutes(FRIDAY_OPEN)
+        keep = np.ones(390, dtype=bool)
+        keep[100:105] = False
+        [gap] = scan(take(bars, keep), calendar=NYSE)
+        assert (gap.kind, gap.count) == ("gap", 5)
+        assert gap.start == FRIDAY_OPEN + timedelta(minutes=100)
+        assert gap.end == FRIDAY_OPEN + timedelta(minutes=104)
+
+    def test_gaps_at_range_edges_and_across_sessions(self):
+        """Missing minutes at the start and end of the range count; the overnight break does not."""
+        friday = take(session_minutes(FRIDAY_OPEN), slice(0, 380))
+        monday = take(session_minutes(MONDAY_OPEN), slice(3, None))
+        gaps = find_gaps(
+            concat(friday, monday).ts.astype(np.int64), "1m", NYSE,
+            FRIDAY_OPEN, MONDAY_OPEN + timedelta(hours=7),
+        )
+        assert [(g.start, g.count) for g in gaps] == [(FRIDAY_OPEN + timedelta(minutes=380), 13)]
+
+        gaps = find_gaps(monday.ts.astype(np.int64), "1m", NYSE, MONDAY_OPEN - timedelta(hours=2))
+        assert [(g.start, g.count) for g in gaps] == [(MONDAY_OPEN, 3)]
+
+    def test_daily_gaps_skip_weekends(self):
+        days = [12, 13, 15, 16, 19]
+        ts = np.array([f"2026-10-{d:02d}T13:30" for d in days], dtype="datetime64[s]")
+        [gap] = find_gaps(ts.astype(np.int64), "1d", NYSE)
+        assert (gap.start, gap.count, gap.detail) == (
+            datetime(2026, 10, 14, 13, 30, tzinfo=timezone.utc), 1, "1 missing session",
+        )
+
+    def test_bad_prints_and_inconsistent_bars(self):
+        bars = session_minutes(FRIDAY_OPEN)
+        bars.close[10:12] = 0.0
+        bars.high[50] = bars.low[50] - 1
+        bars.volume[60] = -5
+        kinds = {(f.kind, f.start, f.count) for f in scan(bars, calendar=NYSE)}
+        assert ("non_positive", FRIDAY_OPEN + timedelta(minutes=10), 2) in kinds
+        assert ("ohlc", FRIDAY_OPEN + timedelta(minutes=50), 1) in kinds
+        assert ("ohlc", FRIDAY_OPEN + timedelta(minutes=60), 1) in kinds
+
+    def test_spike_against_trailing_window(self):
+        bars = session_minutes(FRIDAY_OPEN)
+        bars.close[300] *= 1.1
+        bars.high[300] = bars.close[300]
+        spikes = [f for f in scan(bars, calendar=NYSE) if f.kind == "spike"]
+        assert spikes and spikes[0].start == FRIDAY_OPEN + timedelta(minutes=300)
+
+    def test_breaks_do_not_shrink_the_window(self):
+        """Returns across missing minutes are left out of the window, not counted as flat."""
+        bars = take(session_minutes(FRIDAY_OPEN), np.arange(390) % 3 != 2)
+
+        def spikes_after_move(sigmas: float) -> list:
+            moved = take(bars, slice(None))
+            moved.close[201] *= np.exp(sigmas * 1e-3)
+            moved.high[201] = max(moved.high[201], moved.close[201])
+            return [f.start for f in scan(moved, calendar=NYSE) if f.kind == "spike"]
+
+        assert spikes_after_move(6) == []
+        assert spikes_after_move(12) == [FRIDAY_OPEN + timedelta(minutes=301)]
+
+    def test_start_limits_findings_not_context(self):
+        bars = session_minutes(FRIDAY_OPEN)
+        bars.close[5] = -1.0
+        bars.close[300] *= 1.1
+        bars.high[300] = bars.close[300]
+        findings = scan(bars, calendar=NYSE, start=FRIDAY_OPEN + timedelta(minutes=200))
+        assert [f.kind for f in findings][:1] == ["spike"]
+        assert all(f.start >= FRIDAY_OPEN + timedelta(minutes=200) for f in findings)
+
+    def test_stale_since(self):
+        at = MONDAY_OPEN + timedelta(hours=1)
+        last = {1: at - timedelta(minutes=1), 2: at - timedelta(minutes=30)}
+        assert stale_since(last, at, NYSE) == {2: at - timedelta(minutes=29)}
+        assert stale_since(last, MONDAY_OPEN - timedelta(hours=1), NYSE) == {}
+
+
+class TestIncrementalScan:
+    """Test scanning on ingest and replacement of persisted findings."""
+
+    def test_rescan_replaces_findings(self, db: Session, symbol: Symbol):
+        bars = session_minutes(FRIDAY_OPEN)
+        keep = np.ones(390, dtype=bool)
+        keep[200:210] = False
+        result = BarIngestor(db, "1m", "test", scan=True).ingest(iter_csv(io.StringIO(to_csv("AAPL", take(bars, keep)))))
+        assert result.issues == 1
+        [issue] = DataQualityRepository(db).list_issues(symbol.id)
+        assert (issue.kind, issue.count) == ("gap", 10)
+
+        # Backfilling the hole scans only the new range and clears the gap
+        fill = take(bars, slice(200, 210))
+        result = BarIngestor(db, "1m", "test", scan=True).ingest(iter_csv(io.StringIO(to_csv("AAPL", fill))))
+        assert result.issues == 0
+        assert DataQualityRepository(db).list_issues(symbol.id) == []
+
+
+@pytest.mark.asyncio
+class TestDataQualityEndpoints:
+    """Test the summary and issue list endpoints."""
+
+    async def test_upload_then_summary(self, async_client: AsyncClient, symbol: Symbol):
+        bars = session_minutes(MONDAY_OPEN, n=60)
+        bars.low[30] = -1.0
+        bars.high[40] = bars.low[40] - 0.01
+        response = await async_client.post(
+            "/bars/ingest", files={"file": ("bars.csv", to_csv("AAPL", bars).encode(), "text/csv")},
+        )
+        assert response.status_code == 200
+        assert response.json()["issues"] == 2
+
+        at = (MONDAY_OPEN + timedelta(hours=2)).isoformat()
+        response = await async_client.get("/data-quality/summary", params={"at": at})
+        assert response.status_code == 200
+        body = response.json()
+        [entry] = body["symbols"]
+        assert entry["symbol_id"] == symbol.id
+        assert set(entry["kinds"]) == {"non_positive", "ohlc"}
+        assert body["stale"] == [{"symbol_id": symbol.id, "last_bar_close": "2026-10-19T14:30:00Z"}]
+
+        response = await async_client.get("/data-quality/issues", params={"kind": "ohlc"})
+        [issue] = response.json()
+        assert issue["start_ts"].startswith("2026-10-19T14:10:00")
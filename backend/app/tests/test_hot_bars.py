@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.marketdata.bars import BarArrays
+from app.marketdata.hot_bars import HotBarBuffer
+
+
+def make_bars(start: int, count: int) -> BarArrays:
+    ts = (np.datetime64("2026-10-16T13:30:00", "s") + np.arange(start, start + count) * 60).astype("datetime64[s]")
+    close = 100.0 + np.arange(start, start + count)
+    return BarArrays(ts, close - 0.5, close + 1, close - 1, close, np.full(count, 10.0))
+
+
+@pytest.fixture
+async def buffer():
+    redis = FakeAsyncRedis()
+    yield HotBarBuffer(redis, capacity=5)
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+class TestHotBarBuffer:
+    """Test the Redis ring buffer of latest bars."""
+
+    async def test_round_trip(self, buffer: HotBarBuffer):
+        assert await buffer.append({1: make_bars(0, 3), 2: make_bars(0, 1)}) == 4
+
+        latest = await buffer.get_latest([1, 2, 3], 2)
+        assert latest[1].close.tolist() == [101.0, 102.0]
+        assert latest[1].ts.tolist() == make_bars(1, 2).ts.tolist()
+        assert latest[1].open.tolist() == [100.5, 101.5]
+        assert latest[2].close.tolist() == [100.0]
+        assert len(latest[3]) == 0
+
+    async def test_keeps_only_capacity(self, buffer: HotBarBuffer):
+        await buffer.append({1: make_bars(0, 4)})
+        await buffer.append({1: make_bars(4, 4)})
+        assert await buffer.redis.llen(buffer.key(1)) == 5
+        assert (await buffer.get_latest([1], 100))[1].close.tolist() == [103.0, 104.0, 105.0, 106.0, 107.0]
+
+        # A batch longer than the buffer only sends what survives the trim
+        assert await buffer.append({1: make_bars(8, 12)}) == 5
+        assert (await buffer.get_latest([1], 5))[1].close.tolist() == [115.0, 116.0, 117.0, 118.0, 119.0]
+
+    async def test_one_round_trip_for_universe(self, buffer: HotBarBuffer, monkeypatch):
+        await buffer.append({i: make_bars(0, 2) for i in range(50)})
+        pipelines = []
+        original = buffer.redis.pipeline
+        monkeypatch.setattr(buffer.redis, "pipeline", lambda **kw: pipelines.append(kw) or original(**kw))
+
+        latest = await buffer.get_latest(range(50), 3)
+        assert len(pipelines) == 1
+        assert all(len(bars) == 2 for bars in latest.values())
+
+    async def test_empty_requests(self, buffer: HotBarBuffer):
+        assert await buffer.append({1: BarArrays.empty()}) == 0
+        assert await buffer.get_latest([], 5) == {}
+        await buffer.append({1: make_bars(0, 1)})
+        await buffer.clear([1])
+        assert len((await buffer.get_latest([1], 5))[1]) == 0
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from app.features import indicators
+from app.features.indicators import (
+    ATR, EMA, RSI, SMA, Bollinger, Returns, RollingVolatility,
+    atr, bollinger, ema, returns, rolling_volatility, rsi, sma,
+)
+
+
+def bits(values) -> np.ndarray:
+    """Raw float64 bits with every NaN made canonical."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(values), np.nan, values).view(np.int64)
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(11)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (3, 600)), axis=-1))
+    spread = np.abs(rng.normal(0, 0.005, close.shape)) * close
+    close[:, 100:110] = close[:, 99:100]  # a flat stretch
+    return close + spread, close - spread, close
+
+
+STREAMING = [
+    (lambda h, l, c: sma(c, 20), lambda: SMA(20), lambda s, h, l, c: s.update(c)),
+    (lambda h, l, c: ema(c, 12), lambda: EMA(12), lambda s, h, l, c: s.update(c)),
+    (lambda h, l, c: rsi(c, 14), lambda: RSI(14), lambda s, h, l, c: s.update(c)),
+    (lambda h, l, c: atr(h, l, c, 14), lambda: ATR(14), lambda s, h, l, c: s.update(h, l, c)),
+    (lambda h, l, c: returns(c, 5), lambda: Returns(5), lambda s, h, l, c: s.update(c)),
+    (lambda h, l, c: rolling_volatility(c, 20), lambda: RollingVolatility(20), lambda s, h, l, c: s.update(c)),
+    (lambda h, l, c: np.stack(bollinger(c, 20, 2.0), axis=-1), lambda: Bollinger(20, 2.0),
+     lambda s, h, l, c: s.update(c)),
+]
+
+
+class TestIndicators:
+    """Test batch values and batch/streaming equivalence."""
+
+    @pytest.mark.parametrize("batch, make, step", STREAMING)
+    def test_streaming_is_bit_identical(self, bars, batch, make, step):
+        high, low, close = bars
+        expected = batch(high, low, close)
+        for row in range(close.shape[0]):
+            state = make()
+            streamed = [step(state, *(a[row, i] for a in bars)) for i in range(close.shape[1])]
+            assert (bits(streamed) == bits(expected[row])).all()
+        # Rows are independent: a 2-D batch equals row-by-row batches
+        assert (bits(batch(high[:1], low[:1], close[:1])) == bits(expected[:1])).all()
+
+    def test_reference_values(self):
+        x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        assert sma(x, 3).tolist()[2:] == [2.0, 3.0, 4.0]
+        assert np.isnan(sma(x, 3)[:2]).all()
+        np.testing.assert_allclose(ema(x, 3)[2:], [2.25, 3.125, 4.0625])
+        np.testing.assert_allclose(returns(x, 2)[2:], [2.0, 1.0, 2 / 3])
+        mid, upper, lower = bollinger(x, 5, 1.0)
+        assert (mid[-1], upper[-1], lower[-1]) == pytest.approx((3.0, 3 + 2 ** 0.5, 3 - 2 ** 0.5))
+
+    def test_rsi_extremes(self):
+        up = np.arange(1.0, 31.0)
+        assert rsi(up, 14)[-1] == 100.0
+        assert rsi(up[::-1], 14)[-1] == 0.0
+        assert rsi(np.full(30, 5.0), 14)[-1] == 50.0
+        assert np.isnan(rsi(up, 14)[:14]).all() and not np.isnan(rsi(up, 14)[14])
+
+    def test_atr_uses_previous_close(self):
+        high = np.array([10.0, 12.0, 11.0])
+        low = np.array([9.0, 11.5, 10.0])
+        close = np.array([9.5, 12.0, 10.5])
+        assert indicators.true_range(high, low, close).tolist() == [1.0, 2.5, 2.0]
+        assert atr(high, low, close, 2).tolist()[1:] == [1.75, 1.875]
+
+    def test_short_series_and_bad_windows(self):
+        assert np.isnan(rsi(np.array([1.0, 2.0]), 14)).all()
+        assert ema(np.empty(0), 5).shape == (0,)
+        with pytest.raises(ValueError):
+            sma(np.ones(3), 0)
+        with pytest.raises(ValueError):
+            RollingVolatility(1)
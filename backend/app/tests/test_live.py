@@ -0,0 +1,172 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.orm import Session, sessionmaker
+from websockets.asyncio.server import serve
+
+from app.marketdata.hot_bars import HotBarBuffer
+from app.marketdata.live import (
+    DropOldestQueue, FeedError, LiveBar, LiveIngestor, MergeQueue, STAGE_LAG, database_sink, hot_buffer_sink,
+)
+from app.models.symbol import Symbol
+from app.repositories.bar_repo import BarRepository
+
+
+def bar_message(symbol: str, minute: int, close: float, kind: str = "b") -> dict:
+    return {
+        "T": kind, "S": symbol, "t": f"2026-10-16T13:{minute:02d}:00Z",
+        "o": close - 1, "h": close + 1, "l": close - 2, "c": close, "v": 100, "n": 5, "vw": close,
+    }
+
+
+def live_bar(symbol_id: int, minute: int, close: float, updated: bool = False) -> LiveBar:
+    return LiveBar(symbol_id, 1792157400 + (minute - 30) * 60, close, close, close, close, 1.0, updated)
+
+
+class FakeFeed:
+    """A local stand-in for the Alpaca market data stream."""
+
+    def __init__(self, frames: list[list[dict]], key: str = "key", failures: list[str] = ()):
+        self.frames = frames
+        self.key = key
+        # How each of the first connections fails: "refuse" the handshake or send "garbage"
+        self.failures = list(failures)
+        self.subscriptions: list[dict] = []
+
+    def process_request(self, connection, request):
+        if self.failures and self.failures[0] == "refuse":
+            self.failures.pop(0)
+            return connection.respond(HTTPStatus.SERVICE_UNAVAILABLE, "busy\n")
+        return None
+
+    async def handler(self, ws):
+        if self.failures and self.failures.pop(0) == "garbage":
+            await ws.send("<html>not a feed</html>")
+            return
+        await ws.send(json.dumps([{"T": "success", "msg": "connected"}]))
+        auth = json.loads(await ws.recv())
+        if auth.get("key") != self.key:
+            await ws.send(json.dumps([{"T": "error", "code": 402, "msg": "auth failed"}]))
+            return
+        await ws.send(json.dumps([{"T": "success", "msg": "authenticated"}]))
+        subscribe = json.loads(await ws.recv())
+        self.subscriptions.append(subscribe)
+        await ws.send(json.dumps([{"T": "subscription", "bars": subscribe["bars"]}]))
+        for frame in self.frames:
+            await ws.send(json.dumps(frame))
+        await ws.wait_closed()
+
+
+async def wait_for(predicate, timeout: float = 5.0):
+    async with asyncio.timeout(timeout):
+        while not await predicate():
+            await asyncio.sleep(0.01)
+
+
+class TestBarQueues:
+    """Test the drop and merge queue policies."""
+
+    def test_merge_replaces_queued_minute(self):
+        queue = MergeQueue("test-merge", maxsize=10)
+        queue.put([live_bar(1, 30, 10.0), live_bar(1, 31, 11.0)])
+        queue.put([live_bar(1, 30, 10.5, updated=True)])
+        batch = queue._take()
+        assert [(b.ts, b.close, b.updated) for b in batch] == [
+            (1792157400, 10.5, False), (1792157460, 11.0, False),
+        ]
+
+    def test_merge_drops_oldest_when_full(self):
+        queue = MergeQueue("test-merge-full", maxsize=2)
+        queue.put([live_bar(1, m, float(m)) for m in (30, 31, 32)])
+        assert queue.dropped == 1
+        assert [b.close for b in queue._take()] == [31.0, 32.0]
+
+    async def test_drop_oldest_keeps_newest(self):
+        queue = DropOldestQueue("test-drop", maxsize=2)
+        queue.put([live_bar(1, m, float(m)) for m in (30, 31, 32)])
+        assert queue.dropped == 1
+        assert [b.close for b in await queue.get_batch()] == [31.0, 32.0]
+
+
+@pytest.mark.asyncio
+class TestLiveIngestor:
+    """Test the ingestion service against a local feed."""
+
+    async def test_fans_out_to_sinks_and_subscribers(self, db: Session):
+        aapl, msft = Symbol(symbol="AAPL"), Symbol(symbol="MSFT")
+        db.add_all([aapl, msft])
+        db.commit()
+        feed = FakeFeed([
+            [bar_message("AAPL", 30, 10.0), bar_message("MSFT", 30, 20.0), bar_message("TSLA", 30, 1.0)],
+            [bar_message("AAPL", 31, 11.0), {"T": "u", **{k: v for k, v in bar_message("AAPL", 30, 10.2).items() if k != "T"}}],
+        ])
+        session_factory = sessionmaker(bind=db.get_bind())
+        redis = FakeAsyncRedis()
+        buffer = HotBarBuffer(redis, capacity=10)
+        ingestor = LiveIngestor("ws://127.0.0.1:8765", "key", "secret", {"AAPL": aapl.id, "MSFT": msft.id})
+        ingestor.add_sink("database", database_sink(session_factory, provider="test"))
+        ingestor.add_sink("hot_buffer", hot_buffer_sink(buffer))
+        subscriber = ingestor.subscribe()
+        before = STAGE_LAG.labels("hot_buffer")._sum.get()
+
+        stop = asyncio.Event()
+        async with serve(feed.handler, "127.0.0.1", 0) as server:
+            ingestor.url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            runner = asyncio.create_task(ingestor.run(stop))
+
+            async def hot_buffer_filled():
+                latest = await buffer.get_latest([aapl.id], 10)
+                return len(latest[aapl.id]) == 2
+
+            async def db_has_update():
+                with session_factory() as check:
+                    close = BarRepository(check).read_range(aapl.id, "1m").close.tolist()
+                return close == [10.2, 11.0]
+
+            await wait_for(hot_buffer_filled)
+            await wait_for(db_has_update)
+            received = []
+            while len(received) < 4:
+                received += await asyncio.wait_for(subscriber.get_batch(), 5)
+            stop.set()
+            await asyncio.wait_for(runner, 5)
+
+        assert feed.subscriptions == [{"action": "subscribe", "bars": ["AAPL", "MSFT"]}]
+        assert sorted((b.symbol_id, b.close, b.updated) for b in received) == sorted([
+            (aapl.id, 10.0, False), (msft.id, 20.0, False), (aapl.id, 11.0, False), (aapl.id, 10.2, True),
+        ])
+        # A correction never adds a second copy of a minute to the hot buffer: it is
+        # merged into the queued bar or, once that was delivered, left to the bars table
+        hot = (await buffer.get_latest([aapl.id], 10))[aapl.id]
+        assert hot.close.tolist() in ([10.0, 11.0], [10.2, 11.0])
+        assert STAGE_LAG.labels("hot_buffer")._sum.get() > before
+        await redis.aclose()
+
+    async def test_rejected_credentials_stop_the_service(self):
+        feed = FakeFeed([], key="other")
+        async with serve(feed.handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            ingestor = LiveIngestor(f"ws://127.0.0.1:{port}", "key", "secret", {"AAPL": 1})
+            with pytest.raises(FeedError, match="402"):
+                await asyncio.wait_for(ingestor.run(), 5)
+
+    async def test_reconnects_after_refused_and_broken_connections(self):
+        """A refused handshake or a malformed greeting is retried, not fatal."""
+        feed = FakeFeed([[bar_message("AAPL", 30, 10.0)]], failures=["refuse", "garbage"])
+        ingestor = LiveIngestor("ws://127.0.0.1:8765", "key", "secret", {"AAPL": 1}, max_backoff=0.1)
+        subscriber = ingestor.subscribe()
+
+        stop = asyncio.Event()
+        async with serve(feed.handler, "127.0.0.1", 0, process_request=feed.process_request) as server:
+            ingestor.url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            runner = asyncio.create_task(ingestor.run(stop))
+            received = await asyncio.wait_for(subscriber.get_batch(), 5)
+            stop.set()
+            await asyncio.wait_for(runner, 5)
+
+        assert feed.failures == []
+        assert len(feed.subscriptions) == 1
+        assert [(b.symbol_id, b.close) for b in received] == [(1, 10.0)]
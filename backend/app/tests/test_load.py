@@ -0,0 +1,29 @@
+import random
+import uuid
+
+import pytest
+
+from benchmarks.load import SCENARIOS, LoadContext, cancel_order, run_scenario
+
+
+class TestLoadGenerator:
+    """Smoke-test the load generator so the scenarios keep matching the API."""
+
+    @pytest.mark.asyncio
+    async def test_mixed_scenario_low_rate(self, tmp_path):
+        """Every stream of the mixed scenario fires and succeeds at a low rate."""
+        report = await run_scenario(
+            "mixed", duration=2.5, database_url=f"sqlite:///{tmp_path / 'load.db'}",
+            rate_scale=0.05, drain_timeout=10,
+        )
+        assert set(report["endpoints"]) == {s.name for s in SCENARIOS["mixed"]}
+        for name, result in report["endpoints"].items():
+            assert result["requests"] > 0, name
+            assert result["error_rate"] == 0, name
+            assert result["timeouts"] == 0, name
+
+    @pytest.mark.asyncio
+    async def test_cancel_without_orders_is_skipped(self):
+        """A cancel arrival with nothing to cancel sends no request at all."""
+        ctx = LoadContext(random.Random(1), [str(uuid.uuid4())])
+        assert await cancel_order(None, ctx) is None
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.observability.memory import MemoryMiddleware, memory_tracker, object_counts
+from app.schemas.order import OrderRead
+
+
+@pytest.fixture
+def tracing():
+    memory_tracker.start(frames=5)
+    yield memory_tracker
+    memory_tracker.stop()
+
+
+def test_object_counts():
+    """Live instances are counted by class name."""
+    before = object_counts(["OrderRead"])["OrderRead"]
+    models = [OrderRead.model_construct(id=i) for i in range(3)]
+    assert object_counts(["OrderRead"])["OrderRead"] == before + len(models)
+
+
+@pytest.mark.asyncio
+class TestMemoryEndpoints:
+    """Test the memory debug endpoints."""
+
+    async def test_snapshot_diff(self, async_client: AsyncClient, sample_order_data: dict, tracing):
+        """Diffing around a batch of requests reports allocation sites and route peaks."""
+        base = (await async_client.post("/debug/memory/snapshots")).json()["id"]
+        for _ in range(5):
+            await async_client.post("/orders", json=sample_order_data)
+        await async_client.get("/orders?limit=200")
+
+        response = await async_client.get(f"/debug/memory/diff?base={base}&limit=5")
+        assert response.status_code == 200
+        sites = response.json()["sites"]
+        assert 0 < len(sites) <= 5
+        assert {"site", "size_diff", "count_diff"} <= sites[0].keys()
+
+        status = (await async_client.get("/debug/memory")).json()
+        assert status["tracing"] is True
+        assert status["route_peaks"]["GET /orders"] > 0
+        assert set(status["objects"]) == {"Order", "OrderRead"}
+        assert len(status["snapshots"]) == 1
+
+    async def test_implicit_target_keeps_base(self, async_client: AsyncClient, tracing):
+        """Diffing against the current heap stores nothing, so the base is never evicted."""
+        base = (await async_client.post("/debug/memory/snapshots")).json()["id"]
+        for _ in range(tracing.max_snapshots + 1):
+            response = await async_client.get(f"/debug/memory/diff?base={base}")
+            assert response.status_code == 200
+            assert response.json()["target"] == "current"
+        assert [s["id"] for s in tracing.snapshots()] == [base]
+
+    async def test_snapshot_requires_tracing(self, async_client: AsyncClient):
+        """Snapshots need tracemalloc running."""
+        memory_tracker.stop()
+        response = await async_client.post("/debug/memory/snapshots")
+        assert response.status_code == 409
+
+    async def test_unknown_snapshot(self, async_client: AsyncClient, tracing):
+        """Diffing against a missing snapshot returns 404."""
+        response = await async_client.get("/debug/memory/diff?base=999999")
+        assert response.status_code == 404
+
+    async def test_overlapping_request_keeps_peak(self, tracing):
+        """A request starting mid-flight does not erase an earlier request's peak."""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def app(scope, receive, send):
+            if scope["path"] == "/big":
+                blob = bytearray(8_000_000)
+                del blob
+                started.set()
+                await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        transport = ASGITransport(app=MemoryMiddleware(app))
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            big = asyncio.create_task(client.get("/big"))
+            await started.wait()
+            await client.get("/small")
+            release.set()
+            await big
+        assert tracing.route_peaks()["GET unmatched"] >= 8_000_000
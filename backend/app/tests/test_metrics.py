@@ -0,0 +1,72 @@
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy.orm import Session
+
+from app.observability.metrics import collect_queries
+from app.repositories.order_repo import OrderRepository
+from app.schemas.order import OrderQuery
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRepositoryMetrics:
+    """Test repository instrumentation."""
+
+    def test_outermost_call_recorded_once(self, db: Session):
+        """list_and_count is recorded under its own name, not as list_page + count."""
+        labels = {"repository": "OrderRepository"}
+        outer = sample("repository_operation_duration_seconds_count", operation="list_and_count", **labels)
+        inner = sample("repository_operation_duration_seconds_count", operation="list_page", **labels)
+        queries = sample("repository_operation_db_queries_sum", operation="list_and_count", **labels)
+
+        OrderRepository(db).list_and_count(OrderQuery())
+
+        assert sample("repository_operation_duration_seconds_count", operation="list_and_count", **labels) == outer + 1
+        assert sample("repository_operation_duration_seconds_count", operation="list_page", **labels) == inner
+        assert sample("repository_operation_db_queries_sum", operation="list_and_count", **labels) == queries + 2
+
+    def test_collect_queries(self, db: Session):
+        """Statements are counted by every enclosing collector."""
+        repo = OrderRepository(db)
+        with collect_queries() as outer:
+            repo.count(OrderQuery())
+            with collect_queries() as inner:
+                repo.count(OrderQuery())
+        assert outer.queries == 2
+        assert inner.queries == 1
+        assert outer.db_seconds >= inner.db_seconds > 0
+
+
+@pytest.mark.asyncio
+class TestMetricsEndpoints:
+    """Test request metrics and the scrape endpoint."""
+
+    async def test_request_labelled_by_route_template(self, async_client: AsyncClient, sample_order_data: dict):
+        """Requests are labelled with the route template and status."""
+        order_id = (await async_client.post("/orders", json=sample_order_data)).json()["id"]
+        labels = {"method": "GET", "route": "/orders/{order_id}"}
+        before = sample("http_request_duration_seconds_count", status="200", **labels)
+        queries = sample("http_request_db_queries_sum", **labels)
+
+        await async_client.get(f"/orders/{order_id}")
+
+        assert sample("http_request_duration_seconds_count", status="200", **labels) == before + 1
+        assert sample("http_request_db_queries_sum", **labels) > queries
+
+    async def test_unmatched_route(self, async_client: AsyncClient):
+        """Unknown paths share one label instead of one series per path."""
+        before = sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+        await async_client.get("/no/such/path")
+        assert sample("http_request_duration_seconds_count", method="GET", route="unmatched", status="404") == before + 1
+
+    async def test_scrape(self, async_client: AsyncClient):
+        """The scrape endpoint serves the Prometheus text format."""
+        await async_client.get("/strategies")
+        response = await async_client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/strategies",status="200"}' in response.text
+        assert "repository_operation_duration_seconds" in response.text
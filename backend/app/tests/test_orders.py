@@ -233,6 +233,40 @@ class TestOrderEndpoints:
         assert data["total"] == 1
         assert data["items"][0]["symbol_id"] == symbol_id
 
+    async def test_list_orders_matches_get(
+        self, async_client: AsyncClient, sample_order_data: dict
+    ):
+        """Test that list items serialize exactly like the single-order response."""
+        create_response = await async_client.post("/orders", json=sample_order_data)
+        order_id = create_response.json()["id"]
+        
+        list_response = await async_client.get("/orders")
+        get_response = await async_client.get(f"/orders/{order_id}")
+        
+        assert list_response.headers["content-type"] == "application/json"
+        assert list_response.json()["items"][0] == get_response.json()
+
+    async def test_list_orders_sparse_fields(
+        self, async_client: AsyncClient, sample_order_data: dict
+    ):
+        """Test that fields= returns only the requested columns plus id."""
+        await async_client.post("/orders", json=sample_order_data)
+        
+        response = await async_client.get("/orders?fields=symbol_id,status,price")
+        
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert set(item) == {"id", "symbol_id", "status", "price"}
+        assert item["status"] == "new"
+        assert Decimal(item["price"]) == Decimal("150.50")
+
+    async def test_list_orders_unknown_field(self, async_client: AsyncClient):
+        """Test that unknown sparse fields are rejected."""
+        response = await async_client.get("/orders?fields=status,secret")
+        
+        assert response.status_code == 422
+        assert "secret" in response.json()["detail"]
+
     async def test_list_orders_filter_by_status(
         self, async_client: AsyncClient
     ):
@@ -380,6 +414,40 @@ class TestOrderRepository:
         with pytest.raises(ValueError, match="already exists"):
             repo.create(order_data)
 
+    def test_create_many_duplicate_check_matches_pairs(self, db: Session):
+        """Only an existing (account, client_order_id) pair from the batch is a conflict."""
+        account_a, account_b = uuid.uuid4(), uuid.uuid4()
+
+        def order(account_id, client_order_id):
+            return OrderCreate(
+                symbol_id=uuid.uuid4(), account_id=account_id, side="buy", type=OrderType.market,
+                quantity=Decimal("1"), client_order_id=client_order_id, paper=True,
+            )
+
+        repo = OrderRepository(db)
+        repo.create(order(account_a, "y"))
+        assert len(repo.create_many([order(account_a, "x"), order(account_b, "y")])) == 2
+        with pytest.raises(ValueError, match="already exists"):
+            repo.create_many([order(account_a, "z"), order(account_a, "y")])
+
+    def test_record_fill_rereads_order(self, db: Session):
+        """A fill applied through a stale order object still adds to the stored total."""
+        from sqlalchemy.orm import sessionmaker
+        from app.schemas.order import OrderFill
+
+        created = OrderRepository(db).create(OrderCreate(
+            symbol_id=uuid.uuid4(), account_id=uuid.uuid4(), side="buy", type=OrderType.market,
+            quantity=Decimal("100"), paper=True,
+        ))
+        other = sessionmaker(bind=db.get_bind())()
+        try:
+            stale = other.get(Order, created.id)
+            OrderRepository(db).record_fill(created, OrderFill(quantity=Decimal("30"), price=Decimal("10")))
+            filled = OrderRepository(other).record_fill(stale, OrderFill(quantity=Decimal("20"), price=Decimal("10")))
+            assert filled.filled_quantity == Decimal("50")
+        finally:
+            other.close()
+
     def test_get_order(self, db: Session):
         """Test retrieving an order by ID."""
         from app.schemas.order import OrderCreate
@@ -426,6 +494,27 @@ class TestOrderRepository:
         assert total == 3
         assert len(rows) == 3
 
+    def test_list_and_count_projection(self, db: Session):
+        """Test that projected listing returns Row tuples, not ORM instances."""
+        from app.schemas.order import OrderCreate, OrderQuery
+        
+        repo = OrderRepository(db)
+        repo.create(OrderCreate(
+            symbol_id=uuid.uuid4(),
+            side="buy",
+            type=OrderType.market,
+            quantity=Decimal("10"),
+            paper=True
+        ))
+        db.expunge_all()
+        
+        rows, total = repo.list_and_count(OrderQuery(fields=["id", "status"]))
+        
+        assert total == 1
+        assert rows[0].status == OrderStatus.new
+        assert not isinstance(rows[0], Order)
+        assert len(db.identity_map) == 0
+
     def test_update_order(self, db: Session):
         """Test updating an order."""
         from app.schemas.order import OrderCreate, OrderUpdate
@@ -0,0 +1,172 @@
+import uuid
+import pytest
+from decimal import Decimal
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.models.order import OrderType
+from app.repositories.order_repo import OrderRepository
+from app.repositories.position_repo import PositionRepository
+from app.schemas.order import OrderCreate, OrderFill
+from app.schemas.position import PositionQuery
+
+
+def fill_order(repo: OrderRepository, account_id, symbol_id, side: str, qty: str, price: str):
+    order = repo.create(OrderCreate(
+        symbol_id=symbol_id,
+        account_id=account_id,
+        side=side,
+        type=OrderType.market,
+        quantity=Decimal(qty),
+        paper=True,
+    ))
+    return repo.record_fill(order, OrderFill(quantity=Decimal(qty), price=Decimal(price)))
+
+
+class TestPositionRepository:
+    """Test incremental position maintenance."""
+
+    def test_fills_update_position(self, db: Session):
+        """Buys blend the average price, sells realize PnL."""
+        repo = OrderRepository(db)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        fill_order(repo, account_id, symbol_id, "buy", "10", "100")
+        fill_order(repo, account_id, symbol_id, "buy", "10", "110")
+        fill_order(repo, account_id, symbol_id, "sell", "5", "120")
+
+        rows, total = PositionRepository(db).list_and_count(PositionQuery(account_id=account_id))
+        assert total == 1
+        position = rows[0]
+        assert position.qty == Decimal("15")
+        assert position.avg_price == Decimal("105")
+        assert position.realized_pnl == Decimal("75")
+        assert position.unrealized_pnl == Decimal("225")
+
+    def test_flat_positions_hidden(self, db: Session):
+        """Closed positions are kept but filtered out by default."""
+        repo = OrderRepository(db)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        fill_order(repo, account_id, symbol_id, "buy", "10", "100")
+        fill_order(repo, account_id, symbol_id, "sell", "10", "90")
+
+        positions = PositionRepository(db)
+        assert positions.list_and_count(PositionQuery())[1] == 0
+        rows, total = positions.list_and_count(PositionQuery(open_only=False))
+        assert total == 1
+        assert rows[0].realized_pnl == Decimal("-100")
+
+    def test_fills_without_account_share_one_row(self, db: Session):
+        """Fills with no account accumulate into a single position per symbol."""
+        repo = OrderRepository(db)
+        symbol_id = uuid.uuid4()
+
+        fill_order(repo, None, symbol_id, "buy", "10", "100")
+        fill_order(repo, None, symbol_id, "buy", "5", "100")
+
+        rows, total = PositionRepository(db).list_and_count(PositionQuery(symbol_id=symbol_id))
+        assert total == 1
+        assert rows[0].qty == Decimal("15")
+
+    def assert_rebuild_matches(self, db: Session, expected_rows: int):
+        positions = PositionRepository(db)
+
+        def snapshot():
+            return {
+                (p.account_id, p.symbol_id): (p.qty, p.avg_price, p.realized_pnl, p.mark_price, p.unrealized_pnl)
+                for p in positions.list_and_count(PositionQuery(open_only=False))[0]
+            }
+
+        before = snapshot()
+        assert positions.rebuild_from_history() == expected_rows
+        db.expire_all()
+        after = snapshot()
+        assert after.keys() == before.keys()
+        for key, values in before.items():
+            for expected, actual in zip(values, after[key]):
+                assert actual == pytest.approx(expected)
+        return after
+
+    def test_rebuild_matches_incremental(self, db: Session):
+        """The set-based rebuild reproduces incrementally maintained positions."""
+        repo = OrderRepository(db)
+        account_id = uuid.uuid4()
+        long_symbol, short_symbol = uuid.uuid4(), uuid.uuid4()
+
+        fill_order(repo, account_id, long_symbol, "buy", "10", "100")
+        fill_order(repo, account_id, long_symbol, "buy", "30", "120")
+        fill_order(repo, account_id, long_symbol, "sell", "20", "130")
+        fill_order(repo, account_id, short_symbol, "sell", "8", "50")
+        fill_order(repo, None, short_symbol, "buy", "1", "10")
+
+        self.assert_rebuild_matches(db, 3)
+
+    def test_rebuild_after_flat_and_reopen(self, db: Session):
+        """A position closed out and reopened is priced from the reopening fills only."""
+        repo = OrderRepository(db)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        fill_order(repo, account_id, symbol_id, "buy", "100", "10")
+        fill_order(repo, account_id, symbol_id, "sell", "100", "12")
+        fill_order(repo, account_id, symbol_id, "buy", "100", "20")
+
+        after = self.assert_rebuild_matches(db, 1)
+        assert after[(account_id, symbol_id)][:3] == (Decimal("100"), Decimal("20"), Decimal("200"))
+
+    def test_rebuild_after_flip(self, db: Session):
+        """A fill through zero opens the other side at its price with the remainder."""
+        repo = OrderRepository(db)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        fill_order(repo, account_id, symbol_id, "buy", "50", "10")
+        fill_order(repo, account_id, symbol_id, "buy", "50", "14")
+        fill_order(repo, account_id, symbol_id, "sell", "130", "15")
+        fill_order(repo, account_id, symbol_id, "sell", "10", "11")
+
+        after = self.assert_rebuild_matches(db, 1)
+        qty, avg_price, realized, mark, unrealized = after[(account_id, symbol_id)]
+        assert qty == Decimal("-40")
+        assert avg_price == pytest.approx(Decimal("14"))
+        assert realized == pytest.approx(Decimal("300"))
+        assert (mark, unrealized) == (Decimal("11"), pytest.approx(Decimal("120")))
+
+
+@pytest.mark.asyncio
+class TestPositionEndpoints:
+    """Test position endpoints."""
+
+    async def test_list_and_get(self, async_client: AsyncClient, sample_order_data: dict):
+        """Fills posted to an order show up as a position."""
+        order_id = (await async_client.post("/orders", json=sample_order_data)).json()["id"]
+        await async_client.post(f"/orders/{order_id}/fills", json={"quantity": "100", "price": "150"})
+
+        response = await async_client.get(f"/positions?symbol_id={sample_order_data['symbol_id']}")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["total"] == 1
+        position = payload["items"][0]
+        assert Decimal(position["qty"]) == Decimal("100")
+
+        response = await async_client.get(f"/positions/{position['id']}")
+        assert response.status_code == 200
+
+    async def test_get_not_found(self, async_client: AsyncClient):
+        """Unknown position IDs return 404."""
+        response = await async_client.get("/positions/9999")
+        assert response.status_code == 404
+
+    async def test_rebuild(self, async_client: AsyncClient, sample_order_data: dict):
+        """Rebuild reports the number of positions written."""
+        order_id = (await async_client.post("/orders", json=sample_order_data)).json()["id"]
+        await async_client.post(f"/orders/{order_id}/fills", json={"quantity": "100", "price": "150"})
+
+        response = await async_client.post("/positions/rebuild")
+        assert response.status_code == 200
+        assert response.json() == {"positions": 1}
+
+    async def test_rebuild_hidden_when_debug_disabled(self, async_client: AsyncClient, monkeypatch):
+        """The table-wide rebuild is not exposed outside debug environments."""
+        monkeypatch.setenv("DEBUG_ENDPOINTS", "0")
+        response = await async_client.post("/positions/rebuild")
+        assert response.status_code == 404
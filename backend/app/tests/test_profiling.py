@@ -0,0 +1,60 @@
+import threading
+import time
+import pytest
+from httpx import AsyncClient
+
+from app.observability.profiling import StackSampler, profiles
+
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sampler_sees_working_threads():
+    """Busy threads show up in the collapsed stacks; parked ones do not."""
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,))
+    worker.start()
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert sampler.samples > 0
+    assert any("busy_loop" in stack for stack in sampler.stacks)
+    leaves = [stack.rsplit(";", 1)[-1] for stack in sampler.stacks]
+    assert not any(leaf.startswith("threading:wait:") for leaf in leaves)
+
+
+@pytest.mark.asyncio
+class TestProfilingEndpoints:
+    """Test the profiling hook and debug endpoints."""
+
+    async def test_profile_on_header(self, async_client: AsyncClient, sample_order_data: dict):
+        """A request with the debug header is profiled and retrievable."""
+        profiles.clear()
+        await async_client.post("/orders", json=sample_order_data)
+        assert (await async_client.get("/debug/profiles")).json() == []
+
+        response = await async_client.get("/orders", headers={"X-Debug-Profile": "1"})
+        assert response.status_code == 200
+        profile_id = int(response.headers["x-profile-id"])
+
+        listing = (await async_client.get("/debug/profiles")).json()
+        assert [p["id"] for p in listing] == [profile_id]
+        assert listing[0]["route"] == "/orders"
+
+        detail = await async_client.get(f"/debug/profiles/{profile_id}")
+        assert detail.status_code == 200
+        assert {"components", "top", "samples"} <= detail.json().keys()
+
+        collapsed = await async_client.get(f"/debug/profiles/{profile_id}?format=collapsed")
+        assert collapsed.headers["content-type"].startswith("text/plain")
+
+    async def test_profile_not_found(self, async_client: AsyncClient):
+        """Unknown profile IDs return 404."""
+        response = await async_client.get("/debug/profiles/999999")
+        assert response.status_code == 404
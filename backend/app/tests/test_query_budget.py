@@ -0,0 +1,77 @@
+import pytest
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.observability.query_budget import QueryBudgetExceeded
+from app.repositories.order_repo import OrderRepository
+from app.schemas.order import OrderCreate, OrderQuery
+
+
+def test_every_api_route_has_a_budget():
+    """Routes backed by the database declare their statement budget."""
+    missing = [
+        f"{sorted(route.methods)} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.endpoint.__module__.startswith("app.api.routes.")
+        # Debug routes are diagnostics, not request paths worth budgeting
+        and not route.path.startswith("/debug")
+        and not hasattr(route.endpoint, "query_budget")
+    ]
+    assert missing == []
+
+
+class TestQueryBudgetRepository:
+    """Test statement budgets on repository calls."""
+
+    def test_bulk_create_is_not_n_plus_one(self, db: Session, max_queries, sample_order_data: dict):
+        """A batch of orders costs the same round trips as a batch of two."""
+        repo = OrderRepository(db)
+        repo.create(OrderCreate(**sample_order_data))  # risk warm-up
+        with max_queries(2):
+            repo.create_many([OrderCreate(**sample_order_data) for _ in range(25)])
+
+    def test_exceeding_lists_statements(self, db: Session, max_queries):
+        """An overrun reports every statement that ran."""
+        repo = OrderRepository(db)
+        with pytest.raises(QueryBudgetExceeded, match="2 statements executed, budget is 1") as exc:
+            with max_queries(1):
+                repo.list_and_count(OrderQuery())
+        assert "SELECT count" in str(exc.value)
+
+
+@pytest.mark.asyncio
+class TestQueryBudgetEndpoints:
+    """Test the per-request query count header and budget enforcement."""
+
+    async def test_debug_header(self, async_client: AsyncClient):
+        """The query count and budget are reported when asked for."""
+        response = await async_client.get("/orders", headers={"X-Debug-Query-Count": "1"})
+        assert response.headers["x-query-count"] == "2"
+        assert response.headers["x-query-budget"] == "2"
+
+        plain = await async_client.get("/orders")
+        assert "x-query-count" not in plain.headers
+
+    async def test_header_hidden_when_disabled(self, async_client: AsyncClient, monkeypatch):
+        """The header is a debug feature."""
+        monkeypatch.setenv("DEBUG_ENDPOINTS", "0")
+        response = await async_client.get("/orders", headers={"X-Debug-Query-Count": "1"})
+        assert "x-query-count" not in response.headers
+
+    async def test_overrun_is_reported(self, async_client: AsyncClient, monkeypatch, query_budget_violations):
+        """A request over its route's budget is counted and fails the test suite."""
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/orders" and "GET" in r.methods)
+        monkeypatch.setattr(route.endpoint, "query_budget", 1)
+        labels = {"method": "GET", "route": "/orders"}
+        before = REGISTRY.get_sample_value("http_request_query_budget_exceeded_total", labels) or 0
+
+        await async_client.get("/orders")
+
+        assert REGISTRY.get_sample_value("http_request_query_budget_exceeded_total", labels) == before + 1
+        assert len(query_budget_violations) == 1
+        assert "GET /orders: 2 statements, budget 1" in query_budget_violations[0]
+        query_budget_violations.clear()
@@ -0,0 +1,135 @@
+import io
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.marketdata.bars import BarArrays
+from app.marketdata.ingest import BarIngestor, iter_csv
+from app.marketdata.resample import resample
+from app.models.symbol import Symbol
+
+
+def minutes(*stamps: str) -> BarArrays:
+    """One minute bar per UTC timestamp; close is the bar's position, volume 1."""
+    ts = np.array(stamps, dtype="datetime64[s]")
+    close = np.arange(len(ts), dtype=np.float64)
+    return BarArrays(ts, close, close + 0.5, close - 0.5, close, np.ones(len(ts)))
+
+
+class TestResample:
+    """Test session-aware minute bar resampling."""
+
+    def test_five_minute_buckets(self):
+        # 2026-10-16 is a Friday; the session opens 13:30 UTC (EDT)
+        bars = resample(minutes("2026-10-16T13:30", "2026-10-16T13:31", "2026-10-16T13:34", "2026-10-16T13:35"), "5m")
+        assert bars.ts.astype(str).tolist() == ["2026-10-16T13:30:00", "2026-10-16T13:35:00"]
+        assert bars.open.tolist() == [0.0, 3.0]
+        assert bars.high.tolist() == [2.5, 3.5]
+        assert bars.low.tolist() == [-0.5, 2.5]
+        assert bars.close.tolist() == [2.0, 3.0]
+        assert bars.volume.tolist() == [3.0, 1.0]
+
+    def test_drops_extended_hours_and_anchors_at_open(self):
+        bars = resample(
+            minutes("2026-10-16T12:00", "2026-10-16T13:30", "2026-10-16T14:29", "2026-10-16T14:30",
+                    "2026-10-16T19:59", "2026-10-16T20:00"),
+            "1h",
+        )
+        assert bars.ts.astype(str).tolist() == [
+            "2026-10-16T13:30:00", "2026-10-16T14:30:00", "2026-10-16T19:30:00",
+        ]
+        assert bars.volume.tolist() == [2.0, 1.0, 1.0]
+
+    def test_daily_follows_dst(self):
+        """Sessions are in exchange time: the UTC open moves an hour across DST."""
+        bars = resample(
+            minutes("2026-10-30T13:30", "2026-10-30T19:59", "2026-11-02T14:30", "2026-11-02T20:59"), "1d",
+        )
+        assert bars.ts.astype(str).tolist() == ["2026-10-30T13:30:00", "2026-11-02T14:30:00"]
+        assert bars.open.tolist() == [0.0, 2.0]
+        assert bars.close.tolist() == [1.0, 3.0]
+
+    def test_follows_trading_calendar(self):
+        """Holidays are dropped and an early close ends the last bucket."""
+        bars = resample(
+            minutes("2026-11-26T15:00", "2026-11-27T17:35", "2026-11-27T17:59", "2026-11-27T18:00"), "1h",
+        )
+        # Thanksgiving is closed; the day after closes 13:00 ET
+        assert bars.ts.astype(str).tolist() == ["2026-11-27T17:30:00"]
+        assert bars.volume.tolist() == [2.0]
+
+    def test_weekend_and_empty(self):
+        assert len(resample(minutes("2026-10-17T14:00"), "5m")) == 0
+        assert len(resample(BarArrays.empty(), "1d")) == 0
+        with pytest.raises(ValueError, match="Unsupported timeframe"):
+            resample(BarArrays.empty(), "2m")
+
+
+@pytest.mark.asyncio
+class TestSymbolBarsEndpoint:
+    """Test GET /symbols/{id}/bars."""
+
+    @staticmethod
+    def ingest(db: Session, rows: str):
+        BarIngestor(db, "1m", "test").ingest(iter_csv(io.StringIO("symbol,ts,open,high,low,close,volume\n" + rows)))
+
+    WINDOW = {"start": "2026-10-16T00:00:00Z", "end": "2026-10-17T00:00:00Z"}
+
+    async def test_resampled_series(self, async_client: AsyncClient, db: Session):
+        symbol = Symbol(symbol="AAPL")
+        db.add(symbol)
+        db.commit()
+        self.ingest(db, "AAPL,2026-10-16T13:30:00Z,10,11,9,10.5,100\nAAPL,2026-10-16T13:31:00Z,10.5,12,10,11,50\n")
+
+        response = await async_client.get(f"/symbols/{symbol.id}/bars", params={"tf": "5m", **self.WINDOW})
+        assert response.status_code == 200
+        assert response.json() == {
+            "symbol_id": symbol.id, "timeframe": "5m", "ts": ["2026-10-16T13:30:00Z"],
+            "open": [10.0], "high": [12.0], "low": [9.0], "close": [11.0], "volume": [150.0],
+        }
+
+        # Cached until new bars for the symbol are ingested
+        self.ingest(db, "AAPL,2026-10-16T13:32:00Z,11,13,11,12,25\n")
+        response = await async_client.get(f"/symbols/{symbol.id}/bars", params={"tf": "5m", **self.WINDOW})
+        assert response.json()["high"] == [13.0]
+        assert response.json()["volume"] == [175.0]
+
+    async def test_window_and_raw_minutes(self, async_client: AsyncClient, db: Session):
+        symbol = Symbol(symbol="AAPL")
+        db.add(symbol)
+        db.commit()
+        self.ingest(db, "AAPL,2026-10-16T12:00:00Z,1,1,1,1,1\nAAPL,2026-10-16T13:30:00Z,2,2,2,2,2\n")
+
+        response = await async_client.get(f"/symbols/{symbol.id}/bars", params=self.WINDOW)
+        assert response.json()["close"] == [1.0, 2.0]
+        start = datetime(2026, 10, 16, 13, tzinfo=timezone.utc).isoformat()
+        response = await async_client.get(
+            f"/symbols/{symbol.id}/bars", params={"tf": "1m", "start": start, "end": self.WINDOW["end"]},
+        )
+        assert response.json()["close"] == [2.0]
+
+    async def test_range_is_required_and_bounded(self, async_client: AsyncClient, db: Session):
+        """A missing, inverted or too long range is rejected before any bars are read."""
+        symbol = Symbol(symbol="AAPL")
+        db.add(symbol)
+        db.commit()
+        url = f"/symbols/{symbol.id}/bars"
+
+        assert (await async_client.get(url, params={"start": self.WINDOW["start"]})).status_code == 422
+        inverted = {"start": self.WINDOW["end"], "end": self.WINDOW["start"]}
+        assert (await async_client.get(url, params=inverted)).status_code == 422
+        week = {"start": "2026-10-12T00:00:00Z", "end": "2026-10-19T00:00:00Z"}
+        response = await async_client.get(url, params={"tf": "1m", **week})
+        assert response.status_code == 422
+        assert "5000 1m bars" in response.json()["detail"]
+        assert (await async_client.get(url, params={"tf": "5m", **week})).status_code == 200
+
+    async def test_unknown_symbol_and_timeframe(self, async_client: AsyncClient, db: Session):
+        assert (await async_client.get("/symbols/999/bars", params=self.WINDOW)).status_code == 404
+        symbol = Symbol(symbol="AAPL")
+        db.add(symbol)
+        db.commit()
+        assert (await async_client.get(f"/symbols/{symbol.id}/bars", params={"tf": "2m", **self.WINDOW})).status_code == 422
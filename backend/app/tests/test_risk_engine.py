@@ -0,0 +1,219 @@
+import time
+import uuid
+import pytest
+from decimal import Decimal
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.models.order import OrderStatus, OrderType
+from app.repositories.order_repo import OrderRepository
+from app.schemas.order import OrderCreate, OrderFill, OrderUpdate
+from app.services.risk_engine import RiskEngine, RiskLimits, RiskCheckError, risk_engine
+
+
+def make_order(account_id, symbol_id, side="buy", quantity="10", price="100", **kwargs) -> OrderCreate:
+    return OrderCreate(
+        symbol_id=symbol_id,
+        account_id=account_id,
+        side=side,
+        type=OrderType.limit,
+        quantity=Decimal(quantity),
+        price=Decimal(price),
+        paper=True,
+        **kwargs,
+    )
+
+
+class TestRiskEngine:
+    """Test pre-trade checks through the order repository."""
+
+    def test_order_notional_limit(self, db: Session):
+        """Orders above the per-order notional cap are rejected."""
+        repo = OrderRepository(db, risk=RiskEngine(RiskLimits(max_order_notional=Decimal("5000"))))
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        repo.create(make_order(account_id, symbol_id, quantity="50", price="100"))
+        with pytest.raises(RiskCheckError, match="order notional"):
+            repo.create(make_order(account_id, symbol_id, quantity="51", price="100"))
+
+    def test_open_notional_released_on_cancel(self, db: Session):
+        """Open notional accumulates across orders and is released by cancel."""
+        engine = RiskEngine(RiskLimits(max_open_notional_per_account=Decimal("10000")))
+        repo = OrderRepository(db, risk=engine)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        first = repo.create(make_order(account_id, symbol_id, quantity="60"))
+        with pytest.raises(RiskCheckError, match="open notional"):
+            repo.create(make_order(account_id, symbol_id, quantity="50"))
+
+        repo.cancel(first)
+        assert engine.snapshot(account_id)["open_notional"] == 0
+        repo.create(make_order(account_id, symbol_id, quantity="50"))
+
+    def test_position_limit_allows_reducing(self, db: Session):
+        """Position caps block growth but never block de-risking."""
+        engine = RiskEngine(RiskLimits(max_position_qty=Decimal("100")))
+        repo = OrderRepository(db, risk=engine)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        order = repo.create(make_order(account_id, symbol_id, quantity="100"))
+        repo.record_fill(order, OrderFill(quantity=Decimal("100"), price=Decimal("100")))
+        assert engine.snapshot(account_id)["positions"][symbol_id] == Decimal("100")
+
+        with pytest.raises(RiskCheckError, match="projected position"):
+            repo.create(make_order(account_id, symbol_id, quantity="1"))
+        repo.create(make_order(account_id, symbol_id, side="sell", quantity="40"))
+
+    def test_daily_loss_limit(self, db: Session):
+        """After the daily loss limit is hit only reducing orders are accepted."""
+        engine = RiskEngine(RiskLimits(max_daily_loss=Decimal("500")))
+        repo = OrderRepository(db, risk=engine)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        buy = repo.create(make_order(account_id, symbol_id, quantity="100", price="100"))
+        repo.record_fill(buy, OrderFill(quantity=Decimal("100"), price=Decimal("100")))
+        sell = repo.create(make_order(account_id, symbol_id, side="sell", quantity="60", price="90"))
+        repo.record_fill(sell, OrderFill(quantity=Decimal("60"), price=Decimal("90")))
+        assert engine.snapshot(account_id)["daily_pnl"] == Decimal("-600")
+
+        with pytest.raises(RiskCheckError, match="daily loss"):
+            repo.create(make_order(account_id, symbol_id, quantity="1"))
+        repo.create(make_order(account_id, symbol_id, side="sell", quantity="40", price="90"))
+
+    def test_reject_rate_halts_flow(self, db: Session):
+        """Too many rejects in the window halt all new orders."""
+        engine = RiskEngine(RiskLimits(
+            max_order_notional=Decimal("1000"),
+            max_reject_rate=0.5,
+            reject_min_samples=4,
+        ))
+        repo = OrderRepository(db, risk=engine)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        repo.create(make_order(account_id, symbol_id, quantity="1"))
+        for _ in range(3):
+            with pytest.raises(RiskCheckError, match="order notional"):
+                repo.create(make_order(account_id, symbol_id, quantity="100"))
+        with pytest.raises(RiskCheckError, match="reject rate"):
+            repo.create(make_order(account_id, symbol_id, quantity="1"))
+
+    def test_warm_from_database(self, db: Session):
+        """A fresh engine rebuilds positions and open notional from stored orders."""
+        repo = OrderRepository(db, risk=RiskEngine())
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        filled = repo.create(make_order(account_id, symbol_id, quantity="30"))
+        repo.record_fill(filled, OrderFill(quantity=Decimal("30"), price=Decimal("100")))
+        repo.create(make_order(account_id, symbol_id, quantity="20", price="50"))
+
+        engine = RiskEngine()
+        engine.warm(db)
+        snap = engine.snapshot(account_id)
+        assert snap["positions"][symbol_id] == Decimal("30")
+        assert snap["open_notional"] == Decimal("1000")
+
+    def test_warm_restores_daily_pnl(self, db: Session):
+        """Today's realized PnL is replayed from today's fills on top of stored positions."""
+        repo = OrderRepository(db, risk=RiskEngine())
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        buy = repo.create(make_order(account_id, symbol_id, quantity="100", price="100"))
+        repo.record_fill(buy, OrderFill(quantity=Decimal("100"), price=Decimal("100")))
+        sell = repo.create(make_order(account_id, symbol_id, side="sell", quantity="60", price="90"))
+        repo.record_fill(sell, OrderFill(quantity=Decimal("60"), price=Decimal("90")))
+
+        engine = RiskEngine()
+        engine.warm(db)
+        snap = engine.snapshot(account_id)
+        assert snap["positions"][symbol_id] == Decimal("40")
+        assert snap["daily_pnl"] == Decimal("-600")
+
+    def test_reprice_rechecks_limits(self, db: Session):
+        """Changing a working order's price re-runs the checks and moves its reservation."""
+        engine = RiskEngine(RiskLimits(
+            max_order_notional=Decimal("1000"),
+            max_open_notional_per_account=Decimal("1000"),
+        ))
+        repo = OrderRepository(db, risk=engine)
+        account_id, symbol_id = uuid.uuid4(), uuid.uuid4()
+
+        order = repo.create(make_order(account_id, symbol_id, quantity="10", price="1"))
+        with pytest.raises(RiskCheckError, match="order notional"):
+            repo.update(order, OrderUpdate(price=Decimal("1000000")))
+        assert engine.snapshot(account_id)["open_notional"] == Decimal("10")
+
+        repo.update(order, OrderUpdate(price=Decimal("50")))
+        assert engine.snapshot(account_id)["open_notional"] == Decimal("500")
+
+    def test_notional_fill_completes_despite_rounding(self, db: Session):
+        """A notional order filled by a rounded unit quantity is marked filled."""
+        repo = OrderRepository(db, risk=RiskEngine())
+        order = repo.create(OrderCreate(
+            symbol_id=uuid.uuid4(), side="buy", type=OrderType.market,
+            quantity=Decimal("100"), quantity_type="notional", paper=True,
+        ))
+        filled = repo.record_fill(order, OrderFill(quantity=Decimal("0.3333333333"), price=Decimal("300")))
+        assert filled.status == OrderStatus.filled
+
+    def test_check_is_fast(self, db: Session):
+        """Checks run against memory only."""
+        engine = RiskEngine(RiskLimits(
+            max_order_notional=Decimal("1000000"),
+            max_open_notional_per_account=Decimal("1000000000"),
+            max_position_qty=Decimal("1000000000"),
+        ))
+        engine.warm(db)
+        payload = make_order(uuid.uuid4(), uuid.uuid4(), quantity="1")
+
+        n = 2000
+        start = time.perf_counter()
+        for _ in range(n):
+            engine.release(engine.check(payload))
+        assert (time.perf_counter() - start) / n < 0.001
+
+
+@pytest.mark.asyncio
+class TestRiskEndpoints:
+    """Test risk checks through the order endpoints."""
+
+    async def test_bulk_create_is_atomic(
+        self, async_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """A risk reject inside a batch creates none of its orders."""
+        monkeypatch.setattr(risk_engine, "limits", RiskLimits(max_open_notional_per_account=Decimal("10000")))
+        account_id, symbol_id = str(uuid.uuid4()), str(uuid.uuid4())
+        order = {
+            "symbol_id": symbol_id,
+            "account_id": account_id,
+            "side": "buy",
+            "type": "limit",
+            "quantity": "40",
+            "price": "100",
+        }
+
+        response = await async_client.post("/orders/bulk", json=[order, order, order])
+        assert response.status_code == 409
+        assert "open notional" in response.json()["detail"]
+        assert (await async_client.get("/orders")).json()["total"] == 0
+
+        response = await async_client.post("/orders/bulk", json=[order, order])
+        assert response.status_code == 201
+        assert len(response.json()) == 2
+
+    async def test_fill_endpoint(
+        self, async_client: AsyncClient, sample_order_data: dict
+    ):
+        """Fills update quantity, average price and status."""
+        order_id = (await async_client.post("/orders", json=sample_order_data)).json()["id"]
+
+        response = await async_client.post(f"/orders/{order_id}/fills", json={"quantity": "40", "price": "150"})
+        assert response.status_code == 200
+        assert response.json()["status"] == OrderStatus.partially_filled.value
+
+        response = await async_client.post(f"/orders/{order_id}/fills", json={"quantity": "60", "price": "151"})
+        data = response.json()
+        assert data["status"] == OrderStatus.filled.value
+        assert Decimal(data["average_fill_price"]) == Decimal("150.6")
+
+        response = await async_client.post(f"/orders/{order_id}/fills", json={"quantity": "1", "price": "151"})
+        assert response.status_code == 409
@@ -0,0 +1,75 @@
+import pytest
+from httpx import AsyncClient
+
+from app.observability.slow_queries import explain_sql, normalize_sql, parameter_shape, slow_query_log
+
+
+@pytest.fixture
+def record_all():
+    """Record every statement, explaining synchronously on flush."""
+    slow_query_log.configure(threshold_ms=0, background=False)
+    slow_query_log.clear()
+    yield slow_query_log
+    slow_query_log.configure(threshold_ms=None)
+    slow_query_log.flush()
+    slow_query_log.clear()
+
+
+def test_normalize_sql():
+    """Literals and bind lists collapse so equivalent statements group."""
+    sql = "SELECT *\n  FROM orders WHERE side = 'buy' AND id IN (?, ?, ?) LIMIT 50 OFFSET :offset_1"
+    assert normalize_sql(sql) == "SELECT * FROM orders WHERE side = ? AND id IN (?, ...) LIMIT ? OFFSET ?"
+
+
+def test_explain_sql_analyzes_only_read_only_selects():
+    """Locking and writing statements are planned without being executed."""
+    assert explain_sql("SELECT * FROM orders", "postgresql").startswith("EXPLAIN (ANALYZE, BUFFERS) ")
+    assert explain_sql("SELECT * FROM positions WHERE id = 1 FOR UPDATE", "postgresql") == (
+        "EXPLAIN SELECT * FROM positions WHERE id = 1 FOR UPDATE"
+    )
+    assert explain_sql("select 1 for no key update", "postgresql").startswith("EXPLAIN select")
+    assert explain_sql("SELECT * INTO copy FROM orders", "postgresql").startswith("EXPLAIN SELECT")
+    assert explain_sql("UPDATE orders SET status = 'new'", "postgresql").startswith("EXPLAIN UPDATE")
+    assert explain_sql("SELECT 1", "sqlite") == "EXPLAIN QUERY PLAN SELECT 1"
+
+
+def test_parameter_shape():
+    """Only parameter types are kept."""
+    assert parameter_shape(("buy", 50), False) == ["str", "int"]
+    assert parameter_shape({"side": "buy"}, False) == {"side": "str"}
+    assert parameter_shape([("a",), ("b",)], True) == {"rows": 2, "row": ["str"]}
+
+
+@pytest.mark.asyncio
+class TestSlowQueryEndpoints:
+    """Test the slow-query debug endpoint."""
+
+    async def test_records_plan(self, async_client: AsyncClient, sample_order_data: dict, record_all):
+        """Slow list queries are captured with normalized SQL and a plan."""
+        await async_client.post("/orders", json=sample_order_data)
+        response = await async_client.get("/orders?order_by=quantity&side=buy")
+        assert response.status_code == 200
+
+        response = await async_client.get("/debug/slow-queries?flush=true")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["threshold_ms"] == 0
+        page_queries = [
+            q for q in payload["queries"]
+            if q["statement"].startswith("SELECT orders.id") and "ORDER BY orders.quantity" in q["statement"]
+        ]
+        assert page_queries
+        query = page_queries[0]
+        assert "?" in query["statement"]
+        assert query["parameters"]
+        assert query["plan"] and any("orders" in line for line in query["plan"])
+
+        response = await async_client.delete("/debug/slow-queries")
+        assert response.status_code == 204
+        assert (await async_client.get("/debug/slow-queries")).json()["queries"] == []
+
+    async def test_hidden_when_disabled(self, async_client: AsyncClient, monkeypatch):
+        """Debug routes 404 unless enabled."""
+        monkeypatch.setenv("DEBUG_ENDPOINTS", "0")
+        response = await async_client.get("/debug/slow-queries")
+        assert response.status_code == 404
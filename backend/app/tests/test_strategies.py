@@ -71,6 +71,48 @@ class TestStrategyEndpoints:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    async def test_get_strategy_conditional(
+        self, async_client: AsyncClient, sample_strategy_data: dict
+    ):
+        """Test ETag and Last-Modified revalidation on a single strategy."""
+        create_response = await async_client.post("/strategies", json=sample_strategy_data)
+        strategy_id = create_response.json()["id"]
+        
+        response = await async_client.get(f"/strategies/{strategy_id}")
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        
+        response = await async_client.get(f"/strategies/{strategy_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        
+        response = await async_client.get(f"/strategies/{strategy_id}", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+        
+        response = await async_client.get(f"/strategies/{strategy_id}", headers={"If-None-Match": 'W/"stale"'})
+        assert response.status_code == 200
+
+    async def test_list_strategies_conditional(
+        self, async_client: AsyncClient, sample_strategy_data: dict
+    ):
+        """Test that the list ETag holds until the filtered set changes."""
+        await async_client.post("/strategies", json=sample_strategy_data)
+        
+        response = await async_client.get("/strategies?is_active=true")
+        etag = response.headers["etag"]
+        
+        response = await async_client.get("/strategies?is_active=true", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        
+        # Different query parameters get a different ETag
+        response = await async_client.get("/strategies?is_active=true&limit=10", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        
+        await async_client.post("/strategies", json={"name": "Mean Reversion"})
+        response = await async_client.get("/strategies?is_active=true", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
     async def test_list_strategies_empty(self, async_client: AsyncClient):
         """Test listing strategies when none exist."""
         response = await async_client.get("/strategies")
@@ -218,6 +218,37 @@ class TestSymbolEndpoints:
         result_symbols = [item["symbol"] for item in data["items"]]
         assert result_symbols == sorted(symbols, reverse=True)
 
+    async def test_batch_get_symbols(self, async_client: AsyncClient):
+        """Test batch get preserves request order and reports missing ids."""
+        ids = []
+        for ticker in ("AAPL", "MSFT", "GOOG"):
+            response = await async_client.post("/symbols", json={"symbol": ticker})
+            ids.append(response.json()["id"])
+        
+        response = await async_client.get(f"/symbols/batch?ids={ids[2]},{ids[0]},9999&ids={ids[1]}")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["symbol"] for item in data["items"]] == ["GOOG", "AAPL", "MSFT"]
+        assert data["missing"] == [9999]
+
+    async def test_batch_get_symbols_post(
+        self, async_client: AsyncClient, sample_symbol_data: dict
+    ):
+        """Test the POST form of batch get."""
+        create_response = await async_client.post("/symbols", json=sample_symbol_data)
+        symbol_id = create_response.json()["id"]
+        
+        response = await async_client.post("/symbols/batch", json={"ids": [symbol_id, symbol_id]})
+        
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 1
+
+    async def test_batch_get_symbols_invalid_id(self, async_client: AsyncClient):
+        """Test that non-integer ids are rejected."""
+        response = await async_client.get("/symbols/batch?ids=1,abc")
+        assert response.status_code == 422
+
     async def test_update_symbol_success(
         self, async_client: AsyncClient, sample_symbol_data: dict
     ):
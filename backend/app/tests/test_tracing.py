@@ -0,0 +1,53 @@
+import pytest
+from httpx import AsyncClient
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app.observability.sql import statement_name
+from app.observability.tracing import configure_tracing, disable_tracing, traced
+
+
+@pytest.fixture
+def spans():
+    """Trace into memory for the duration of a test."""
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter, batch=False)
+    yield exporter
+    disable_tracing()
+
+
+def test_statement_name():
+    """Statement names keep the verb and first table only."""
+    assert statement_name("SELECT orders.id FROM orders WHERE orders.id = ?") == "SELECT orders"
+    assert statement_name('INSERT INTO "positions" (qty) VALUES (?)') == "INSERT positions"
+    assert statement_name("UPDATE symbols SET active=?") == "UPDATE symbols"
+    assert statement_name("COMMIT") == "COMMIT"
+
+
+def test_disabled_by_default():
+    """Without a configured exporter spans are not created at all."""
+    with traced("noop") as span:
+        assert span is None
+
+
+@pytest.mark.asyncio
+class TestTracing:
+    """Test the route -> repository -> SQL span tree."""
+
+    async def test_span_tree(self, async_client: AsyncClient, sample_order_data: dict, spans: InMemorySpanExporter):
+        """A request span parents the repository span, which parents the SQL spans."""
+        order_id = (await async_client.post("/orders", json=sample_order_data)).json()["id"]
+        spans.clear()
+
+        response = await async_client.get(f"/orders/{order_id}")
+        assert response.status_code == 200
+
+        by_name = {span.name: span for span in spans.get_finished_spans()}
+        root = by_name["GET /orders/{order_id}"]
+        repo = by_name["OrderRepository.get"]
+        sql = by_name["SELECT orders"]
+        assert root.parent is None
+        assert root.attributes["http.status_code"] == 200
+        assert repo.parent.span_id == root.context.span_id
+        assert sql.parent.span_id == repo.context.span_id
+        assert sql.context.trace_id == root.context.trace_id
+        assert sql.attributes["db.system"] == "sqlite"
@@ -0,0 +1,136 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from app.marketdata.universe import UniverseRules, build_universe, lookback_start, rank_universe
+from app.models.asset import Asset, AssetType
+from app.models.bar import Bar
+from app.models.symbol import Symbol
+from app.repositories.universe_repo import UniverseRepository
+
+AS_OF = date(2026, 10, 19)
+SESSIONS = [12, 13, 14, 15, 16]  # the five sessions before AS_OF
+
+
+@pytest.fixture
+def universe(db: Session) -> dict[str, int]:
+    """Four symbols: two liquid, one penny stock, one with a single bar."""
+    symbols = {ticker: Symbol(symbol=ticker) for ticker in ("AAPL", "MSFT", "PENNY", "NEW")}
+    db.add_all(symbols.values())
+    db.flush()
+    closes = {"AAPL": (200.0, 1e6), "MSFT": (400.0, 1e6), "PENNY": (1.0, 1e9), "NEW": (50.0, 1e8)}
+    for ticker, (close, volume) in closes.items():
+        days = SESSIONS[-1:] if ticker == "NEW" else SESSIONS
+        db.add_all(
+            Bar(symbol_id=symbols[ticker].id, timeframe="1d", ts=datetime(2026, 10, day, 13, 30, tzinfo=timezone.utc),
+                open=close, high=close, low=close, close=close, volume=volume, provider="test")
+            for day in days
+        )
+    # A bar on AS_OF itself is not known at selection time
+    db.add(Bar(symbol_id=symbols["AAPL"].id, timeframe="1d", ts=datetime(2026, 10, 19, 13, 30, tzinfo=timezone.utc),
+               open=1.0, high=1.0, low=1.0, close=1.0, volume=1.0, provider="test"))
+    db.add_all([
+        Asset(symbol="AAPL", name="Apple", exchange="NASDAQ", asset_type=AssetType.equity, is_active=False),
+        Asset(symbol="PENNY", name="Penny", exchange="NYSE", asset_type=AssetType.equity, is_active=True),
+        Asset(symbol="BTC-USD", name="Bitcoin", exchange="COINBASE", asset_type=AssetType.crypto, is_active=True),
+    ])
+    db.commit()
+    return {ticker: s.id for ticker, s in symbols.items()}
+
+
+RULES = UniverseRules(top_n=10, lookback_days=5)
+
+
+class TestRankUniverse:
+    """Test the vectorized ranking over grouped daily bars."""
+
+    def test_filters_and_order(self):
+        ids = np.array([1, 1, 2, 2, 3, 3, 4])
+        close = np.array([10.0, 12.0, 50.0, 50.0, 2.0, 2.0, 100.0])
+        volume = np.array([1e6, 1e6, 1e5, 3e5, 1e9, 1e9, 1e9])
+        selection = rank_universe(ids, close, volume, 2, UniverseRules(min_coverage=1.0))
+        # 3 is below min_price, 4 lacks coverage; 1 trades 11M/day, 2 trades 10M/day
+        assert selection.symbol_ids.tolist() == [1, 2]
+        assert selection.adv.tolist() == [11e6, 10e6]
+        assert selection.price.tolist() == [12.0, 50.0]
+
+    def test_top_n_breaks_ties_by_id(self):
+        ids = np.array([5, 7, 9])
+        ones = np.ones(3) * 10
+        assert rank_universe(ids, ones, ones, 1, UniverseRules(top_n=2)).symbol_ids.tolist() == [5, 7]
+
+    def test_empty(self):
+        empty = np.empty(0)
+        assert len(rank_universe(empty.astype(np.int64), empty, empty, 5, RULES)) == 0
+
+    def test_lookback_counts_sessions(self):
+        assert lookback_start(AS_OF, 5) == (date(2026, 10, 12), 5)
+        assert lookback_start(date(1990, 1, 2), 5) == (date(1990, 1, 2), 0)
+
+
+class TestBuildUniverse:
+    """Test snapshots, versioning and bulk activation."""
+
+    def test_versions_and_activation(self, db: Session, universe):
+        snapshot, selection = build_universe(db, "default", AS_OF, RULES)
+        assert snapshot.version == 1
+        assert selection.symbol_ids.tolist() == [universe["MSFT"], universe["AAPL"]]
+        assert db.get(Symbol, universe["PENNY"]).active  # not activated yet
+
+        repo = UniverseRepository(db)
+        assert [m[2] for m in repo.members(snapshot.id)] == ["MSFT", "AAPL"]
+
+        second, _ = build_universe(db, "default", AS_OF, UniverseRules(top_n=1, lookback_days=5), activate=True)
+        assert second.version == 2
+        db.expire_all()
+        active = {s.symbol: s.active for s in db.query(Symbol)}
+        assert active == {"AAPL": False, "MSFT": True, "PENNY": False, "NEW": False}
+        assets = {a.symbol: a.is_active for a in db.query(Asset)}
+        assert assets == {"AAPL": False, "PENNY": False, "BTC-USD": True}
+
+    def test_activation_is_one_statement_per_table(self, db: Session, universe, max_queries):
+        snapshot_id = build_universe(db, "default", AS_OF, RULES)[0].id
+        repo = UniverseRepository(db)
+        with max_queries(2):
+            assert repo.activate(snapshot_id) == (2, 2)
+        # Unchanged flags are not rewritten
+        assert repo.activate(snapshot_id) == (0, 0)
+
+
+@pytest.mark.asyncio
+class TestUniverseEndpoints:
+    """Test the universe endpoints."""
+
+    async def test_build_read_and_roll_back(self, async_client: AsyncClient, universe):
+        response = await async_client.post(
+            "/universe/snapshots", json={"as_of": "2026-10-19", "lookback_days": 5, "top_n": 1, "activate": True},
+        )
+        assert response.status_code == 201
+        body = response.json()
+        assert (body["version"], body["top_n"]) == (1, 1)
+        assert body["members"] == [
+            {"rank": 1, "symbol_id": universe["MSFT"], "symbol": "MSFT", "adv": 4e8, "price": 400.0},
+        ]
+
+        response = await async_client.post(
+            "/universe/snapshots", json={"as_of": "2026-10-19", "lookback_days": 5, "activate": True},
+        )
+        assert [m["symbol"] for m in response.json()["members"]] == ["MSFT", "AAPL"]
+
+        response = await async_client.get("/universe/snapshots")
+        assert [s["version"] for s in response.json()] == [2, 1]
+
+        response = await async_client.post("/universe/activate", params={"version": 1})
+        assert response.status_code == 200
+        response = await async_client.get("/symbols", params={"active": True})
+        assert [s["symbol"] for s in response.json()["items"]] == ["MSFT"]
+
+        response = await async_client.get("/universe", params={"version": 1})
+        assert [m["symbol"] for m in response.json()["members"]] == ["MSFT"]
+
+    async def test_missing_snapshot(self, async_client: AsyncClient):
+        assert (await async_client.get("/universe", params={"name": "nope"})).status_code == 404
+        assert (await async_client.post("/universe/activate", params={"name": "nope"})).status_code == 404
@@ -0,0 +1,324 @@
+"""
+Open-loop load generator for the API.
+
+Usage:
+    python -m benchmarks.load --scenario mixed --duration 30 --url http://localhost:8000
+    python -m benchmarks.load --scenario order_burst --database-url sqlite:///bench.db
+
+Each scenario is a set of request streams with a target arrival rate.
+Arrivals are scheduled on a fixed clock regardless of how fast earlier
+requests complete, and latency is measured from the scheduled time, so a
+stalled server shows up as latency rather than as a politely reduced
+request rate (no coordinated omission). Without --url the ASGI app is
+driven in-process against --database-url.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from benchmarks.run import percentile
+
+# A request function returns None when it has nothing to send for this arrival
+RequestFn = Callable[[httpx.AsyncClient, "LoadContext"], Awaitable[httpx.Response | None]]
+
+
+@dataclass
+class Stream:
+    """One request kind fired at `rate` requests per second."""
+    name: str
+    rate: float
+    request: RequestFn
+
+
+@dataclass
+class LoadContext:
+    """State shared by the streams of a run."""
+    rng: random.Random
+    symbol_ids: list[str]
+    created: deque[str] = field(default_factory=lambda: deque(maxlen=10_000))
+    etags: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class StreamStats:
+    latencies_ms: list[float] = field(default_factory=list)
+    statuses: Counter[int] = field(default_factory=Counter)
+    errors: int = 0
+    exceptions: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+
+    def report(self, duration: float) -> dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+        total = len(ordered) + self.exceptions + self.timeouts
+        return {
+            "requests": total,
+            "throughput_rps": round(len(ordered) / duration, 2) if duration else 0.0,
+            "error_rate": round((self.errors + self.exceptions + self.timeouts) / total, 4) if total else 0.0,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "p50_ms": round(percentile(ordered, 50), 3),
+            "p95_ms": round(percentile(ordered, 95), 3),
+            "p99_ms": round(percentile(ordered, 99), 3),
+            "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+
+async def _conditional_get(client: httpx.AsyncClient, ctx: LoadContext, url: str) -> httpx.Response:
+    headers = {"If-None-Match": ctx.etags[url]} if url in ctx.etags else {}
+    response = await client.get(url, headers=headers)
+    if "etag" in response.headers:
+        ctx.etags[url] = response.headers["etag"]
+    return response
+
+
+async def submit_order(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    response = await client.post("/orders", json={
+        "symbol_id": ctx.rng.choice(ctx.symbol_ids),
+        "side": ctx.rng.choice(("buy", "sell")),
+        "type": "limit",
+        "quantity": str(ctx.rng.randrange(1, 500)),
+        "price": f"{ctx.rng.uniform(10, 500):.2f}",
+    })
+    if response.status_code == 201:
+        ctx.created.append(response.json()["id"])
+    return response
+
+
+async def cancel_order(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response | None:
+    if not ctx.created:
+        return None
+    return await client.delete(f"/orders/{ctx.created.popleft()}")
+
+
+async def poll_orders(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await _conditional_get(client, ctx, "/orders?limit=50")
+
+
+async def poll_positions(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await _conditional_get(client, ctx, "/positions?limit=50")
+
+
+async def poll_strategies(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await _conditional_get(client, ctx, "/strategies?limit=50")
+
+
+async def page_symbols(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await client.get(f"/symbols?limit=200&offset={ctx.rng.randrange(0, 2000, 200)}")
+
+
+async def page_assets(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await client.get(f"/assets?limit=200&offset={ctx.rng.randrange(0, 2000, 200)}")
+
+
+async def batch_symbols(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    ids = ",".join(str(ctx.rng.randrange(1, 5000)) for _ in range(100))
+    return await client.get(f"/symbols/batch?ids={ids}")
+
+
+SCENARIOS: dict[str, list[Stream]] = {
+    "order_burst": [
+        Stream("POST /orders", 500, submit_order),
+        Stream("DELETE /orders/{order_id}", 50, cancel_order),
+    ],
+    "dashboard_polling": [
+        Stream("GET /orders", 100, poll_orders),
+        Stream("GET /positions", 50, poll_positions),
+        Stream("GET /strategies", 20, poll_strategies),
+    ],
+    "universe_refresh": [
+        Stream("GET /symbols", 20, page_symbols),
+        Stream("GET /assets", 20, page_assets),
+        Stream("GET /symbols/batch", 10, batch_symbols),
+    ],
+}
+# NFR-3: order submissions alongside dashboard reads
+SCENARIOS["mixed"] = SCENARIOS["order_burst"] + SCENARIOS["dashboard_polling"]
+
+
+class LoadGenerator:
+    """Drive the streams of a scenario at their target rates for a fixed duration."""
+
+    def __init__(self, client: httpx.AsyncClient, streams: list[Stream], ctx: LoadContext,
+                 rate_scale: float = 1.0, max_in_flight: int = 2000, poisson: bool = False):
+        self.client = client
+        self.streams = streams
+        self.ctx = ctx
+        self.rate_scale = rate_scale
+        self.poisson = poisson
+        self.stats = {s.name: StreamStats() for s in streams}
+        self.dropped = Counter()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def _fire(self, stream: Stream, scheduled: float) -> None:
+        stats = self.stats[stream.name]
+        try:
+            response = await stream.request(self.client, self.ctx)
+        except asyncio.CancelledError:
+            stats.timeouts += 1
+            raise
+        except Exception:
+            stats.exceptions += 1
+            return
+        finally:
+            self._in_flight.release()
+        if response is None:
+            stats.skipped += 1
+            return
+        stats.latencies_ms.append((time.perf_counter() - scheduled) * 1000)
+        stats.statuses[response.status_code] += 1
+        if response.status_code >= 400:
+            stats.errors += 1
+
+    async def _drive(self, stream: Stream, start: float, duration: float) -> None:
+        rate = stream.rate * self.rate_scale
+        if rate <= 0:
+            return
+        scheduled = start
+        while True:
+            scheduled += self.ctx.rng.expovariate(rate) if self.poisson else 1 / rate
+            if scheduled - start >= duration:
+                return
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Shed instead of queueing unboundedly when the target is far behind
+            if self._in_flight.locked():
+                self.dropped[stream.name] += 1
+                continue
+            await self._in_flight.acquire()
+            task = asyncio.create_task(self._fire(stream, scheduled))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def run(self, duration: float, drain_timeout: float = 10.0) -> dict[str, Any]:
+        """Generate load for `duration` seconds, then wait up to `drain_timeout` for stragglers."""
+        start = time.perf_counter()
+        await asyncio.gather(*(self._drive(s, start, duration) for s in self.streams))
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=drain_timeout)
+            # Requests still queued behind an overloaded server count as timeouts
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        elapsed = time.perf_counter() - start
+        return {
+            "duration_s": round(elapsed, 3),
+            "endpoints": {
+                s.name: {
+                    "target_rps": s.rate * self.rate_scale,
+                    "dropped": self.dropped[s.name],
+                    **self.stats[s.name].report(elapsed),
+                }
+                for s in self.streams
+            },
+        }
+
+
+async def run_scenario(
+    scenario: str,
+    duration: float,
+    url: str | None = None,
+    database_url: str = "sqlite:///bench.db",
+    rate_scale: float = 1.0,
+    poisson: bool = False,
+    drain_timeout: float = 10.0,
+    seed: int = 11,
+) -> dict[str, Any]:
+    """Run a named scenario against a URL, or in-process against a database."""
+    rng = random.Random(seed)
+    streams = SCENARIOS[scenario]
+    if url is not None:
+        async with httpx.AsyncClient(base_url=url, timeout=30) as client:
+            response = await client.get("/orders?limit=200&fields=symbol_id")
+            symbol_ids = sorted({o["symbol_id"] for o in response.json().get("items", [])}) or [
+                str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(10)
+            ]
+            ctx = LoadContext(rng, symbol_ids)
+            return await LoadGenerator(client, streams, ctx, rate_scale, poisson=poisson).run(duration, drain_timeout)
+
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+
+    from app.api.deps import get_db
+    from app.db import DB_MAX_OVERFLOW, DB_POOL_SIZE
+    from app.main import app
+    from benchmarks.seed import existing_dataset, seed as seed_db
+
+    # Sized like the app's own pool, which is what its admission limit assumes
+    pool_args = {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW}
+    if database_url.startswith("sqlite"):
+        engine = create_engine(
+            database_url, connect_args={"check_same_thread": False, "timeout": 30}, **pool_args,
+        )
+
+        # Rollback-journal SQLite lets one reader stall every writer; WAL at
+        # least lets reads proceed while writes serialize
+        @event.listens_for(engine, "connect")
+        def _sqlite_wal(dbapi_conn, connection_record):
+            dbapi_conn.execute("PRAGMA journal_mode=WAL")
+            dbapi_conn.execute("PRAGMA synchronous=NORMAL")
+    else:
+        engine = create_engine(database_url, **pool_args)
+    dataset = existing_dataset(engine) or seed_db(engine, orders=10_000, assets=2_000, symbols=5_000)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def load_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = load_db
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+            ctx = LoadContext(rng, [str(s) for s in dataset.symbol_ids])
+            return await LoadGenerator(client, streams, ctx, rate_scale, poisson=poisson).run(duration, drain_timeout)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Open-loop load generator")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--database-url", default="sqlite:///bench.db", help="Database for in-process runs")
+    parser.add_argument("--rate-scale", type=float, default=1.0, help="Multiply every stream's target rate")
+    parser.add_argument("--poisson", action="store_true", help="Exponential inter-arrival times")
+    parser.add_argument("--drain-timeout", type=float, default=10.0, help="Seconds to wait for in-flight requests")
+    parser.add_argument("--json", help="Write the report to this path")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_scenario(
+        args.scenario, args.duration, url=args.url, database_url=args.database_url,
+        rate_scale=args.rate_scale, poisson=args.poisson, drain_timeout=args.drain_timeout,
+    ))
+
+    print(f"{'endpoint':<28}{'target':>8}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'err %':>7}{'drop':>6}{'t/o':>6}{'skip':>6}")
+    for name, r in report["endpoints"].items():
+        print(f"{name:<28}{r['target_rps']:>8.0f}{r['throughput_rps']:>9.1f}{r['p50_ms']:>9.2f}"
+              f"{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['error_rate'] * 100:>7.2f}{r['dropped']:>6}{r['timeouts']:>6}{r['skipped']:>6}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
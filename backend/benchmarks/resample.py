@@ -0,0 +1,62 @@
+"""
+Time minute-bar resampling for a synthetic universe.
+
+Usage:
+    python -m benchmarks.resample --symbols 200 --days 252
+
+Builds one year of regular-session minute bars per symbol (generated one
+symbol at a time to bound memory) and resamples each into every coarser
+timeframe, printing the total and per-symbol time per timeframe.
+"""
+from __future__ import annotations
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+
+from app.marketdata.bars import BarArrays
+from app.marketdata.calendar import get_calendar
+from app.marketdata.resample import DEFAULT_EXCHANGE, TIMEFRAMES, resample
+
+
+def minute_index(days: int) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    sessions = get_calendar(DEFAULT_EXCHANGE).session_arrays(date(2025, 1, 1), date(2026, 12, 31))
+    opens, closes = (s[:days] for s in sessions)
+    minutes = np.concatenate([np.arange(o, c, 60) for o, c in zip(opens, closes)])
+    return minutes.astype("datetime64[s]"), sessions
+
+
+def synthetic(ts: np.ndarray, rng: np.random.Generator) -> BarArrays:
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(ts))))
+    spread = np.abs(rng.normal(0, 5e-4, len(ts))) * close
+    return BarArrays(ts, close, close + spread, close - spread, close, rng.integers(1, 10_000, len(ts)).astype(np.float64))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--days", type=int, default=252)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    ts, sessions = minute_index(args.days)
+    rng = np.random.default_rng(args.seed)
+    timeframes = [tf for tf in TIMEFRAMES if tf != "1m"]
+    elapsed = dict.fromkeys(timeframes, 0.0)
+    for _ in range(args.symbols):
+        bars = synthetic(ts, rng)
+        for tf in timeframes:
+            started = time.perf_counter()
+            resample(bars, tf, sessions)
+            elapsed[tf] += time.perf_counter() - started
+
+    print(f"{args.symbols} symbols x {len(ts)} minute bars")
+    for tf in timeframes:
+        print(f"  {tf:>4}: {elapsed[tf]:7.3f}s total  {elapsed[tf] / args.symbols * 1000:7.2f} ms/symbol")
+    print(f"  all : {sum(elapsed.values()):7.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
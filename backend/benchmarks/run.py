@@ -0,0 +1,245 @@
+"""
+Benchmark the order, asset and repository hot paths against a seeded database.
+
+Usage:
+    python -m benchmarks.run --database-url sqlite:///bench.db --orders 100000 --save baseline.json
+    python -m benchmarks.run --database-url sqlite:///bench.db --baseline baseline.json
+
+Seeds the database on first use, then times each case sequentially through
+the full ASGI stack (or the repository for `repo_*` cases) and prints
+latency percentiles and throughput. With --baseline, cases whose p50
+regressed by more than --tolerance are reported and the exit code is 1.
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.api.deps import get_db
+from app.coalesce import read_coalescer
+from app.main import app
+from app.models.order import Order, OrderStatus
+from app.repositories.order_repo import OrderRepository
+from app.schemas.order import OrderQuery
+from benchmarks.seed import Dataset, existing_dataset, seed
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(latencies_ms: list[float], elapsed: float, errors: int) -> dict[str, float]:
+    ordered = sorted(latencies_ms)
+    return {
+        "n": len(ordered),
+        "errors": errors,
+        "mean_ms": round(statistics.fmean(ordered), 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50), 4),
+        "p95_ms": round(percentile(ordered, 95), 4),
+        "p99_ms": round(percentile(ordered, 99), 4),
+        "max_ms": round(ordered[-1], 4) if ordered else 0.0,
+        "ops_per_sec": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def time_case(fn: Callable[[int], bool], iterations: int, warmup: int) -> dict[str, float]:
+    for i in range(warmup):
+        fn(i)
+    latencies, errors = [], 0
+    start = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        ok = fn(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        errors += 0 if ok else 1
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+def build_cases(client: TestClient, Session, dataset: Dataset, rng: random.Random) -> dict[str, Callable[[int], bool]]:
+    with Session() as db:
+        sample_ids = [str(i) for i in db.execute(select(Order.id).limit(1000)).scalars()]
+        open_ids = [
+            str(i) for i in db.execute(
+                select(Order.id).where(Order.status == OrderStatus.new).limit(5000)
+            ).scalars()
+        ]
+    sample_uuids = [UUID(i) for i in sample_ids]
+    deep_offset = max(dataset.orders - 200, 0)
+    cancel_ids = iter(open_ids)
+
+    def create(i: int) -> bool:
+        response = client.post("/orders", json={
+            "symbol_id": str(rng.choice(dataset.symbol_ids)),
+            "account_id": str(rng.choice(dataset.account_ids)),
+            "side": rng.choice(("buy", "sell")),
+            "type": "limit",
+            "quantity": str(rng.randrange(1, 1000)),
+            "price": "101.25",
+        })
+        return response.status_code == 201
+
+    def get(i: int) -> bool:
+        return client.get(f"/orders/{rng.choice(sample_ids)}").status_code == 200
+
+    def list_shallow(i: int) -> bool:
+        return client.get("/orders?limit=50").status_code == 200
+
+    def list_deep(i: int) -> bool:
+        offset = max(deep_offset - rng.randrange(1000), 0)
+        return client.get(f"/orders?limit=50&offset={offset}").status_code == 200
+
+    def search_orders(i: int) -> bool:
+        symbol_id = rng.choice(dataset.symbol_ids)
+        url = f"/orders?symbol_id={symbol_id}&status=new&side=buy&order_by=quantity"
+        return client.get(url).status_code == 200
+
+    def search_assets(i: int) -> bool:
+        return client.get(f"/assets?search={rng.choice('ABCDEFGH')}{rng.choice('ABCDEFGH')}").status_code == 200
+
+    def cancel(i: int) -> bool:
+        order_id = next(cancel_ids, None)
+        return order_id is not None and client.delete(f"/orders/{order_id}").status_code == 200
+
+    def repo_get(i: int) -> bool:
+        with Session() as db:
+            return OrderRepository(db).get(rng.choice(sample_uuids)) is not None
+
+    def repo_list_page(i: int) -> bool:
+        with Session() as db:
+            return bool(OrderRepository(db).list_page(OrderQuery(limit=50)))
+
+    return {
+        "create": create,
+        "get": get,
+        "list_shallow": list_shallow,
+        "list_deep": list_deep,
+        "search_orders": search_orders,
+        "search_assets": search_assets,
+        "cancel": cancel,
+        "repo_get": repo_get,
+        "repo_list_page": repo_list_page,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Cases whose p50 grew by more than `tolerance` relative to the baseline."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("p50_ms"):
+            continue
+        ratio = current["p50_ms"] / previous["p50_ms"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: p50 {previous['p50_ms']:.3f} -> {current['p50_ms']:.3f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def run(
+    database_url: str,
+    orders: int,
+    assets: int,
+    symbols: int,
+    iterations: int,
+    warmup: int = 10,
+    cases: list[str] | None = None,
+    reseed: bool = False,
+    coalesce_ttl_ms: float = 0.0,
+) -> dict[str, Any]:
+    engine = create_engine(database_url)
+    dataset = None if reseed else existing_dataset(engine)
+    if dataset is None:
+        dataset = seed(engine, orders, assets, symbols)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def bench_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # Identical reads would otherwise be answered from the coalescing cache
+    previous_ttl = read_coalescer.ttl
+    read_coalescer.ttl = coalesce_ttl_ms / 1000
+    app.dependency_overrides[get_db] = bench_db
+    rng = random.Random(7)
+    try:
+        with TestClient(app) as client:
+            available = build_cases(client, Session, dataset, rng)
+            selected = cases or list(available)
+            results = {name: time_case(available[name], iterations, warmup) for name in selected}
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        read_coalescer.ttl = previous_ttl
+        engine.dispose()
+
+    return {
+        "meta": {
+            "database": engine.dialect.name,
+            "orders": dataset.orders,
+            "assets": dataset.assets,
+            "symbols": dataset.symbols,
+            "iterations": iterations,
+            "python": platform.python_version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark API and repository hot paths")
+    parser.add_argument("--database-url", default="sqlite:///bench.db")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--assets", type=int, default=10_000)
+    parser.add_argument("--symbols", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--case", action="append", dest="cases", help="Run only these cases (repeatable)")
+    parser.add_argument("--reseed", action="store_true", help="Seed again even if the database has orders")
+    parser.add_argument("--coalesce-ttl-ms", type=float, default=0.0)
+    parser.add_argument("--save", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a saved results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 growth before flagging (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.database_url, args.orders, args.assets, args.symbols, args.iterations,
+        warmup=args.warmup, cases=args.cases, reseed=args.reseed, coalesce_ttl_ms=args.coalesce_ttl_ms,
+    )
+
+    print(f"{'case':<16}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'errors':>8}")
+    for name, r in report["results"].items():
+        print(f"{name:<16}{r['n']:>6}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}{r['ops_per_sec']:>10.1f}{r['errors']:>8}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(report["results"], baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
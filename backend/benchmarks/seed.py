@@ -0,0 +1,168 @@
+"""
+Seed a database with synthetic assets, symbols and orders for benchmarking.
+
+Usage: python -m benchmarks.seed --database-url sqlite:///bench.db --orders 1000000
+"""
+from __future__ import annotations
+import argparse
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from faker import Faker
+from sqlalchemy import Engine, create_engine, func, insert, select
+
+from app.db import Base
+from app.models.asset import Asset, AssetType
+from app.models.order import Order, OrderSide, OrderStatus, OrderType, TimeInForce
+from app.models.symbol import Symbol
+
+CHUNK = 10_000
+
+# Weighted like a live book: most orders are terminal, a minority still open
+STATUS_WEIGHTS = {
+    OrderStatus.filled: 55,
+    OrderStatus.canceled: 20,
+    OrderStatus.new: 12,
+    OrderStatus.partially_filled: 5,
+    OrderStatus.pending_broker: 3,
+    OrderStatus.rejected: 3,
+    OrderStatus.expired: 2,
+}
+EXCHANGES = ("NASDAQ", "NYSE", "ARCA", "BINANCE", "OANDA")
+
+
+@dataclass
+class Dataset:
+    """Identifiers the benchmark cases draw from."""
+    symbol_ids: list[uuid.UUID]
+    account_ids: list[uuid.UUID]
+    strategy_ids: list[uuid.UUID]
+    orders: int
+    assets: int
+    symbols: int
+
+
+def _ticker(i: int) -> str:
+    letters = []
+    n = i
+    for _ in range(4):
+        n, r = divmod(n, 26)
+        letters.append(chr(ord("A") + r))
+    return "".join(reversed(letters)) + (str(n) if n else "")
+
+
+def _chunks(total: int):
+    for start in range(0, total, CHUNK):
+        yield start, min(CHUNK, total - start)
+
+
+def seed(
+    engine: Engine,
+    orders: int = 100_000,
+    assets: int = 10_000,
+    symbols: int = 10_000,
+    order_symbols: int = 500,
+    seed: int = 42,
+) -> Dataset:
+    """
+    Create the schema and bulk-insert rows with Core executemany.
+
+    Faker supplies a pool of realistic names; row values are drawn from
+    `random` so 10^7 orders stay a matter of minutes, not hours.
+    """
+    rng = random.Random(seed)
+    fake = Faker()
+    Faker.seed(seed)
+    names = [fake.company() for _ in range(min(assets, 1000) or 1)]
+
+    Base.metadata.create_all(engine)
+    symbol_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(order_symbols)]
+    account_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(20)]
+    strategy_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(10)]
+    statuses = list(STATUS_WEIGHTS)
+    weights = list(STATUS_WEIGHTS.values())
+    now = datetime.now(timezone.utc)
+
+    with engine.begin() as conn:
+        for start, size in _chunks(assets):
+            conn.execute(insert(Asset), [
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128)),
+                    "symbol": _ticker(i),
+                    "name": names[i % len(names)],
+                    "exchange": EXCHANGES[i % len(EXCHANGES)],
+                    "asset_type": rng.choice(list(AssetType)),
+                    "currency": "USD",
+                    "is_active": rng.random() > 0.1,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(start, start + size)
+            ])
+        for start, size in _chunks(symbols):
+            conn.execute(insert(Symbol), [
+                {"symbol": _ticker(i), "name": names[i % len(names)], "active": rng.random() > 0.1}
+                for i in range(start, start + size)
+            ])
+        for start, size in _chunks(orders):
+            rows = []
+            for _ in range(size):
+                created = now - timedelta(seconds=rng.randrange(365 * 86400))
+                order_type = OrderType.limit if rng.random() < 0.6 else OrderType.market
+                rows.append({
+                    "id": uuid.UUID(int=rng.getrandbits(128)),
+                    "symbol_id": rng.choice(symbol_ids),
+                    "strategy_id": rng.choice(strategy_ids),
+                    "account_id": rng.choice(account_ids),
+                    "side": OrderSide.buy if rng.random() < 0.5 else OrderSide.sell,
+                    "type": order_type,
+                    "time_in_force": TimeInForce.day,
+                    "quantity": Decimal(rng.randrange(1, 1000)),
+                    "price": Decimal(rng.randrange(100, 50_000)) / 100 if order_type == OrderType.limit else None,
+                    "status": rng.choices(statuses, weights)[0],
+                    "filled_quantity": Decimal("0"),
+                    "paper": True,
+                    "created_at": created,
+                    "updated_at": created,
+                })
+            conn.execute(insert(Order), rows)
+
+    return Dataset(symbol_ids, account_ids, strategy_ids, orders, assets, symbols)
+
+
+def existing_dataset(engine: Engine) -> Dataset | None:
+    """Describe an already seeded database, or None if it is empty."""
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        orders = conn.execute(select(func.count()).select_from(Order)).scalar_one()
+        if not orders:
+            return None
+        return Dataset(
+            symbol_ids=list(conn.execute(select(Order.symbol_id).distinct().limit(500)).scalars()),
+            account_ids=list(conn.execute(select(Order.account_id).distinct().limit(20)).scalars()),
+            strategy_ids=list(conn.execute(select(Order.strategy_id).distinct().limit(10)).scalars()),
+            orders=orders,
+            assets=conn.execute(select(func.count()).select_from(Asset)).scalar_one(),
+            symbols=conn.execute(select(func.count()).select_from(Symbol)).scalar_one(),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite:///bench.db")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--assets", type=int, default=10_000)
+    parser.add_argument("--symbols", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    dataset = seed(engine, args.orders, args.assets, args.symbols, seed=args.seed)
+    print(f"Seeded {dataset.orders} orders, {dataset.assets} assets, {dataset.symbols} symbols")
+
+
+if __name__ == "__main__":
+    main()